@@ -2,10 +2,8 @@
 
 __version__ = "0.1.0"
 
-from ptp_tester.aws_manager import AWSManager
-from ptp_tester.ssh_manager import SSHManager
-from ptp_tester.ptp_configurator import PTPConfigurator
-from ptp_tester.test_orchestrator import TestOrchestrator
+import importlib
+
 from ptp_tester.models import (
     InstanceConfig,
     InstanceDetails,
@@ -25,3 +23,23 @@ __all__ = [
     'PTPStatus',
     'TestResult',
 ]
+
+# Components that pull in botocore or paramiko are imported on first access,
+# so importing a light submodule (e.g., ptp_tester.cli for --help or argument
+# errors) does not pay for them
+_LAZY_COMPONENTS = {
+    'AWSManager': 'ptp_tester.aws_manager',
+    'SSHManager': 'ptp_tester.ssh_manager',
+    'PTPConfigurator': 'ptp_tester.ptp_configurator',
+    'TestOrchestrator': 'ptp_tester.test_orchestrator',
+}
+
+
+def __getattr__(name):
+    """Import a heavy component the first time it is accessed."""
+    module_name = _LAZY_COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
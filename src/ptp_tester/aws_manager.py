@@ -1,16 +1,26 @@
 """AWS Manager component for EC2 instance operations."""
 
+import functools
+import json
 import logging
+import random
 import re
+import threading
 import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 
-import boto3
+# botocore.session and botocore.config are imported lazily in
+# _initialize_session: together they pull in the service loaders, credential
+# machinery and endpoint/HTTP stack, which would otherwise be paid on every
+# import of this module even when no AWS call is made. Only the exception
+# classes are needed at module scope (for except clauses).
 from botocore.exceptions import (
     BotoCoreError,
     ClientError,
     NoCredentialsError,
     PartialCredentialsError,
+    WaiterError,
 )
 
 from .models import InstanceConfig, InstanceDetails
@@ -18,6 +28,172 @@ from .models import InstanceConfig, InstanceDetails
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shared client configuration: a connection pool larger than any of our
+# thread pools (so concurrent terminations/probes never queue for a socket),
+# TCP keepalive, and adaptive retries, which back off with jitter and
+# rate-limit the client under throttling so callers need no retry loops
+BOTO_CLIENT_CONFIG_OPTIONS = dict(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _boto_client_config():
+    """Build the shared botocore Config from BOTO_CLIENT_CONFIG_OPTIONS, once."""
+    from botocore.config import Config
+    return Config(**BOTO_CLIENT_CONFIG_OPTIONS)
+
+# AWS subnet ID format, checked before spending API calls on a lookup
+_SUBNET_ID_RE = re.compile(r'^subnet-[0-9a-f]{8,17}$')
+
+# How long a resolved "latest AL2023" AMI ID is reused before re-querying SSM
+AMI_CACHE_TTL_SECONDS = 3600
+
+# How long get_instance_details reuses a describe result for the same instance
+INSTANCE_DETAILS_TTL_SECONDS = 1.0
+
+# Graviton (ARM64) instance families
+_GRAVITON_FAMILIES = frozenset({
+    'c6gn', 'c7gn',  # Compute optimized with network
+    'c6g', 'c7g',    # Compute optimized
+    'm6g', 'm7g',    # General purpose
+    'r6g', 'r7g',    # Memory optimized
+    't4g',           # Burstable
+})
+
+# x86_64 instance families (explicitly mapped for clarity)
+_X86_64_FAMILIES = frozenset({
+    'c6i', 'c7i',    # Compute optimized Intel
+    'c6a', 'c7a',    # Compute optimized AMD
+    'm6i', 'm7i',    # General purpose Intel
+    'r6i', 'r7i',    # Memory optimized Intel
+    'c5n',           # Compute optimized with network (older gen)
+})
+
+_ARCH_BY_FAMILY = {
+    **{family: 'arm64' for family in _GRAVITON_FAMILIES},
+    **{family: 'x86_64' for family in _X86_64_FAMILIES},
+}
+
+def _poll_delays(initial: float = 1.0, cap: float = 15.0):
+    """Yield exponentially growing, jittered delays for state polling.
+    
+    Delays start at initial seconds and double on each poll up to cap, with
+    each value scaled by a random factor in [0.5, 1.0) so concurrent pollers
+    spread out instead of hitting the API in lockstep.
+    
+    Args:
+        initial: First (maximum) delay in seconds
+        cap: Upper bound for the delay in seconds
+        
+    Yields:
+        Delay in seconds before the next poll
+    """
+    delay = initial
+    while True:
+        yield min(cap, delay) * random.uniform(0.5, 1.0)
+        if delay < cap:
+            delay *= 2
+
+
+def _launch_key(config: InstanceConfig) -> tuple:
+    """Hashable key identifying configs that can share one run_instances call."""
+    return (
+        config.instance_type,
+        config.subnet_id,
+        config.key_name,
+        config.ami_id,
+        tuple(config.security_group_ids or ()),
+        config.placement_group,
+    )
+
+
+def _describe_all(client, operation_name: str, result_key: str, **kwargs) -> list:
+    """Collect every item of a Describe* call, following pagination.
+    
+    Uses the botocore paginator when the operation supports one, so that
+    results are never silently truncated; otherwise issues a single call.
+    
+    Args:
+        client: botocore client to call
+        operation_name: Client method name (e.g., 'describe_instances')
+        result_key: Response key holding the items (e.g., 'Reservations')
+        **kwargs: Parameters passed through to the API call
+        
+    Returns:
+        List of items from all response pages
+    """
+    if not client.can_paginate(operation_name):
+        return getattr(client, operation_name)(**kwargs).get(result_key, [])
+    
+    items = []
+    for page in client.get_paginator(operation_name).paginate(**kwargs):
+        items.extend(page.get(result_key, []))
+    return items
+
+
+# Instance IDs sent per DescribeInstances request
+_DESCRIBE_INSTANCES_BATCH = 100
+
+# Share of a wait timeout spent listening for SQS state-change events before
+# falling back to describe polling, and the cap on that share in seconds
+_STATE_EVENT_TIMEOUT_SHARE = 0.5
+_STATE_EVENT_MAX_WAIT_SECONDS = 120
+
+# Pause after a receive that returned only other waiters' events, so released
+# messages are not immediately pulled back by the same loop
+_FOREIGN_EVENT_PAUSE_SECONDS = 1.0
+
+
+def _state_event_budget(timeout: int) -> int:
+    """Return the part of a wait timeout to spend on SQS state-change events."""
+    return min(_STATE_EVENT_MAX_WAIT_SECONDS, int(timeout * _STATE_EVENT_TIMEOUT_SHARE))
+
+
+def _release_messages(sqs_client, queue_url: str, messages: list) -> None:
+    """Make received SQS messages visible again right away.
+    
+    Used for state-change events addressed to other waiters, so they do not
+    stay hidden for the queue's whole visibility timeout.
+    
+    Args:
+        sqs_client: SQS client to call
+        queue_url: URL of the queue the messages were received from
+        messages: Received messages (at most 10, one receive_message batch)
+    """
+    if not messages:
+        return
+    sqs_client.change_message_visibility_batch(
+        QueueUrl=queue_url,
+        Entries=[
+            {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle'], 'VisibilityTimeout': 0}
+            for index, message in enumerate(messages)
+        ]
+    )
+
+
+def _describe_instances(client, instance_ids: List[str]) -> list:
+    """Describe instances by ID, splitting long ID lists across requests.
+    
+    Args:
+        client: EC2 client to call
+        instance_ids: EC2 instance IDs to describe
+        
+    Returns:
+        List of reservations covering every requested instance
+    """
+    reservations = []
+    for offset in range(0, len(instance_ids), _DESCRIBE_INSTANCES_BATCH):
+        reservations.extend(_describe_all(
+            client, 'describe_instances', 'Reservations',
+            InstanceIds=instance_ids[offset:offset + _DESCRIBE_INSTANCES_BATCH]
+        ))
+    return reservations
+
 
 class AWSManager:
     """Manages AWS EC2 operations for PTP testing.
@@ -29,12 +205,20 @@ class AWSManager:
     - Security and audit logging
     """
 
-    def __init__(self, region: Optional[str] = None, profile: Optional[str] = None):
+    def __init__(
+        self,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+        state_queue_url: Optional[str] = None
+    ):
         """Initialize AWS Manager with credentials and region.
         
         Args:
             region: AWS region (optional, can be derived from subnet ID)
             profile: AWS profile name (optional, uses default credential chain if not provided)
+            state_queue_url: SQS queue URL receiving EventBridge "EC2 Instance
+                State-change Notification" events (optional). When set,
+                wait_for_running long-polls the queue instead of describe polling.
             
         Raises:
             NoCredentialsError: If AWS credentials cannot be found
@@ -43,31 +227,60 @@ class AWSManager:
         """
         self.profile = profile
         self.region = region
+        self._boto_config = None
         self._session = None
-        self._ec2_client = None
+        self._sts_client = None
+        self._default_ec2_client = None
+        self._regional_ec2_clients: Dict[str, object] = {}
+        self._client_lock = threading.Lock()
         self._ssm_client = None
+        self._sqs_client = None
+        self._state_queue_url = state_queue_url
+        self._caller_identity = None
+        self._subnet_region_cache: Dict[str, str] = {}
+        self._details_cache: Dict[str, Tuple[float, InstanceDetails]] = {}
+        self.account_id = None
+        self.user_id = None
+        self.arn = None
         
         # Initialize session and validate credentials
         self._initialize_session()
         self._validate_credentials()
         
     def _initialize_session(self):
-        """Initialize boto3 session with proper credential resolution.
+        """Initialize botocore session with proper credential resolution.
+        
+        Only low-level clients are used (no boto3 resources), so a plain
+        botocore session is sufficient and avoids boto3's resource model
+        loading on the startup path.
         
         Follows AWS SDK best practices:
         1. Use provided profile if specified
         2. Fall back to default credential chain (env vars, credentials file, IAM role)
         
         Never hardcodes credentials - relies on AWS SDK credential resolution.
+        
+        Every client is created from this one session, so they all share the
+        same resolved (and, for assumed roles/SSO, refreshable) credentials
+        object instead of each re-running the credential provider chain. Use
+        refresh_credentials() to deliberately start over with a new session.
         """
+        if self._session is not None:
+            return
+        
         try:
+            import botocore.session
+            
+            self._boto_config = _boto_client_config()
+            
             if self.profile:
                 logger.info(f"Initializing AWS session with profile: {self.profile}")
-                self._session = boto3.Session(profile_name=self.profile)
+                self._session = botocore.session.Session(profile=self.profile)
             else:
                 logger.info("Initializing AWS session with default credential chain")
-                self._session = boto3.Session()
+                self._session = botocore.session.Session()
                 
+            # Resolve credentials once; the session caches them for all clients.
             # Log credential source without exposing secrets
             credentials = self._session.get_credentials()
             if credentials:
@@ -78,42 +291,68 @@ class AWSManager:
                 # Log profile name if available
                 if self.profile:
                     logger.info(f"Using AWS profile: {self.profile}")
-                    
-                # Try to get role ARN if using assumed role (without exposing secrets)
-                try:
-                    sts_client = self._session.client('sts')
-                    caller_identity = sts_client.get_caller_identity()
-                    arn = caller_identity.get('Arn', 'Unknown')
-                    logger.info(f"AWS identity ARN: {arn}")
-                except Exception as e:
-                    logger.debug(f"Could not retrieve caller identity: {e}")
             else:
                 logger.warning("No credentials found in session")
                 
+            # Single STS client shared by identity lookup and validation
+            self._sts_client = self._session.create_client('sts', config=self._boto_config)
+            
+            # Clients bound to previous credentials must not be reused, and
+            # new credentials may see a different set of regions
+            self._default_ec2_client = None
+            self._regional_ec2_clients = {}
+            self._ssm_client = None
+            self._sqs_client = None
+            self.__dict__.pop('_all_regions', None)
+                
         except Exception as e:
             logger.error(f"Failed to initialize AWS session: {e}")
             raise
             
+    def refresh_credentials(self):
+        """Discard the current session and re-resolve AWS credentials.
+        
+        This is the only code path that creates a second session. All cached
+        clients, the region list and the cached caller identity are rebuilt.
+        
+        Raises:
+            NoCredentialsError: If AWS credentials cannot be found
+            PartialCredentialsError: If AWS credentials are incomplete
+            ClientError: If credential validation fails
+        """
+        logger.info("Refreshing AWS credentials")
+        self._session = None
+        self._caller_identity = None
+        self._initialize_session()
+        self._validate_credentials()
+            
     def _validate_credentials(self):
         """Validate AWS credentials before attempting operations.
         
-        Makes a simple STS call to verify credentials are valid and not expired.
+        Makes a single STS get_caller_identity call to verify credentials are
+        valid and not expired. The result is cached on the instance so the
+        identity (account, user, ARN) never has to be fetched twice.
         
         Raises:
             NoCredentialsError: If no credentials are configured
             PartialCredentialsError: If credentials are incomplete
             ClientError: If credentials are invalid or expired
         """
+        if self._caller_identity is not None:
+            return
+        
         try:
-            sts_client = self._session.client('sts')
-            response = sts_client.get_caller_identity()
+            response = self._sts_client.get_caller_identity()
             
-            account_id = response.get('Account', 'Unknown')
-            user_id = response.get('UserId', 'Unknown')
+            self._caller_identity = response
+            self.account_id = response.get('Account', 'Unknown')
+            self.user_id = response.get('UserId', 'Unknown')
+            self.arn = response.get('Arn', 'Unknown')
             
             logger.info(f"Credentials validated successfully")
-            logger.info(f"AWS Account ID: {account_id}")
-            logger.debug(f"User ID: {user_id}")
+            logger.info(f"AWS Account ID: {self.account_id}")
+            logger.info(f"AWS identity ARN: {self.arn}")
+            logger.debug(f"User ID: {self.user_id}")
             
         except NoCredentialsError:
             logger.error("No AWS credentials found. Please configure credentials.")
@@ -135,6 +374,10 @@ class AWSManager:
     def _get_region_from_subnet(self, subnet_id: str) -> str:
         """Extract region from subnet ID by querying AWS.
         
+        Results are memoized per subnet ID. If the subnet is not in the
+        session's default region, all other regions are probed in parallel
+        and the first region that knows the subnet wins.
+        
         Args:
             subnet_id: AWS subnet ID (e.g., subnet-12345678)
             
@@ -143,16 +386,24 @@ class AWSManager:
             
         Raises:
             ClientError: If subnet cannot be found or accessed
+            ValueError: If subnet ID is malformed or not found in any region
         """
+        cached_region = self._subnet_region_cache.get(subnet_id)
+        if cached_region:
+            return cached_region
+        
+        # A malformed ID can never match; fail before probing every region
+        if not _SUBNET_ID_RE.match(subnet_id):
+            raise ValueError(f"Invalid subnet ID format: {subnet_id}")
+        
         # Try each region until we find the subnet
         # This is necessary because subnet IDs don't encode region information
-        ec2_client = self._session.client('ec2')
+        ec2_client = self._get_default_ec2_client()
         
         try:
             # First, try to describe the subnet without specifying region
             # This will use the default region from the session
-            response = ec2_client.describe_subnets(SubnetIds=[subnet_id])
-            subnets = response.get('Subnets', [])
+            subnets = _describe_all(ec2_client, 'describe_subnets', 'Subnets', SubnetIds=[subnet_id])
             
             if subnets:
                 # Get the availability zone and extract region
@@ -162,6 +413,7 @@ class AWSManager:
                 
                 if region:
                     logger.info(f"Extracted region '{region}' from subnet {subnet_id}")
+                    self._subnet_region_cache[subnet_id] = region
                     return region
                     
         except ClientError as e:
@@ -171,23 +423,11 @@ class AWSManager:
             if error_code == 'InvalidSubnetID.NotFound':
                 logger.warning(f"Subnet {subnet_id} not found in default region, searching other regions...")
                 
-                # Get list of all regions
-                ec2_client = self._session.client('ec2')
-                regions_response = ec2_client.describe_regions()
-                regions = [r['RegionName'] for r in regions_response.get('Regions', [])]
-                
-                # Try each region
-                for region in regions:
-                    try:
-                        regional_client = self._session.client('ec2', region_name=region)
-                        response = regional_client.describe_subnets(SubnetIds=[subnet_id])
-                        subnets = response.get('Subnets', [])
-                        
-                        if subnets:
-                            logger.info(f"Found subnet {subnet_id} in region {region}")
-                            return region
-                    except ClientError:
-                        continue
+                region = self._probe_regions_for_subnet(subnet_id, self._all_regions)
+                if region:
+                    logger.info(f"Found subnet {subnet_id} in region {region}")
+                    self._subnet_region_cache[subnet_id] = region
+                    return region
                         
                 # If we get here, subnet wasn't found in any region
                 logger.error(f"Subnet {subnet_id} not found in any region")
@@ -199,6 +439,52 @@ class AWSManager:
         # Fallback: couldn't determine region
         raise ValueError(f"Could not determine region from subnet {subnet_id}")
         
+    @functools.cached_property
+    def _all_regions(self) -> list:
+        """List of all region names visible to the session, fetched once.
+        
+        Cleared by _initialize_session when credentials are re-resolved.
+        
+        Returns:
+            List of region names (e.g., ['us-east-1', 'eu-west-1', ...])
+        """
+        ec2_client = self._get_default_ec2_client()
+        return [r['RegionName'] for r in _describe_all(ec2_client, 'describe_regions', 'Regions')]
+        
+    def _probe_regions_for_subnet(self, subnet_id: str, regions: list) -> Optional[str]:
+        """Probe regions concurrently for a subnet, returning the first match.
+        
+        Args:
+            subnet_id: AWS subnet ID to look up
+            regions: Region names to probe
+            
+        Returns:
+            Region containing the subnet, or None if no region has it
+        """
+        if not regions:
+            return None
+        
+        def probe(region: str) -> Optional[str]:
+            try:
+                regional_client = self._regional_ec2(region)
+                if _describe_all(regional_client, 'describe_subnets', 'Subnets', SubnetIds=[subnet_id]):
+                    return region
+            except ClientError:
+                pass
+            return None
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(regions))) as executor:
+            futures = [executor.submit(probe, region) for region in regions]
+            for future in as_completed(futures):
+                region = future.result()
+                if region:
+                    # Stop any probes that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    return region
+        
+        return None
+        
     def _ensure_region(self, subnet_id: Optional[str] = None) -> str:
         """Ensure region is set, deriving from subnet if necessary.
         
@@ -219,38 +505,109 @@ class AWSManager:
             return self.region
             
         # Try to get default region from session
-        if self._session.region_name:
-            self.region = self._session.region_name
+        session_region = self._session.get_config_variable('region')
+        if session_region:
+            self.region = session_region
             logger.info(f"Using default region from session: {self.region}")
             return self.region
             
         raise ValueError("Region must be specified or derivable from subnet ID")
         
+    def _get_default_ec2_client(self):
+        """Get or create the EC2 client for the session's default region.
+        
+        Used before the manager's own region is known (subnet and region
+        lookups). Created once under _client_lock and reused afterwards.
+        
+        Returns:
+            botocore EC2 client
+        """
+        client = self._default_ec2_client
+        if client is None:
+            with self._client_lock:
+                client = self._default_ec2_client
+                if client is None:
+                    client = self._session.create_client('ec2', config=self._boto_config)
+                    self._default_ec2_client = client
+                    logger.debug("Created EC2 client for the session's default region")
+        return client
+        
     def _get_ec2_client(self):
         """Get or create EC2 client for the configured region.
         
         Returns:
-            boto3 EC2 client
+            botocore EC2 client
+        """
+        if not self.region:
+            raise ValueError("Region must be set before creating EC2 client")
+        return self._regional_ec2(self.region)
+        
+    def _regional_ec2(self, region: str):
+        """Get or create the cached EC2 client for a specific region.
+        
+        Clients are reused for the lifetime of the manager so each region pays
+        endpoint resolution and connection pool setup only once. Creation is
+        serialized because botocore sessions are not thread-safe.
+        
+        Args:
+            region: AWS region name
+            
+        Returns:
+            botocore EC2 client
         """
-        if not self._ec2_client or (self.region and self._ec2_client.meta.region_name != self.region):
-            if not self.region:
-                raise ValueError("Region must be set before creating EC2 client")
-            self._ec2_client = self._session.client('ec2', region_name=self.region)
-            logger.debug(f"Created EC2 client for region: {self.region}")
-        return self._ec2_client
+        client = self._regional_ec2_clients.get(region)
+        if client is None:
+            with self._client_lock:
+                client = self._regional_ec2_clients.get(region)
+                if client is None:
+                    client = self._session.create_client('ec2', region_name=region, config=self._boto_config)
+                    self._regional_ec2_clients[region] = client
+                    logger.debug(f"Created EC2 client for region: {region}")
+        return client
         
     def _get_ssm_client(self):
         """Get or create SSM client for the configured region.
         
         Returns:
-            boto3 SSM client
+            botocore SSM client
+        """
+        return self._regional_service_client('_ssm_client', 'ssm', 'SSM')
+        
+    def _get_sqs_client(self):
+        """Get or create SQS client for the configured region.
+        
+        Returns:
+            botocore SQS client
+        """
+        return self._regional_service_client('_sqs_client', 'sqs', 'SQS')
+        
+    def _regional_service_client(self, attr: str, service: str, label: str):
+        """Get or create the cached client stored in attr for the configured region.
+        
+        The cached client is replaced if the region has changed since it was
+        created. Creation uses the same double-checked _client_lock as
+        _regional_ec2, since concurrent instance tests share this manager.
+        
+        Args:
+            attr: Name of the instance attribute holding the cached client
+            service: botocore service name (e.g., 'ssm')
+            label: Service name used in messages (e.g., 'SSM')
+            
+        Returns:
+            botocore client for the service
         """
-        if not self._ssm_client or (self.region and self._ssm_client.meta.region_name != self.region):
-            if not self.region:
-                raise ValueError("Region must be set before creating SSM client")
-            self._ssm_client = self._session.client('ssm', region_name=self.region)
-            logger.debug(f"Created SSM client for region: {self.region}")
-        return self._ssm_client
+        client = getattr(self, attr)
+        if client and (not self.region or client.meta.region_name == self.region):
+            return client
+        if not self.region:
+            raise ValueError(f"Region must be set before creating {label} client")
+        with self._client_lock:
+            client = getattr(self, attr)
+            if not client or client.meta.region_name != self.region:
+                client = self._session.create_client(service, region_name=self.region, config=self._boto_config)
+                setattr(self, attr, client)
+                logger.debug(f"Created {label} client for region: {self.region}")
+        return client
 
     def _get_instance_type_architecture(self, instance_type: str) -> str:
         """Determine the CPU architecture for a given instance type.
@@ -266,37 +623,26 @@ class AWSManager:
             Architecture string: 'arm64' for Graviton, 'x86_64' for Intel/AMD
             Defaults to 'x86_64' for unknown instance types
         """
+        return self._arch_for(instance_type)
+        
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _arch_for(instance_type: str) -> str:
+        """Cached family-table lookup behind _get_instance_type_architecture.
+        
+        Args:
+            instance_type: EC2 instance type (e.g., 'c7gn.xlarge')
+            
+        Returns:
+            'arm64' or 'x86_64'
+        """
         # Extract instance family from instance type (e.g., 'c7gn' from 'c7gn.xlarge')
         # Instance type format: <family>.<size>
-        family = instance_type.split('.')[0] if '.' in instance_type else instance_type
-        
-        # Graviton (ARM64) instance families
-        graviton_families = {
-            'c6gn', 'c7gn',  # Compute optimized with network
-            'c6g', 'c7g',    # Compute optimized
-            'm6g', 'm7g',    # General purpose
-            'r6g', 'r7g',    # Memory optimized
-            't4g'            # Burstable
-        }
-        
-        # x86_64 instance families (explicitly mapped for clarity)
-        x86_64_families = {
-            'c6i', 'c7i',    # Compute optimized Intel
-            'c6a', 'c7a',    # Compute optimized AMD
-            'm6i', 'm7i',    # General purpose Intel
-            'r6i', 'r7i',    # Memory optimized Intel
-            'c5n'            # Compute optimized with network (older gen)
-        }
+        family = instance_type.partition('.')[0]
         
-        # Determine architecture
-        if family in graviton_families:
-            architecture = 'arm64'
-            logger.info(f"Instance type {instance_type} (family: {family}) mapped to architecture: {architecture}")
-        elif family in x86_64_families:
-            architecture = 'x86_64'
-            logger.info(f"Instance type {instance_type} (family: {family}) mapped to architecture: {architecture}")
-        else:
-            # Default to x86_64 for unknown instance types
+        architecture = _ARCH_BY_FAMILY.get(family)
+        if architecture is None:
+            # Default to x86_64 for unknown instance types (warned once per type)
             architecture = 'x86_64'
             logger.warning(
                 f"Instance type {instance_type} (family: {family}) not in known mappings, "
@@ -308,6 +654,9 @@ class AWSManager:
     def get_latest_al2023_ami(self, architecture: str = 'x86_64') -> str:
         """Query SSM Parameter Store for latest Amazon Linux 2023 AMI.
         
+        Results are cached per (region, architecture) for AMI_CACHE_TTL_SECONDS,
+        so launching many instances only queries SSM once.
+        
         Args:
             architecture: CPU architecture ('x86_64' or 'arm64'), defaults to 'x86_64'
             
@@ -318,12 +667,30 @@ class AWSManager:
             ClientError: If AMI cannot be retrieved
             ValueError: If architecture is not supported
         """
-        ssm_client = self._get_ssm_client()
-        
         # Validate architecture
         if architecture not in ['x86_64', 'arm64']:
             raise ValueError(f"Unsupported architecture: {architecture}. Must be 'x86_64' or 'arm64'")
         
+        ttl_bucket = int(time.monotonic() // AMI_CACHE_TTL_SECONDS)
+        return self._fetch_al2023_ami(self.region, architecture, ttl_bucket)
+        
+    @functools.lru_cache(maxsize=16)
+    def _fetch_al2023_ami(self, region: Optional[str], architecture: str, ttl_bucket: int) -> str:
+        """Fetch the latest AL2023 AMI ID from SSM (cached by get_latest_al2023_ami).
+        
+        Args:
+            region: Region the SSM client targets (part of the cache key)
+            architecture: CPU architecture ('x86_64' or 'arm64')
+            ttl_bucket: Time bucket used to expire cached entries
+            
+        Returns:
+            AMI ID string
+            
+        Raises:
+            ClientError: If AMI cannot be retrieved
+        """
+        ssm_client = self._get_ssm_client()
+        
         try:
             # Map architecture to SSM parameter name
             parameter_name = f'/aws/service/ami-amazon-linux-latest/al2023-ami-kernel-default-{architecture}'
@@ -351,6 +718,53 @@ class AWSManager:
         Returns:
             InstanceDetails with information about the launched instance
             
+        Raises:
+            ClientError: If instance launch fails
+            ValueError: If configuration is invalid
+        """
+        return self.launch_instances([config])[0]
+        
+    def launch_instances(self, configs: List[InstanceConfig]) -> List[InstanceDetails]:
+        """Launch several EC2 instances, batching identical configurations.
+        
+        Configurations that are identical are launched together with a single
+        run_instances call (MinCount = MaxCount = number of copies).
+        
+        Args:
+            configs: Instance configurations, one per instance to launch
+            
+        Returns:
+            InstanceDetails for each launched instance, in the order of configs
+            
+        Raises:
+            ClientError: If instance launch fails
+            ValueError: If configuration is invalid
+        """
+        groups: Dict[tuple, List[InstanceConfig]] = {}
+        for config in configs:
+            groups.setdefault(_launch_key(config), []).append(config)
+        
+        launched: Dict[tuple, List[InstanceDetails]] = {}
+        for key, group in groups.items():
+            launched[key] = self._launch_group(group[0], count=len(group))
+        
+        # Hand instances back in the same order as the requested configs
+        results = []
+        for config in configs:
+            results.append(launched[_launch_key(config)].pop(0))
+        
+        return results
+        
+    def _launch_group(self, config: InstanceConfig, count: int = 1) -> List[InstanceDetails]:
+        """Launch count identical instances with one run_instances call.
+        
+        Args:
+            config: Instance configuration shared by every instance
+            count: Number of instances to launch (default: 1)
+            
+        Returns:
+            List of InstanceDetails, one per launched instance
+            
         Raises:
             ClientError: If instance launch fails
             ValueError: If configuration is invalid
@@ -384,8 +798,8 @@ class AWSManager:
             'InstanceType': config.instance_type,
             'KeyName': config.key_name,
             'SubnetId': config.subnet_id,
-            'MinCount': 1,
-            'MaxCount': 1,
+            'MinCount': count,
+            'MaxCount': count,
             'MetadataOptions': {
                 # Enable IMDSv2 for enhanced security
                 'HttpTokens': 'required',
@@ -417,36 +831,42 @@ class AWSManager:
             logger.info(f"Instance will be launched into placement group: {pg_name}")
             
         try:
-            logger.info(f"Launching instance: type={config.instance_type}, subnet={config.subnet_id}, ami={ami_id}")
-            logger.info(f"Launch parameters: {launch_params}")
+            logger.info(
+                "Launching %d instance(s): type=%s, subnet=%s, ami=%s",
+                count, config.instance_type, config.subnet_id, ami_id
+            )
+            logger.debug("Launch parameters: %s", launch_params)
             
             response = ec2_client.run_instances(**launch_params)
             
-            instance = response['Instances'][0]
-            instance_id = instance['InstanceId']
-            
-            logger.info(f"Instance launched successfully: {instance_id}")
-            
-            # Extract placement group if present
-            placement_group = instance.get('Placement', {}).get('GroupName')
-            
-            # Extract instance details
-            instance_details = InstanceDetails(
-                instance_id=instance_id,
-                instance_type=instance['InstanceType'],
-                availability_zone=instance['Placement']['AvailabilityZone'],
-                subnet_id=instance['SubnetId'],
-                public_ip=instance.get('PublicIpAddress'),
-                private_ip=instance.get('PrivateIpAddress', ''),
-                state=instance['State']['Name'],
-                architecture=architecture,
-                placement_group=placement_group
-            )
-            
-            logger.info(f"Instance details: ID={instance_id}, Type={instance['InstanceType']}, "
-                       f"AZ={instance['Placement']['AvailabilityZone']}, Architecture={architecture}")
+            launched = []
+            for instance in response['Instances']:
+                instance_id = instance['InstanceId']
+                
+                logger.info(f"Instance launched successfully: {instance_id}")
+                
+                # Extract placement group if present
+                placement_group = instance.get('Placement', {}).get('GroupName')
+                
+                # Extract instance details
+                instance_details = InstanceDetails(
+                    instance_id=instance_id,
+                    instance_type=instance['InstanceType'],
+                    availability_zone=instance['Placement']['AvailabilityZone'],
+                    subnet_id=instance['SubnetId'],
+                    public_ip=instance.get('PublicIpAddress'),
+                    private_ip=instance.get('PrivateIpAddress', ''),
+                    state=instance['State']['Name'],
+                    architecture=architecture,
+                    placement_group=placement_group
+                )
+                
+                logger.info(f"Instance details: ID={instance_id}, Type={instance['InstanceType']}, "
+                           f"AZ={instance['Placement']['AvailabilityZone']}, Architecture={architecture}")
+                
+                launched.append(instance_details)
             
-            return instance_details
+            return launched
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -460,6 +880,9 @@ class AWSManager:
             elif error_code == 'InvalidKeyPair.NotFound':
                 raise ValueError(f"Key pair '{config.key_name}' not found in region {self.region}")
             elif error_code == 'InvalidAMIID.NotFound':
+                if not config.ami_id:
+                    # The cached "latest" AMI may have been deregistered
+                    self._fetch_al2023_ami.cache_clear()
                 raise ValueError(f"AMI {ami_id} not found in region {self.region}")
             elif error_code == 'InvalidGroup.NotFound':
                 raise ValueError(f"One or more security groups not found: {security_group_ids}")
@@ -490,67 +913,200 @@ class AWSManager:
         
         start_time = time.time()
         
-        while True:
-            elapsed = time.time() - start_time
+        # Prefer state-change events when a queue is configured. Listening is
+        # limited to part of the timeout, so if no event arrives (e.g., it fired
+        # before we listened) describe polling still gets the rest
+        if self._state_queue_url:
+            self._await_via_sqs(instance_id, _state_event_budget(timeout))
+        
+        # After a 'running' event the waiter normally returns on its first
+        # describe, but describe is eventually consistent and may still say
+        # 'pending', so it keeps the whole remaining budget either way
+        delay = 3
+        remaining = max(0, timeout - int(time.time() - start_time))
+        max_attempts = max(1, remaining // delay)
+        
+        # The EC2 waiter polls describe_instances itself and fails fast on
+        # terminal states (shutting-down, terminated, stopping)
+        waiter = ec2_client.get_waiter('instance_running')
+        
+        try:
+            waiter.wait(
+                InstanceIds=[instance_id],
+                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
+            )
+        except WaiterError as e:
+            last_response = e.last_response or {}
+            if 'Error' in last_response:
+                logger.error(f"Error checking instance state: {e}")
+                raise
             
-            if elapsed > timeout:
-                raise TimeoutError(
-                    f"Instance {instance_id} did not reach 'running' state within {timeout} seconds"
+            reservations = last_response.get('Reservations') or []
+            instances = reservations[0].get('Instances', []) if reservations else []
+            state = instances[0]['State']['Name'] if instances else None
+            
+            if state and state != 'pending':
+                raise RuntimeError(f"Instance {instance_id} is {state}")
+            
+            raise TimeoutError(
+                f"Instance {instance_id} did not reach 'running' state within {timeout} seconds"
+            )
+        
+        elapsed = time.time() - start_time
+        logger.info(f"Instance {instance_id} is now running (took {elapsed:.1f}s)")
+        
+        # One final describe to build the up-to-date instance details
+        instance_details = self.get_instance_details(instance_id)
+        
+        logger.info(f"Instance details: ID={instance_id}, Type={instance_details.instance_type}, "
+                   f"State={instance_details.state}, Architecture={instance_details.architecture}")
+        
+        return instance_details
+                
+    def _await_via_sqs(self, instance_id: str, timeout: int) -> bool:
+        """Block on EC2 state-change events from SQS until the instance runs.
+        
+        Expects EventBridge to deliver "EC2 Instance State-change Notification"
+        events straight to the queue at self._state_queue_url. Events for this
+        instance are deleted once seen; events for other instances are made
+        visible again right away for their own waiters.
+        
+        Args:
+            instance_id: EC2 instance ID
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if a 'running' event was received, False on timeout
+            
+        Raises:
+            RuntimeError: If an event reports a terminal state
+        """
+        sqs_client = self._get_sqs_client()
+        deadline = time.time() + timeout
+        
+        logger.info(f"Waiting for 'running' state-change event for {instance_id} via SQS")
+        
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logger.warning(
+                    f"No 'running' event for {instance_id} within {timeout}s, "
+                    f"falling back to describe polling"
                 )
+                return False
+            
+            response = sqs_client.receive_message(
+                QueueUrl=self._state_queue_url,
+                WaitTimeSeconds=min(20, max(1, int(remaining))),
+                MaxNumberOfMessages=10
+            )
+            
+            messages = response.get('Messages', [])
+            foreign = []
+            for message_index, message in enumerate(messages):
+                try:
+                    event = json.loads(message['Body'])
+                except (KeyError, ValueError):
+                    continue
                 
-            try:
-                response = ec2_client.describe_instances(InstanceIds=[instance_id])
+                detail = event.get('detail') or {}
+                if detail.get('instance-id') != instance_id:
+                    foreign.append(message)
+                    continue
                 
-                if not response['Reservations']:
-                    raise ValueError(f"Instance {instance_id} not found")
-                    
-                instance = response['Reservations'][0]['Instances'][0]
-                state = instance['State']['Name']
+                sqs_client.delete_message(
+                    QueueUrl=self._state_queue_url,
+                    ReceiptHandle=message['ReceiptHandle']
+                )
                 
-                logger.debug(f"Instance {instance_id} state: {state} (elapsed: {elapsed:.1f}s)")
+                state = detail.get('state')
+                logger.debug("State-change event for %s: %s", instance_id, state)
                 
-                if state == 'running':
-                    logger.info(f"Instance {instance_id} is now running (took {elapsed:.1f}s)")
-                    
-                    # Detect architecture from instance type
-                    instance_type = instance['InstanceType']
-                    architecture = self._get_instance_type_architecture(instance_type)
-                    
-                    # Extract placement group if present
-                    placement_group = instance.get('Placement', {}).get('GroupName')
-                    
-                    # Return updated instance details
-                    instance_details = InstanceDetails(
-                        instance_id=instance['InstanceId'],
-                        instance_type=instance_type,
-                        availability_zone=instance['Placement']['AvailabilityZone'],
-                        subnet_id=instance['SubnetId'],
-                        public_ip=instance.get('PublicIpAddress'),
-                        private_ip=instance.get('PrivateIpAddress', ''),
-                        state=state,
-                        architecture=architecture,
-                        placement_group=placement_group
-                    )
-                    
-                    logger.info(f"Instance details: ID={instance_id}, Type={instance_type}, "
-                               f"State={state}, Architecture={architecture}")
-                    
-                    return instance_details
-                elif state in ['terminated', 'terminating']:
-                    raise RuntimeError(f"Instance {instance_id} is {state}")
-                elif state in ['stopped', 'stopping']:
+                if state == 'running' or state in ['shutting-down', 'terminated', 'stopping', 'stopped']:
+                    # Hand back the unprocessed rest of the batch before leaving
+                    foreign.extend(messages[message_index + 1:])
+                    _release_messages(sqs_client, self._state_queue_url, foreign)
+                    if state == 'running':
+                        return True
                     raise RuntimeError(f"Instance {instance_id} is {state}")
-                    
-                # Wait before checking again
-                time.sleep(5)
+            
+            _release_messages(sqs_client, self._state_queue_url, foreign)
+            if foreign and len(foreign) == len(messages):
+                time.sleep(_FOREIGN_EVENT_PAUSE_SECONDS)
+    
+    def _await_terminated_via_sqs(self, instance_ids: List[str], timeout: int) -> List[str]:
+        """Block on EC2 state-change events from SQS until instances terminate.
+        
+        Uses the same EventBridge queue as _await_via_sqs. Events for other
+        instances are made visible again right away.
+        
+        Args:
+            instance_ids: EC2 instance IDs to wait for
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            IDs from instance_ids that have not reported 'terminated' yet
+            (empty if every instance terminated within the timeout)
+        """
+        sqs_client = self._get_sqs_client()
+        deadline = time.time() + timeout
+        pending = set(instance_ids)
+        
+        logger.info(f"Waiting for 'terminated' state-change events for {len(pending)} instance(s) via SQS")
+        
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logger.warning(
+                    f"No 'terminated' event for {', '.join(sorted(pending))} within {timeout}s, "
+                    f"falling back to describe polling"
+                )
+                break
+            
+            response = sqs_client.receive_message(
+                QueueUrl=self._state_queue_url,
+                WaitTimeSeconds=min(20, max(1, int(remaining))),
+                MaxNumberOfMessages=10
+            )
+            
+            messages = response.get('Messages', [])
+            foreign = []
+            for message in messages:
+                try:
+                    event = json.loads(message['Body'])
+                except (KeyError, ValueError):
+                    continue
                 
-            except ClientError as e:
-                logger.error(f"Error checking instance state: {e}")
-                raise
+                detail = event.get('detail') or {}
+                instance_id = detail.get('instance-id')
+                if instance_id not in pending:
+                    foreign.append(message)
+                    continue
+                
+                sqs_client.delete_message(
+                    QueueUrl=self._state_queue_url,
+                    ReceiptHandle=message['ReceiptHandle']
+                )
+                
+                state = detail.get('state')
+                logger.debug("State-change event for %s: %s", instance_id, state)
                 
+                if state == 'terminated':
+                    pending.discard(instance_id)
+            
+            _release_messages(sqs_client, self._state_queue_url, foreign)
+            if foreign and len(foreign) == len(messages):
+                time.sleep(_FOREIGN_EVENT_PAUSE_SECONDS)
+        
+        return [i for i in instance_ids if i in pending]
+    
     def get_instance_details(self, instance_id: str) -> InstanceDetails:
         """Get current details of an EC2 instance.
         
+        Back-to-back calls for the same instance within
+        INSTANCE_DETAILS_TTL_SECONDS reuse the previous result instead of
+        issuing another describe_instances request.
+        
         Args:
             instance_id: EC2 instance ID
             
@@ -561,44 +1117,154 @@ class AWSManager:
             ClientError: If instance query fails
             ValueError: If instance not found
         """
+        now = time.monotonic()
+        cached = self._details_cache.get(instance_id)
+        if cached and now - cached[0] < INSTANCE_DETAILS_TTL_SECONDS:
+            return cached[1]
+        
         ec2_client = self._get_ec2_client()
         
         try:
-            response = ec2_client.describe_instances(InstanceIds=[instance_id])
+            reservations = _describe_instances(ec2_client, [instance_id])
             
-            if not response['Reservations']:
+            if not reservations:
                 raise ValueError(f"Instance {instance_id} not found")
                 
-            instance = response['Reservations'][0]['Instances'][0]
-            
-            # Detect architecture from instance type
-            instance_type = instance['InstanceType']
-            architecture = self._get_instance_type_architecture(instance_type)
-            
-            # Extract placement group if present
-            placement_group = instance.get('Placement', {}).get('GroupName')
-            
-            instance_details = InstanceDetails(
-                instance_id=instance['InstanceId'],
-                instance_type=instance_type,
-                availability_zone=instance['Placement']['AvailabilityZone'],
-                subnet_id=instance['SubnetId'],
-                public_ip=instance.get('PublicIpAddress'),
-                private_ip=instance.get('PrivateIpAddress', ''),
-                state=instance['State']['Name'],
-                architecture=architecture,
-                placement_group=placement_group
+            # Keep only the extracted fields; drop the raw response right away
+            instance = reservations[0]['Instances'][0]
+            del reservations
+            instance_details = self._to_instance_details(instance)
+            del instance
+            self._details_cache[instance_id] = (now, instance_details)
+            
+            logger.debug(
+                "Retrieved instance details: ID=%s, Type=%s, Architecture=%s",
+                instance_details.instance_id, instance_details.instance_type, instance_details.architecture
             )
             
-            logger.debug(f"Retrieved instance details: ID={instance['InstanceId']}, "
-                        f"Type={instance_type}, Architecture={architecture}")
-            
             return instance_details
             
         except ClientError as e:
             logger.error(f"Failed to get instance details: {e}")
             raise
             
+    def invalidate_instance_details(self, instance_id: str) -> None:
+        """Drop any cached get_instance_details result for an instance.
+        
+        Args:
+            instance_id: EC2 instance ID
+        """
+        self._details_cache.pop(instance_id, None)
+            
+    def _to_instance_details(self, instance: dict) -> InstanceDetails:
+        """Build InstanceDetails from one describe_instances instance entry.
+        
+        Args:
+            instance: Instance dictionary from a describe_instances response
+            
+        Returns:
+            InstanceDetails with the fields used by the tester
+            
+        Only the handful of fields the tester uses are copied out, so callers
+        can release the (potentially large) describe response immediately.
+        """
+        # describe_instances reports the architecture authoritatively;
+        # the family table is only a fallback for responses without it
+        instance_type = instance['InstanceType']
+        architecture = instance.get('Architecture') or self._get_instance_type_architecture(instance_type)
+        
+        # Extract placement group if present
+        placement_group = instance.get('Placement', {}).get('GroupName')
+        
+        return InstanceDetails(
+            instance_id=instance['InstanceId'],
+            instance_type=instance_type,
+            availability_zone=instance['Placement']['AvailabilityZone'],
+            subnet_id=instance['SubnetId'],
+            public_ip=instance.get('PublicIpAddress'),
+            private_ip=instance.get('PrivateIpAddress', ''),
+            state=instance['State']['Name'],
+            architecture=architecture,
+            placement_group=placement_group
+        )
+        
+    def wait_for_all_running(
+        self,
+        instance_ids: List[str],
+        timeout: int = 300
+    ) -> List[InstanceDetails]:
+        """Wait for several instances to reach 'running' state.
+        
+        Each poll cycle issues ONE describe_instances call covering every
+        instance that is still pending, instead of one call per instance.
+        
+        Args:
+            instance_ids: EC2 instance IDs to wait for
+            timeout: Maximum time to wait in seconds (default: 300 = 5 minutes)
+            
+        Returns:
+            InstanceDetails for each instance, in the order of instance_ids
+            
+        Raises:
+            TimeoutError: If any instance doesn't reach running state within timeout
+            RuntimeError: If any instance enters a terminal state
+            ClientError: If instance query fails
+        """
+        ec2_client = self._get_ec2_client()
+        
+        logger.info(
+            f"Waiting for {len(instance_ids)} instance(s) to reach 'running' state (timeout: {timeout}s)"
+        )
+        
+        start_time = time.time()
+        pending_ids = list(dict.fromkeys(instance_ids))
+        running: Dict[str, InstanceDetails] = {}
+        delays = _poll_delays()
+        
+        while pending_ids:
+            elapsed = time.time() - start_time
+            
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Instances {', '.join(pending_ids)} did not reach 'running' state "
+                    f"within {timeout} seconds"
+                )
+            
+            try:
+                reservations = _describe_instances(ec2_client, pending_ids)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', '')
+                # Freshly launched IDs can briefly be unknown to describe_instances
+                if error_code != 'InvalidInstanceID.NotFound':
+                    logger.error(f"Error checking instance state: {e}")
+                    raise
+                reservations = []
+            
+            for reservation in reservations:
+                for instance in reservation.get('Instances', []):
+                    instance_id = instance['InstanceId']
+                    state = instance['State']['Name']
+                    
+                    logger.debug("Instance %s state: %s (elapsed: %.1fs)", instance_id, state, elapsed)
+                    
+                    if state == 'running':
+                        running[instance_id] = self._to_instance_details(instance)
+                        logger.info(f"Instance {instance_id} is now running (took {elapsed:.1f}s)")
+                    elif state in ['shutting-down', 'terminated', 'stopping', 'stopped']:
+                        raise RuntimeError(f"Instance {instance_id} is {state}")
+            
+            # Don't hold the raw batch response (or loop references into it)
+            # across the sleep below
+            reservations = reservation = instance = None
+            
+            pending_ids = [i for i in pending_ids if i not in running]
+            
+            if pending_ids:
+                # Wait before checking again
+                time.sleep(next(delays))
+        
+        return [running[instance_id] for instance_id in instance_ids]
+            
     def _resolve_placement_group_name(self, placement_group_identifier: str) -> str:
         """Resolve placement group ID to name if needed.
         
@@ -623,12 +1289,11 @@ class AWSManager:
         
         try:
             logger.info(f"Resolving placement group ID to name: {placement_group_identifier}")
-            response = ec2_client.describe_placement_groups(
+            placement_groups = _describe_all(
+                ec2_client, 'describe_placement_groups', 'PlacementGroups',
                 GroupIds=[placement_group_identifier]
             )
             
-            placement_groups = response.get('PlacementGroups', [])
-            
             if not placement_groups:
                 raise ValueError(
                     f"Placement group ID '{placement_group_identifier}' not found in region {self.region}"
@@ -664,17 +1329,17 @@ class AWSManager:
             # Check if input is a placement group ID (pg-xxxxx format)
             if placement_group_name.startswith('pg-'):
                 logger.info(f"Detected placement group ID format, searching by GroupId")
-                response = ec2_client.describe_placement_groups(
+                placement_groups = _describe_all(
+                    ec2_client, 'describe_placement_groups', 'PlacementGroups',
                     GroupIds=[placement_group_name]
                 )
             else:
                 logger.info(f"Using placement group name format")
-                response = ec2_client.describe_placement_groups(
+                placement_groups = _describe_all(
+                    ec2_client, 'describe_placement_groups', 'PlacementGroups',
                     GroupNames=[placement_group_name]
                 )
             
-            placement_groups = response.get('PlacementGroups', [])
-            
             if not placement_groups:
                 error_msg = f"Placement group '{placement_group_name}' not found in region {self.region}"
                 logger.error(error_msg)
@@ -701,15 +1366,16 @@ class AWSManager:
                 return (False, error_msg)
             
             # Log placement group details
-            logger.info(f"Placement group validation successful:")
-            logger.info(f"  Name: {pg_name}")
-            logger.info(f"  ID: {pg_id}")
-            logger.info(f"  Strategy: {strategy}")
-            logger.info(f"  State: {state}")
-            
-            if strategy == 'partition':
-                partition_count = pg.get('PartitionCount', 'N/A')
-                logger.info(f"  Partition Count: {partition_count}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Placement group validation successful:")
+                logger.info(f"  Name: {pg_name}")
+                logger.info(f"  ID: {pg_id}")
+                logger.info(f"  Strategy: {strategy}")
+                logger.info(f"  State: {state}")
+                
+                if strategy == 'partition':
+                    partition_count = pg.get('PartitionCount', 'N/A')
+                    logger.info(f"  Partition Count: {partition_count}")
             
             return (True, None)
             
@@ -726,6 +1392,80 @@ class AWSManager:
                 logger.error(error_msg)
                 return (False, error_msg)
     
+    def _wait_for_terminated(self, instance_ids: List[str], timeout: int = 120) -> bool:
+        """Wait for instances to reach 'terminated' state using the EC2 waiter.
+        
+        The waiter covers every instance with one describe_instances call per
+        attempt. An instance that is no longer known to EC2 counts as terminated.
+        When a state-change queue is configured, termination events are awaited
+        first so the call returns as soon as EC2 reports the transition.
+        
+        Args:
+            instance_ids: EC2 instance IDs to wait for
+            timeout: Maximum time to wait in seconds (default: 120)
+            
+        Returns:
+            True if all instances terminated, False on timeout or unexpected state
+            
+        Raises:
+            ClientError: If instance query fails
+        """
+        ec2_client = self._get_ec2_client()
+        
+        start_time = time.time()
+        
+        # Prefer state-change events when a queue is configured; the waiter
+        # below then only confirms (or picks up events we missed). Listening is
+        # limited to part of the timeout so polling keeps the real remainder
+        remaining_ids = list(instance_ids)
+        if self._state_queue_url:
+            remaining_ids = self._await_terminated_via_sqs(remaining_ids, _state_event_budget(timeout))
+            if not remaining_ids:
+                # Confirm every reported termination; describe may briefly
+                # still show 'shutting-down', hence the full remaining budget
+                remaining_ids = list(instance_ids)
+        
+        delay = 2
+        remaining = max(0, timeout - int(time.time() - start_time))
+        max_attempts = max(1, remaining // delay)
+        
+        waiter = ec2_client.get_waiter('instance_terminated')
+        
+        try:
+            waiter.wait(
+                InstanceIds=remaining_ids,
+                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
+            )
+        except WaiterError as e:
+            last_response = e.last_response or {}
+            error = last_response.get('Error', {})
+            
+            if error.get('Code') == 'InvalidInstanceID.NotFound':
+                # Instance not found - consider it terminated
+                logger.info(f"Instance(s) {', '.join(instance_ids)} no longer found - termination complete")
+                return True
+            if error:
+                logger.error(f"Error verifying termination: {e}")
+                raise ClientError(last_response, 'DescribeInstances')
+            
+            # The waiter fails fast if an instance goes to pending/stopping
+            for reservation in last_response.get('Reservations') or []:
+                for instance in reservation.get('Instances', []):
+                    state = instance['State']['Name']
+                    if state not in ('shutting-down', 'terminated'):
+                        logger.warning(f"Instance {instance['InstanceId']} in unexpected state: {state}")
+                        return False
+            
+            logger.warning(
+                f"Termination verification timed out after {timeout}s. "
+                f"Instance(s) {', '.join(instance_ids)} may still be terminating."
+            )
+            return False
+        
+        elapsed = time.time() - start_time
+        logger.info(f"Instance(s) {', '.join(instance_ids)} successfully terminated (took {elapsed:.1f}s)")
+        return True
+        
     def terminate_instance(self, instance_id: str, verify: bool = True) -> bool:
         """Terminate an EC2 instance.
         
@@ -745,6 +1485,7 @@ class AWSManager:
             logger.info(f"Terminating instance {instance_id}")
             
             response = ec2_client.terminate_instances(InstanceIds=[instance_id])
+            self.invalidate_instance_details(instance_id)
             
             current_state = response['TerminatingInstances'][0]['CurrentState']['Name']
             logger.info(f"Instance {instance_id} termination initiated, current state: {current_state}")
@@ -752,44 +1493,7 @@ class AWSManager:
             if verify:
                 # Wait for termination to complete (up to 2 minutes)
                 logger.info(f"Verifying termination of instance {instance_id}")
-                timeout = 120
-                start_time = time.time()
-                
-                while True:
-                    elapsed = time.time() - start_time
-                    
-                    if elapsed > timeout:
-                        logger.warning(
-                            f"Termination verification timed out after {timeout}s. "
-                            f"Instance {instance_id} may still be terminating."
-                        )
-                        return False
-                        
-                    try:
-                        details = self.get_instance_details(instance_id)
-                        state = details.state
-                        
-                        logger.debug(f"Instance {instance_id} state: {state}")
-                        
-                        if state == 'terminated':
-                            logger.info(f"Instance {instance_id} successfully terminated (took {elapsed:.1f}s)")
-                            return True
-                        elif state != 'terminating':
-                            logger.warning(f"Instance {instance_id} in unexpected state: {state}")
-                            return False
-                            
-                        time.sleep(5)
-                        
-                    except ValueError:
-                        # Instance not found - consider it terminated
-                        logger.info(f"Instance {instance_id} no longer found - termination complete")
-                        return True
-                    except ClientError as e:
-                        error_code = e.response.get('Error', {}).get('Code', '')
-                        if error_code == 'InvalidInstanceID.NotFound':
-                            logger.info(f"Instance {instance_id} no longer found - termination complete")
-                            return True
-                        raise
+                return self._wait_for_terminated([instance_id], timeout=120)
             else:
                 # Don't verify, just return True after initiating termination
                 return True
@@ -805,3 +1509,73 @@ class AWSManager:
                 return True
             else:
                 raise
+    
+    def terminate_instances(self, instance_ids: List[str], verify: bool = True) -> Dict[str, bool]:
+        """Terminate several EC2 instances with batched API calls.
+        
+        Issues one terminate_instances call (per 1000 IDs) and, when verifying,
+        one shared instance_terminated waiter instead of a call and verify loop
+        per instance.
+        
+        Args:
+            instance_ids: EC2 instance IDs to terminate
+            verify: Whether to verify termination completed (default: True)
+            
+        Returns:
+            Dictionary mapping each instance ID to True if termination
+            succeeded, False otherwise
+            
+        Raises:
+            ClientError: If the termination request fails
+        """
+        instance_ids = list(dict.fromkeys(instance_ids))
+        if not instance_ids:
+            return {}
+        
+        ec2_client = self._get_ec2_client()
+        results: Dict[str, bool] = {}
+        
+        # TerminateInstances accepts up to 1000 IDs per call
+        for offset in range(0, len(instance_ids), 1000):
+            batch = instance_ids[offset:offset + 1000]
+            logger.info(f"Terminating {len(batch)} instance(s): {', '.join(batch)}")
+            
+            try:
+                response = ec2_client.terminate_instances(InstanceIds=batch)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                if error_code != 'InvalidInstanceID.NotFound':
+                    logger.error(f"Failed to terminate instances: {e}")
+                    raise
+                # One unknown ID rejects the whole batch; fall back to
+                # per-instance calls, which treat "not found" as terminated
+                logger.warning("Batch termination hit an unknown instance ID, terminating individually")
+                with ThreadPoolExecutor(max_workers=min(10, len(batch))) as executor:
+                    futures = {
+                        executor.submit(self.terminate_instance, instance_id, verify): instance_id
+                        for instance_id in batch
+                    }
+                    for future in as_completed(futures):
+                        instance_id = futures[future]
+                        try:
+                            results[instance_id] = future.result()
+                        except ClientError as e:
+                            logger.error(f"Failed to terminate instance {instance_id}: {e}")
+                            results[instance_id] = False
+                continue
+            
+            initiated = [i['InstanceId'] for i in response.get('TerminatingInstances', [])]
+            for instance_id in initiated:
+                self.invalidate_instance_details(instance_id)
+            for instance_id in batch:
+                results[instance_id] = instance_id in initiated
+                if instance_id not in initiated:
+                    logger.warning(f"Instance {instance_id} missing from termination response")
+            
+            if verify and initiated:
+                logger.info(f"Verifying termination of {len(initiated)} instance(s)")
+                terminated = self._wait_for_terminated(initiated, timeout=120)
+                for instance_id in initiated:
+                    results[instance_id] = terminated
+        
+        return results
@@ -2,6 +2,7 @@
 
 import os
 import re
+import stat
 import sys
 from pathlib import Path
 from typing import List
@@ -9,6 +10,56 @@ from typing import List
 import click
 
 
+# Validator lookup tables are built once at import rather than on every
+# callback invocation (and every comma-separated instance type spec).
+
+# AWS instance type pattern: family.size (e.g., c7i.large, m7i.xlarge).
+# The family is matched by a small regex; the size is a set lookup, with
+# Nxlarge sizes checked by hand instead of through a regex alternation.
+_INSTANCE_FAMILY_RE = re.compile(r'[a-z][0-9][a-z]*')
+_INSTANCE_SIZES = frozenset({'nano', 'micro', 'small', 'medium', 'large', 'xlarge', 'metal'})
+
+# Resource IDs (subnet-, ami-, sg-) and regions are simple enough to check
+# with plain string operations
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+# Stop validating --instance-types after this many invalid specs
+_MAX_REPORTED_INVALID_SPECS = 5
+
+
+def _is_aws_id(value: str, prefix: str) -> bool:
+    """Return True if value is prefix followed by 8-17 lowercase hex digits."""
+    suffix = value[len(prefix):]
+    return value.startswith(prefix) and 8 <= len(suffix) <= 17 and _HEX_DIGITS.issuperset(suffix)
+
+
+def _is_lower_alpha(value: str) -> bool:
+    """Return True if value is non-empty and only ASCII lowercase letters."""
+    return value.isascii() and value.isalpha() and value.islower()
+
+
+def _is_valid_region(value: str) -> bool:
+    """Return True if value looks like region-direction-number (e.g., us-east-1)."""
+    parts = value.split('-')
+    return (
+        len(parts) == 3
+        and len(parts[0]) == 2 and _is_lower_alpha(parts[0])
+        and _is_lower_alpha(parts[1])
+        and len(parts[2]) == 1 and parts[2].isascii() and parts[2].isdigit()
+    )
+
+
+def _is_valid_instance_type(instance_type: str) -> bool:
+    """Return True if instance_type looks like family.size (e.g., c7i.2xlarge)."""
+    family, dot, size = instance_type.rpartition('.')
+    if not dot or not _INSTANCE_FAMILY_RE.fullmatch(family):
+        return False
+    if size in _INSTANCE_SIZES:
+        return True
+    multiplier = size[:-6]
+    return size.endswith('xlarge') and multiplier.isascii() and multiplier.isdigit()
+
+
 def validate_instance_types(ctx, param, value):
     """Validate instance type format with optional quantity and warn for large lists.
     
@@ -28,61 +79,53 @@ def validate_instance_types(ctx, param, value):
     if not instance_type_specs_raw:
         raise click.BadParameter("At least one instance type must be provided")
     
-    # AWS instance type pattern: family.size (e.g., c7i.large, m7i.xlarge)
-    instance_type_pattern = re.compile(r'^[a-z][0-9][a-z]*\.(nano|micro|small|medium|large|xlarge|[0-9]+xlarge|metal)$')
-    
     # Parse each spec into InstanceTypeSpec objects
     instance_type_specs = []
     invalid_specs = []
+    total_instances = 0
     
-    for spec_str in instance_type_specs_raw:
-        # Check if quantity is specified with colon notation
-        if ':' in spec_str:
-            parts = spec_str.split(':')
-            if len(parts) != 2:
-                invalid_specs.append(f"{spec_str} (invalid format)")
-                continue
-            
-            instance_type, quantity_str = parts
-            instance_type = instance_type.strip()
-            quantity_str = quantity_str.strip()
-            
-            # Validate instance type format
-            if not instance_type_pattern.match(instance_type):
-                invalid_specs.append(f"{instance_type} (invalid instance type)")
-                continue
-            
-            # Validate and parse quantity
+    for index, spec_str in enumerate(instance_type_specs_raw):
+        # Listing every bad spec in a long list isn't useful; stop early
+        if len(invalid_specs) >= _MAX_REPORTED_INVALID_SPECS:
+            invalid_specs.append(f"... ({len(instance_type_specs_raw) - index} more not checked)")
+            break
+        
+        # Quantity is optional, specified with colon notation (default: 1)
+        instance_type, sep, quantity_str = spec_str.partition(':')
+        instance_type = instance_type.strip()
+        
+        if sep and ':' in quantity_str:
+            invalid_specs.append(f"{spec_str} (invalid format)")
+            continue
+        
+        # Validate instance type format
+        if not _is_valid_instance_type(instance_type):
+            invalid_specs.append(f"{instance_type} (invalid instance type)")
+            continue
+        
+        # Validate and parse quantity
+        quantity = 1
+        if sep:
             try:
-                quantity = int(quantity_str)
-                if quantity < 1:
-                    invalid_specs.append(f"{spec_str} (quantity must be positive)")
-                    continue
+                quantity = int(quantity_str.strip())
             except ValueError:
                 invalid_specs.append(f"{spec_str} (quantity must be an integer)")
                 continue
-            
-            # Create InstanceTypeSpec
-            try:
-                spec = InstanceTypeSpec(instance_type=instance_type, quantity=quantity)
-                instance_type_specs.append(spec)
-            except ValueError as e:
-                invalid_specs.append(f"{spec_str} ({str(e)})")
-        else:
-            # No quantity specified, default to 1
-            instance_type = spec_str.strip()
-            
-            # Validate instance type format
-            if not instance_type_pattern.match(instance_type):
-                invalid_specs.append(f"{instance_type} (invalid instance type)")
+            if quantity < 1:
+                invalid_specs.append(f"{spec_str} (quantity must be positive)")
                 continue
-            
-            # Create InstanceTypeSpec with default quantity of 1
-            try:
-                spec = InstanceTypeSpec(instance_type=instance_type, quantity=1)
-                instance_type_specs.append(spec)
-            except ValueError as e:
-                invalid_specs.append(f"{spec_str} ({str(e)})")
+        
+        # Only build specs while the input is still valid; they'd be discarded
+        if invalid_specs:
+            continue
+        
+        # Create InstanceTypeSpec
+        try:
+            spec = InstanceTypeSpec(instance_type=instance_type, quantity=quantity)
+            instance_type_specs.append(spec)
+            total_instances += quantity
+        except ValueError as e:
+            invalid_specs.append(f"{spec_str} ({str(e)})")
     
     if invalid_specs:
         raise click.BadParameter(
@@ -90,9 +133,6 @@ def validate_instance_types(ctx, param, value):
             f"Expected format: family.size or family.size:quantity (e.g., c7i.large, m7i.xlarge:2)"
         )
     
-    # Calculate total instances to be launched
-    total_instances = sum(spec.quantity for spec in instance_type_specs)
-    
     # Warn if more than 3 instance types or more than 5 total instances
     if len(instance_type_specs) > 3 or total_instances > 5:
         click.echo(
@@ -120,10 +160,7 @@ def validate_subnet_id(ctx, param, value):
     if not value:
         return None
     
-    # AWS subnet ID pattern
-    subnet_pattern = re.compile(r'^subnet-[0-9a-f]{8,17}$')
-    
-    if not subnet_pattern.match(value):
+    if not _is_aws_id(value, 'subnet-'):
         raise click.BadParameter(
             f"Invalid subnet ID format: {value}. "
             f"Expected format: subnet-[0-9a-f]{{8,17}} (e.g., subnet-12345678)"
@@ -146,37 +183,40 @@ def validate_private_key_path(ctx, param, value):
     
     key_path = Path(value)
     
-    # Check if file exists
-    if not key_path.exists():
+    # Opening the file proves it exists and is readable; fstat on the open
+    # descriptor then gives file type and permissions without another lookup.
+    # O_NONBLOCK keeps a FIFO from blocking the open before S_ISREG rejects it
+    try:
+        fd = os.open(key_path, os.O_RDONLY | os.O_NONBLOCK)
+    except FileNotFoundError:
         raise click.BadParameter(f"Private key file not found: {value}")
+    except IsADirectoryError:
+        raise click.BadParameter(f"Private key path is not a file: {value}")
+    except PermissionError:
+        raise click.BadParameter(f"Private key file is not readable: {value}")
+    except OSError as e:
+        raise click.BadParameter(f"Private key file is not accessible: {value} ({e})")
+    
+    try:
+        file_stat = os.fstat(fd)
+    finally:
+        os.close(fd)
     
     # Check if it's a file (not a directory)
-    if not key_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise click.BadParameter(f"Private key path is not a file: {value}")
     
-    # Check if file is readable
-    if not os.access(key_path, os.R_OK):
-        raise click.BadParameter(f"Private key file is not readable: {value}")
-    
-    # Check file permissions (Unix-like systems only)
-    if hasattr(os, 'stat'):
-        try:
-            file_stat = key_path.stat()
-            file_mode = file_stat.st_mode & 0o777
-            
-            # Warn if permissions are too permissive (not 0600 or 0400)
-            if file_mode not in (0o600, 0o400):
-                click.echo(
-                    click.style(
-                        f"\nWarning: Private key file has permissive permissions ({oct(file_mode)}). "
-                        f"Recommended: 0600 or 0400",
-                        fg='yellow'
-                    ),
-                    err=True
-                )
-        except (OSError, AttributeError):
-            # Skip permission check on systems that don't support it
-            pass
+    # Warn if permissions are too permissive (not 0600 or 0400)
+    file_mode = file_stat.st_mode & 0o777
+    if file_mode not in (0o600, 0o400):
+        click.echo(
+            click.style(
+                f"\nWarning: Private key file has permissive permissions ({oct(file_mode)}). "
+                f"Recommended: 0600 or 0400",
+                fg='yellow'
+            ),
+            err=True
+        )
     
     return str(key_path.absolute())
 
@@ -190,10 +230,7 @@ def validate_ami_id(ctx, param, value):
     if not value:
         return value
     
-    # AWS AMI ID pattern
-    ami_pattern = re.compile(r'^ami-[0-9a-f]{8,17}$')
-    
-    if not ami_pattern.match(value):
+    if not _is_aws_id(value, 'ami-'):
         raise click.BadParameter(
             f"Invalid AMI ID format: {value}. "
             f"Expected format: ami-[0-9a-f]{{8,17}} (e.g., ami-12345678)"
@@ -211,10 +248,7 @@ def validate_security_group_id(ctx, param, value):
     if not value:
         return value
     
-    # AWS security group ID pattern
-    sg_pattern = re.compile(r'^sg-[0-9a-f]{8,17}$')
-    
-    if not sg_pattern.match(value):
+    if not _is_aws_id(value, 'sg-'):
         raise click.BadParameter(
             f"Invalid security group ID format: {value}. "
             f"Expected format: sg-[0-9a-f]{{8,17}} (e.g., sg-12345678)"
@@ -231,10 +265,7 @@ def validate_region(ctx, param, value):
     if not value:
         return value
     
-    # AWS region pattern: region-direction-number
-    region_pattern = re.compile(r'^[a-z]{2}-[a-z]+-[0-9]$')
-    
-    if not region_pattern.match(value):
+    if not _is_valid_region(value):
         raise click.BadParameter(
             f"Invalid AWS region format: {value}. "
             f"Expected format: region-direction-number (e.g., us-east-1, eu-west-2)"
@@ -243,6 +274,58 @@ def validate_region(ctx, param, value):
     return value
 
 
+# Settings that may come from the config file, with the validator applied to
+# a file-provided value (CLI values are already validated by their callbacks)
+_CONFIG_FILE_FIELDS = (
+    ('instance_types', None),
+    ('subnet_id', validate_subnet_id),
+    ('key_name', None),
+    ('private_key_path', validate_private_key_path),
+    ('region', validate_region),
+    ('profile', None),
+    ('ami_id', validate_ami_id),
+    ('security_group_id', validate_security_group_id),
+    ('placement_group', None),
+    ('state_queue_url', None),
+)
+
+
+# Styled status prefixes for the per-instance cleanup lines, built once
+_TERMINATED_PREFIX = click.style("  ✓ Terminated", fg='green')
+_FAILED_PREFIX = click.style("  ✗ Failed: ", fg='red')
+
+
+def _terminate_results(aws_manager, results, logger) -> None:
+    """Terminate the instances behind a list of test results in one batch.
+    
+    Args:
+        aws_manager: AWSManager used to issue the termination
+        results: TestResult objects whose instances should be terminated
+        logger: Logger for audit messages
+    """
+    for result in results:
+        details = result.instance_details
+        click.echo(f"  Terminating {details.instance_type} ({details.instance_id})...")
+    
+    instance_ids = [r.instance_details.instance_id for r in results]
+    try:
+        outcome = aws_manager.terminate_instances(instance_ids, verify=True)
+    except Exception as e:
+        click.echo(_FAILED_PREFIX + str(e))
+        logger.error(f"Failed to terminate {', '.join(instance_ids)}: {e}")
+        return
+    
+    for result in results:
+        details = result.instance_details
+        if outcome.get(details.instance_id):
+            click.echo(f"{_TERMINATED_PREFIX} {details.instance_type} ({details.instance_id})")
+        else:
+            click.echo(
+                f"{_FAILED_PREFIX}{details.instance_type} ({details.instance_id}) was not confirmed terminated"
+            )
+            logger.error(f"Failed to terminate {details.instance_id}")
+
+
 @click.command()
 @click.option(
     '--config',
@@ -292,7 +375,11 @@ def validate_region(ctx, param, value):
     '--placement-group',
     help='Placement group name for instance placement (optional). The placement group must exist in the target region and be in available state.'
 )
-def main(config, instance_types, subnet_id, key_name, private_key_path, region, profile, ami_id, security_group_id, placement_group):
+@click.option(
+    '--state-queue-url',
+    help='SQS queue URL receiving EventBridge EC2 instance state-change events (optional). When set, instance state waits listen for events before falling back to describe polling.'
+)
+def main(config, instance_types, subnet_id, key_name, private_key_path, region, profile, ami_id, security_group_id, placement_group, state_queue_url):
     """Test PTP hardware clock support on AWS EC2 instance types.
     
     This tool automates the process of discovering which EC2 instance types support
@@ -370,25 +457,54 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
     - All operations are logged for audit purposes
     - Config files support both YAML (.yaml, .yml) and JSON (.json) formats
     """
+    import atexit
     import logging
+    import logging.handlers
+    import queue
     from datetime import datetime
-    from ptp_tester.aws_manager import AWSManager
-    from ptp_tester.ssh_manager import SSHManager
-    from ptp_tester.ptp_configurator import PTPConfigurator
-    from ptp_tester.test_orchestrator import TestOrchestrator
-    from ptp_tester.report_generator import ReportGenerator
-    from ptp_tester.config_loader import ConfigLoader
     from ptp_tester.models import TestConfig
     
-    # Configure logging
+    # One timestamp names both the log file and the results file so they
+    # can be matched up afterwards
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Configure logging: callers only enqueue records, a background listener
+    # thread does the formatting and the stdout/file writes. Instance tests
+    # run concurrently, so each record names the thread (one per instance)
+    log_formatter = logging.Formatter(
+        '%(asctime)s - [%(threadName)s] - %(name)s - %(levelname)s - %(message)s'
+    )
+    output_handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(f'ptp_tester_{run_timestamp}.log')
+    ]
+    for handler in output_handlers:
+        handler.setFormatter(log_formatter)
+    
+    class _RawQueueHandler(logging.handlers.QueueHandler):
+        """QueueHandler that enqueues records unformatted.
+        
+        The stdlib prepare() formats each record on the calling thread so it can
+        be pickled; the queue here never leaves the process, so the record is
+        passed as-is and the listener's handlers do all the formatting. Message
+        arguments are therefore rendered when the listener gets to the record.
+        """
+        
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            """Return the record unchanged instead of a formatted copy."""
+            return record
+    
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *output_handlers)
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(f'ptp_tester_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-        ]
+        handlers=[_RawQueueHandler(log_queue)]
     )
+    log_listener.start()
+    # Flush queued records on every exit path, including sys.exit(). atexit
+    # runs handlers last-registered-first, so this drains the queue before
+    # logging's own shutdown hook (registered at import) closes the handlers
+    atexit.register(log_listener.stop)
     logger = logging.getLogger(__name__)
     
     click.echo("PTP Instance Tester v0.1.0")
@@ -399,6 +515,7 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
     if config:
         try:
             click.echo(f"\nLoading configuration from: {config}")
+            from ptp_tester.config_loader import ConfigLoader
             config_loader = ConfigLoader()
             file_config = config_loader.load_config(config)
             click.echo(click.style("✓ Configuration file loaded successfully", fg='green'))
@@ -411,47 +528,47 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
     # Merge CLI arguments with config file (CLI takes precedence)
     # Start with config file values (if any), then override with CLI arguments
     if file_config:
-        # Use config file values as defaults
-        if instance_types is None and file_config.instance_types:
-            instance_types = file_config.instance_types
-            logger.info(f"Using instance_types from config file: {[str(s) for s in instance_types]}")
-        
-        if subnet_id is None and file_config.subnet_id:
-            subnet_id = file_config.subnet_id
-            logger.info(f"Using subnet_id from config file: {subnet_id}")
-        
-        if key_name is None and file_config.key_name:
-            key_name = file_config.key_name
-            logger.info(f"Using key_name from config file: {key_name}")
-        
-        if private_key_path is None and file_config.private_key_path:
-            # Validate the private key path from config file
-            try:
-                private_key_path = validate_private_key_path(None, None, file_config.private_key_path)
-                logger.info(f"Using private_key_path from config file: {private_key_path}")
-            except click.BadParameter as e:
-                click.echo(click.style(f"✗ Invalid private_key_path in config file: {e}", fg='red'))
-                sys.exit(1)
-        
-        if region is None and file_config.region:
-            region = file_config.region
-            logger.info(f"Using region from config file: {region}")
-        
-        if profile is None and file_config.profile:
-            profile = file_config.profile
-            logger.info(f"Using profile from config file: {profile}")
-        
-        if ami_id is None and file_config.ami_id:
-            ami_id = file_config.ami_id
-            logger.info(f"Using ami_id from config file: {ami_id}")
+        # Use config file values as defaults; validators only run for the
+        # settings the command line left unset
+        settings = {
+            'instance_types': instance_types,
+            'subnet_id': subnet_id,
+            'key_name': key_name,
+            'private_key_path': private_key_path,
+            'region': region,
+            'profile': profile,
+            'ami_id': ami_id,
+            'security_group_id': security_group_id,
+            'placement_group': placement_group,
+            'state_queue_url': state_queue_url,
+        }
         
-        if security_group_id is None and file_config.security_group_id:
-            security_group_id = file_config.security_group_id
-            logger.info(f"Using security_group_id from config file: {security_group_id}")
+        for name, validator in _CONFIG_FILE_FIELDS:
+            file_value = getattr(file_config, name, None)
+            if settings[name] is not None or not file_value:
+                continue
+            
+            if validator:
+                try:
+                    file_value = validator(None, None, file_value)
+                except click.BadParameter as e:
+                    click.echo(click.style(f"✗ Invalid {name} in config file: {e}", fg='red'))
+                    sys.exit(1)
+            
+            settings[name] = file_value
+            display = [str(v) for v in file_value] if isinstance(file_value, list) else file_value
+            logger.info(f"Using {name} from config file: {display}")
         
-        if placement_group is None and file_config.placement_group:
-            placement_group = file_config.placement_group
-            logger.info(f"Using placement_group from config file: {placement_group}")
+        instance_types = settings['instance_types']
+        subnet_id = settings['subnet_id']
+        key_name = settings['key_name']
+        private_key_path = settings['private_key_path']
+        region = settings['region']
+        profile = settings['profile']
+        ami_id = settings['ami_id']
+        security_group_id = settings['security_group_id']
+        placement_group = settings['placement_group']
+        state_queue_url = settings['state_queue_url']
     
     # Validate required parameters are present (after merging)
     missing_params = []
@@ -508,14 +625,25 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
     else:
         click.echo(f"  Placement Group: (none - using default EC2 placement)")
     
+    if state_queue_url:
+        click.echo(f"  State-change queue: {state_queue_url}")
+    
     click.echo("\n" + "=" * 60)
     
     try:
+        # Heavy dependencies (botocore, paramiko) are only imported once all
+        # argument validation has passed, so early exits stay fast
+        from ptp_tester.aws_manager import AWSManager
+        from ptp_tester.ssh_manager import SSHManager
+        from ptp_tester.ptp_configurator import PTPConfigurator
+        from ptp_tester.test_orchestrator import TestOrchestrator
+        from ptp_tester.report_generator import ReportGenerator
+        
         # Initialize components
         logger.info("Initializing components...")
         click.echo("\nInitializing AWS Manager...")
         
-        aws_manager = AWSManager(region=region, profile=profile)
+        aws_manager = AWSManager(region=region, profile=profile, state_queue_url=state_queue_url)
         logger.info(f"AWS Manager initialized (region: {aws_manager.region})")
         click.echo(f"  Region: {aws_manager.region}")
         
@@ -578,17 +706,11 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
         click.echo("TEST RESULTS")
         click.echo("=" * 60)
         
-        # Display individual instance reports
-        for result in results:
-            report = report_generator.generate_instance_report(result)
-            click.echo(f"\n{report}")
-        
-        # Display summary report
-        summary = report_generator.generate_summary_report(results)
-        click.echo(f"\n{summary}")
+        # Display individual instance reports and the summary in one write
+        click.echo(f"\n{report_generator.generate_all(results)}")
         
         # Export results to JSON
-        json_filename = f'ptp_test_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        json_filename = f'ptp_test_results_{run_timestamp}.json'
         report_generator.export_json(results, json_filename)
         click.echo(f"\nResults exported to: {json_filename}")
         logger.info(f"Results exported to {json_filename}")
@@ -605,16 +727,7 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
         # Auto-terminate unsupported instances
         if unsupported_results:
             click.echo(f"\nAuto-terminating {len(unsupported_results)} instance(s) without PTP support...")
-            for result in unsupported_results:
-                instance_id = result.instance_details.instance_id
-                instance_type = result.instance_details.instance_type
-                try:
-                    click.echo(f"  Terminating {instance_type} ({instance_id})...")
-                    aws_manager.terminate_instance(instance_id, verify=True)
-                    click.echo(click.style(f"    ✓ Terminated", fg='green'))
-                except Exception as e:
-                    click.echo(click.style(f"    ✗ Failed: {e}", fg='red'))
-                    logger.error(f"Failed to terminate {instance_id}: {e}")
+            _terminate_results(aws_manager, unsupported_results, logger)
         
         # Handle PTP-functional instances
         if supported_results:
@@ -639,38 +752,36 @@ def main(config, instance_types, subnet_id, key_name, private_key_path, region,
                 click.echo("\nTerminating all PTP-functional instances...")
                 logger.info("User chose to terminate all PTP-functional instances")
                 
-                for result in supported_results:
-                    instance_id = result.instance_details.instance_id
-                    instance_type = result.instance_details.instance_type
-                    
-                    click.echo(f"\nTerminating {instance_type} ({instance_id})...")
-                    try:
-                        aws_manager.terminate_instance(instance_id, verify=True)
-                        click.echo(click.style(f"  ✓ Terminated", fg='green'))
-                    except Exception as e:
-                        click.echo(click.style(f"  ✗ Failed: {e}", fg='red'))
-                        logger.error(f"Failed to terminate {instance_id}: {e}")
+                _terminate_results(aws_manager, supported_results, logger)
             else:
                 try:
                     # Parse selection
-                    selected_indices = [int(x.strip()) - 1 for x in selection.split(',')]
+                    selected_indices = {int(x.strip()) - 1 for x in selection.split(',')}
+                    
+                    # Reject out-of-range numbers before terminating anything,
+                    # otherwise a typo would terminate every instance
+                    out_of_range = sorted(i + 1 for i in selected_indices if not 0 <= i < len(supported_results))
+                    if out_of_range:
+                        raise ValueError(
+                            f"out of range: {', '.join(map(str, out_of_range))} "
+                            f"(expected 1-{len(supported_results)})"
+                        )
                     
                     # Terminate unselected instances
+                    to_terminate = []
                     for i, result in enumerate(supported_results):
                         instance_id = result.instance_details.instance_id
                         instance_type = result.instance_details.instance_type
                         
                         if i not in selected_indices:
-                            click.echo(f"\nTerminating {instance_type} ({instance_id})...")
-                            try:
-                                aws_manager.terminate_instance(instance_id, verify=True)
-                                click.echo(click.style(f"  ✓ Terminated", fg='green'))
-                            except Exception as e:
-                                click.echo(click.style(f"  ✗ Failed: {e}", fg='red'))
-                                logger.error(f"Failed to terminate {instance_id}: {e}")
+                            to_terminate.append(result)
                         else:
                             click.echo(f"\nKeeping {instance_type} ({instance_id})")
                             logger.info(f"Keeping instance {instance_id}")
+                    
+                    if to_terminate:
+                        click.echo(f"\nTerminating {len(to_terminate)} unselected instance(s)...")
+                        _terminate_results(aws_manager, to_terminate, logger)
                             
                 except (ValueError, IndexError) as e:
                     click.echo(click.style(f"\nInvalid selection '{selection}': {e}", fg='red'))
@@ -2,27 +2,89 @@
 
 import json
 import logging
-from pathlib import Path
-from typing import Dict
+import os
+import stat
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 from ptp_tester.models import TestConfig
 
+try:
+    # Optional: orjson parses JSON several times faster than the stdlib
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Bytes of a YAML config inspected before handing the file to the parser
+_YAML_HEADER_SCAN_BYTES = 4096
+
+# Parsed configurations keyed by (real path, mtime_ns, size), least recently
+# used first. Kept at module level so the cache outlives, and does not keep
+# alive, individual ConfigLoader instances
+_CONFIG_CACHE_SIZE = 16
+_config_cache: 'OrderedDict[Tuple[str, int, int], TestConfig]' = OrderedDict()
+
+
+def _quick_check_yaml_header(head: bytes) -> None:
+    """Reject a YAML config whose top level is clearly a list, without parsing it.
+    
+    Only the first content line is inspected, skipping blank lines, comments,
+    directives and document markers. Anything that isn't an unambiguous
+    block sequence is left for the full parser to judge.
+    
+    Args:
+        head: Leading bytes of the configuration file
+        
+    Raises:
+        ValueError: If the document's top level is a sequence
+    """
+    for raw_line in head.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith((b'#', b'%', b'---')):
+            continue
+        if line == b'-' or line.startswith(b'- '):
+            raise ValueError(
+                "Configuration file must contain a YAML object/dictionary, got list"
+            )
+        return
+
 
 class ConfigLoader:
     """Loads and parses configuration files in YAML or JSON format."""
     
     def __init__(self):
-        """Initialize ConfigLoader."""
-        self._yaml_available = False
+        """Initialize ConfigLoader.
+        
+        PyYAML is imported on the first YAML load, so JSON-only use never
+        pays its import cost.
+        """
+        self._yaml = None
+        self._yaml_loader = None
+    
+    def _ensure_yaml(self) -> bool:
+        """Import PyYAML on first use and pick the fastest safe loader.
+        
+        Returns:
+            True if PyYAML is available, False otherwise
+        """
+        if self._yaml is not None:
+            return True
+        
         try:
             import yaml
-            self._yaml_available = True
-            self._yaml = yaml
         except ImportError:
             logger.warning("PyYAML not installed. YAML config files will not be supported.")
+            return False
+        
+        self._yaml = yaml
+        # Prefer the libyaml-backed loader; same safe semantics, parsed in C
+        self._yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        logger.debug(f"Using YAML loader: {self._yaml_loader.__name__}")
+        return True
     
     def load_config(self, config_path: str) -> TestConfig:
         """Load configuration from a file.
@@ -40,45 +102,77 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If file format is invalid or parsing fails
         """
-        path = Path(config_path).expanduser()
+        path = os.path.expanduser(config_path)
         
-        # Check if file exists
-        if not path.exists():
+        # One stat answers existence and file type, and keys the parse cache
+        try:
+            file_stat = os.stat(path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise ValueError(f"Configuration path is not a file: {config_path}")
         
+        # Reuse the parse of an unchanged file; a new mtime or size is a miss.
+        # TestConfig is frozen, so the cached object is handed out as-is
+        cache_key = (os.path.realpath(path), file_stat.st_mtime_ns, file_stat.st_size)
+        config = _config_cache.get(cache_key)
+        if config is None:
+            config = self._parse_file(cache_key[0], config_path)
+            _config_cache[cache_key] = config
+            if len(_config_cache) > _CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+        else:
+            _config_cache.move_to_end(cache_key)
+        
+        logger.info("Successfully loaded configuration from %s", config_path)
+        return config
+    
+    def _parse_file(self, resolved_path: str, config_path: str) -> TestConfig:
+        """Parse a configuration file into a TestConfig.
+        
+        Args:
+            resolved_path: Absolute path of the configuration file
+            config_path: Path as given by the caller (for error messages)
+            
+        Returns:
+            TestConfig object with values from file
+            
+        Raises:
+            ValueError: If file format is invalid or parsing fails
+        """
         # Determine format from extension
-        extension = path.suffix.lower()
+        extension = os.path.splitext(resolved_path)[1].lower()
+        
+        if extension in ('.yaml', '.yml'):
+            load = self._load_yaml
+        elif extension == '.json':
+            load = self._load_json
+        else:
+            raise ValueError(
+                f"Unsupported config file format: {extension}. "
+                f"Supported formats: .yaml, .yml, .json"
+            )
         
         try:
-            with open(path, 'r') as f:
-                if extension in ('.yaml', '.yml'):
-                    config_dict = self._load_yaml(f, config_path)
-                elif extension == '.json':
-                    config_dict = self._load_json(f, config_path)
-                else:
-                    raise ValueError(
-                        f"Unsupported config file format: {extension}. "
-                        f"Supported formats: .yaml, .yml, .json"
-                    )
+            # Binary mode: both parsers take bytes directly, skipping the
+            # text-layer decode, and libyaml streams from the handle itself
+            with open(resolved_path, 'rb') as f:
+                config_dict = load(f, config_path)
         except (OSError, IOError) as e:
             raise ValueError(f"Failed to read configuration file: {e}")
         
         # Convert to TestConfig
         try:
-            config = TestConfig.from_dict(config_dict)
-            logger.info(f"Successfully loaded configuration from {config_path}")
-            return config
-        except (ValueError, TypeError) as e:
+            return TestConfig.from_dict(config_dict)
+        except ValueError as e:
             raise ValueError(f"Invalid configuration format: {e}")
     
     def _load_yaml(self, file_handle, config_path: str) -> Dict:
         """Load YAML configuration file.
         
         Args:
-            file_handle: Open file handle
+            file_handle: Open binary file handle (read incrementally by the parser)
             config_path: Path to config file (for error messages)
             
         Returns:
@@ -87,14 +181,18 @@ class ConfigLoader:
         Raises:
             ValueError: If YAML parsing fails or PyYAML not installed
         """
-        if not self._yaml_available:
+        if not self._ensure_yaml():
             raise ValueError(
                 "PyYAML library is not installed. "
                 "Install it with: pip install pyyaml"
             )
         
+        # Fail fast on a top-level list before parsing a possibly large file
+        if hasattr(file_handle, 'peek'):
+            _quick_check_yaml_header(file_handle.peek(_YAML_HEADER_SCAN_BYTES)[:_YAML_HEADER_SCAN_BYTES])
+        
         try:
-            config_dict = self._yaml.safe_load(file_handle)
+            config_dict = self._yaml.load(file_handle, Loader=self._yaml_loader)
             
             if config_dict is None:
                 raise ValueError("Configuration file is empty")
@@ -121,7 +219,7 @@ class ConfigLoader:
         """Load JSON configuration file.
         
         Args:
-            file_handle: Open file handle
+            file_handle: Open binary file handle
             config_path: Path to config file (for error messages)
             
         Returns:
@@ -131,7 +229,7 @@ class ConfigLoader:
             ValueError: If JSON parsing fails
         """
         try:
-            config_dict = json.load(file_handle)
+            config_dict = _json_loads(file_handle.read())
             
             if not isinstance(config_dict, dict):
                 raise ValueError(
@@ -142,6 +240,7 @@ class ConfigLoader:
             return config_dict
             
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses this, so both parsers land here
             raise ValueError(
                 f"JSON parsing error at line {e.lineno}, column {e.colno}: {e.msg}"
             )
@@ -1,11 +1,27 @@
 """Data models for PTP Instance Tester."""
 
+import os
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+# __slots__-backed dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# InstanceDetails fields that repeat across a sweep (IDs and IPs don't)
+_INTERNED_DETAIL_FIELDS = (
+    'instance_type',
+    'availability_zone',
+    'subnet_id',
+    'state',
+    'architecture',
+    'placement_group',
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class InstanceTypeSpec:
     """Specification for an instance type with quantity."""
     instance_type: str
@@ -18,6 +34,24 @@ class InstanceTypeSpec:
         if self.quantity < 1:
             raise ValueError(f"Quantity must be positive, got {self.quantity}")
     
+    @classmethod
+    def unchecked(cls, instance_type: str, quantity: int = 1) -> 'InstanceTypeSpec':
+        """Create a spec without running __post_init__ validation.
+        
+        Only for quantities already known to be valid, such as the default of 1.
+        
+        Args:
+            instance_type: EC2 instance type
+            quantity: Number of instances (default: 1)
+            
+        Returns:
+            InstanceTypeSpec with the given values
+        """
+        spec = object.__new__(cls)
+        object.__setattr__(spec, 'instance_type', instance_type)
+        object.__setattr__(spec, 'quantity', quantity)
+        return spec
+    
     def __str__(self) -> str:
         """Return formatted string representation."""
         if self.quantity == 1:
@@ -25,7 +59,7 @@ class InstanceTypeSpec:
         return f"{self.instance_type}:{self.quantity}"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class InstanceConfig:
     """Configuration for launching an EC2 instance."""
     instance_type: str
@@ -36,7 +70,7 @@ class InstanceConfig:
     placement_group: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class InstanceDetails:
     """Details of an EC2 instance."""
     instance_id: str
@@ -48,9 +82,16 @@ class InstanceDetails:
     state: str
     architecture: Optional[str] = None
     placement_group: Optional[str] = None
+    
+    def __post_init__(self):
+        """Intern the low-cardinality string fields shared across instances."""
+        for name in _INTERNED_DETAIL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CommandResult:
     """Result of an SSH command execution."""
     exit_code: int
@@ -59,7 +100,7 @@ class CommandResult:
     success: bool
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PTPStatus:
     """Status of PTP configuration and verification using AWS ENA chrony-based approach."""
     supported: bool
@@ -75,7 +116,7 @@ class PTPStatus:
     diagnostic_output: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TestResult:
     """Result of testing a single instance type."""
     instance_details: InstanceDetails
@@ -85,7 +126,7 @@ class TestResult:
     duration_seconds: float
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TestConfig:
     """Configuration for PTP testing loaded from config file or CLI."""
     instance_types: Optional[List[InstanceTypeSpec]] = None
@@ -97,6 +138,7 @@ class TestConfig:
     ami_id: Optional[str] = None
     security_group_id: Optional[str] = None
     placement_group: Optional[str] = None
+    state_queue_url: Optional[str] = None
     
     @classmethod
     def from_dict(cls, config_dict: Dict) -> 'TestConfig':
@@ -109,54 +151,27 @@ class TestConfig:
             TestConfig object with values from dictionary
             
         Raises:
-            ValueError: If instance_types format is invalid
+            ValueError: If instance_types format is invalid, or a string
+                setting has a non-string value
         """
-        from pathlib import Path
-        
         # Parse instance_types if present
-        instance_types = None
-        if 'instance_types' in config_dict and config_dict['instance_types']:
-            instance_types = []
-            for spec in config_dict['instance_types']:
-                if isinstance(spec, dict):
-                    # Format: {"type": "c7i.large", "quantity": 2}
-                    instance_type = spec.get('type')
-                    quantity = spec.get('quantity', 1)
-                    if not instance_type:
-                        raise ValueError(f"Instance type specification missing 'type' field: {spec}")
-                    instance_types.append(InstanceTypeSpec(instance_type=instance_type, quantity=quantity))
-                elif isinstance(spec, str):
-                    # Format: "c7i.large" or "c7i.large:2"
-                    if ':' in spec:
-                        parts = spec.split(':')
-                        if len(parts) != 2:
-                            raise ValueError(f"Invalid instance type specification: {spec}")
-                        instance_type, quantity_str = parts
-                        try:
-                            quantity = int(quantity_str)
-                        except ValueError:
-                            raise ValueError(f"Invalid quantity in instance type specification: {spec}")
-                        instance_types.append(InstanceTypeSpec(instance_type=instance_type, quantity=quantity))
-                    else:
-                        instance_types.append(InstanceTypeSpec(instance_type=spec, quantity=1))
-                else:
-                    raise ValueError(f"Invalid instance type specification format: {spec}")
+        instance_types = config_dict.get('instance_types') or None
+        if instance_types:
+            if not isinstance(instance_types, list):
+                raise ValueError(
+                    f"instance_types must be a list, got {type(instance_types).__name__}"
+                )
+            instance_types = [_parse_instance_type_spec(spec) for spec in instance_types]
         
         # Expand ~ in private_key_path if present
-        private_key_path = config_dict.get('private_key_path')
+        private_key_path = _optional_str(config_dict, 'private_key_path')
         if private_key_path:
-            private_key_path = str(Path(private_key_path).expanduser())
+            private_key_path = os.path.expanduser(private_key_path)
         
         return cls(
             instance_types=instance_types,
-            subnet_id=config_dict.get('subnet_id'),
-            key_name=config_dict.get('key_name'),
             private_key_path=private_key_path,
-            region=config_dict.get('region'),
-            profile=config_dict.get('profile'),
-            ami_id=config_dict.get('ami_id'),
-            security_group_id=config_dict.get('security_group_id'),
-            placement_group=config_dict.get('placement_group')
+            **{name: _optional_str(config_dict, name) for name in _SCALAR_FIELDS}
         )
     
     def validate(self) -> List[str]:
@@ -165,18 +180,88 @@ class TestConfig:
         Returns:
             List of error messages for missing required fields (empty if valid)
         """
-        errors = []
-        
-        if not self.instance_types:
-            errors.append("instance_types is required")
-        
-        if not self.subnet_id:
-            errors.append("subnet_id is required")
-        
-        if not self.key_name:
-            errors.append("key_name is required")
-        
-        if not self.private_key_path:
-            errors.append("private_key_path is required")
-        
-        return errors
+        return [message for name, message in _REQUIRED_FIELDS if not getattr(self, name)]
+
+
+# TestConfig fields that must be set, with the error reported when missing
+_REQUIRED_FIELDS = (
+    ('instance_types', "instance_types is required"),
+    ('subnet_id', "subnet_id is required"),
+    ('key_name', "key_name is required"),
+    ('private_key_path', "private_key_path is required"),
+)
+
+# TestConfig fields copied from a config dictionary as-is
+_SCALAR_FIELDS = (
+    'subnet_id',
+    'key_name',
+    'region',
+    'profile',
+    'ami_id',
+    'security_group_id',
+    'placement_group',
+    'state_queue_url',
+)
+
+
+def _optional_str(config_dict: Dict, name: str) -> Optional[str]:
+    """Return config_dict[name], which must be a string if present.
+    
+    Raises:
+        ValueError: If the value is set but is not a string
+    """
+    value = config_dict.get(name)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{name} must be a string, got {type(value).__name__}")
+    return value
+
+
+def _parse_dict_spec(spec: Dict) -> InstanceTypeSpec:
+    """Parse a {"type": "c7i.large", "quantity": 2} instance type entry."""
+    instance_type = spec.get('type')
+    quantity = spec.get('quantity', 1)
+    if not instance_type:
+        raise ValueError(f"Instance type specification missing 'type' field: {spec}")
+    if not isinstance(instance_type, str):
+        raise ValueError(f"Instance type must be a string, got {type(instance_type).__name__}: {spec}")
+    return InstanceTypeSpec(instance_type=instance_type, quantity=quantity)
+
+
+def _parse_str_spec(spec: str) -> InstanceTypeSpec:
+    """Parse a "c7i.large" or "c7i.large:2" instance type entry."""
+    instance_type, sep, quantity_str = spec.partition(':')
+    if not sep:
+        # Default quantity of 1 needs no validation
+        return InstanceTypeSpec.unchecked(spec)
+    if ':' in quantity_str:
+        raise ValueError(f"Invalid instance type specification: {spec}")
+    try:
+        quantity = int(quantity_str)
+    except ValueError:
+        raise ValueError(f"Invalid quantity in instance type specification: {spec}")
+    return InstanceTypeSpec(instance_type=instance_type, quantity=quantity)
+
+
+# Instance type entry parsers, dispatched on the entry's exact type
+_SPEC_PARSERS = {
+    dict: _parse_dict_spec,
+    str: _parse_str_spec,
+}
+
+
+def _parse_instance_type_spec(spec) -> InstanceTypeSpec:
+    """Parse one instance_types entry from a config dictionary.
+    
+    Raises:
+        ValueError: If the entry is neither a dict nor a string, or is malformed
+    """
+    parser = _SPEC_PARSERS.get(type(spec))
+    if parser is None:
+        # Subclasses (e.g., OrderedDict) miss the exact-type table
+        if isinstance(spec, dict):
+            parser = _parse_dict_spec
+        elif isinstance(spec, str):
+            parser = _parse_str_spec
+        else:
+            raise ValueError(f"Invalid instance type specification format: {spec}")
+    return parser(spec)
@@ -1,9 +1,13 @@
 """PTP Configurator for setting up and verifying PTP on EC2 instances."""
 
+import itertools
 import logging
+import platform
 import re
+import threading
 import time
-from typing import Tuple, Optional
+import weakref
+from typing import Any, Callable, Dict, Final, List, Tuple, Optional
 from paramiko import SSHClient
 
 from ptp_tester.ssh_manager import SSHManager
@@ -12,6 +16,306 @@ from ptp_tester.models import PTPStatus, CommandResult
 
 logger = logging.getLogger(__name__)
 
+# Leading major.minor.patch of a driver version such as "2.10.0g"
+_ENA_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)')
+
+# Predictable ENA interface name (e.g. enp27s0) in an `ip -o link show` line
+_IFACE_RE = re.compile(r'^\d+:\s+(enp\d+s\d+):', re.MULTILINE)
+
+# Upper bound on polling for SSH to come back after an ENA driver reload
+_RELOAD_RECONNECT_MAX_WAIT = 20.0
+
+# PCI address column of the ENA line in `lspci -D` output
+_ENA_PCI_RE = re.compile(r'^(\S+) Ethernet controller.*ENA', re.MULTILINE)
+
+# Every PTP clock's sysfs name as "path:name" lines, from one process
+_CLOCK_NAMES_CMD = "grep -H '' /sys/class/ptp/*/clock_name 2>/dev/null"
+
+# An ENA clock's line in _CLOCK_NAMES_CMD output, capturing its ptpN device
+_ENA_PTP_RE = re.compile(r'^/sys/class/ptp/(ptp\d+)/clock_name:ena-ptp', re.MULTILINE)
+
+# Stage marker echoed by _staged_script before each command it runs
+_STAGE_RE = re.compile(r'^STAGE=(.+)$', re.MULTILINE)
+
+# amzn-drivers release whose ENA driver is built, for reproducible builds
+ENA_DRIVER_TAG = "ena_linux_2.13.0"
+
+# linuxptp release built when the distribution has no linuxptp package
+LINUXPTP_TAG = "v4.4"
+
+# Fetch amzn-drivers into /tmp/amzn-drivers as the ENA_DRIVER_TAG tarball (no
+# .git, one request); if that fails, fall back to a shallow, blobless, sparse
+# clone of the same tag that checks out only the ENA driver directory
+_AMZN_DRIVERS_FETCH_CMD = (
+    "cd /tmp && rm -rf amzn-drivers && mkdir amzn-drivers && "
+    f"{{ curl -fsSL https://github.com/amzn/amzn-drivers/archive/refs/tags/{ENA_DRIVER_TAG}.tar.gz "
+    "| tar xz --strip-components=1 -C amzn-drivers || "
+    "{ rm -rf amzn-drivers && "
+    f"git clone --depth 1 --branch {ENA_DRIVER_TAG} --filter=blob:none --sparse "
+    "https://github.com/amzn/amzn-drivers.git && "
+    "cd amzn-drivers && git sparse-checkout set kernel/linux/ena; }; }"
+)
+
+# Where the ENA driver build in /tmp/amzn-drivers leaves its module
+_ENA_BUILD_DIR = "/tmp/amzn-drivers/kernel/linux/ena"
+_BUILT_ENA_MODULE = f"{_ENA_BUILD_DIR}/ena.ko"
+
+# Module-parameter reload script for enable_ena_phc, uploaded and run detached
+# since reloading the ENA driver drops the SSH connection
+_ENA_PHC_RELOAD_SCRIPT: Final[bytes] = rb"""#!/bin/bash
+exec > /tmp/ena_phc_reload.log 2>&1
+echo "=== ENA PHC Reload Script Started at $(date) ==="
+echo ""
+
+echo "[1] Capturing pre-reload state..."
+echo "Current PTP devices:"
+ls -la /dev/ptp* 2>&1
+echo ""
+echo "Current PTP sysfs entries:"
+grep -H '' /sys/class/ptp/*/clock_name 2>&1
+echo ""
+echo "Current ENA module info:"
+modinfo ena | head -10
+echo ""
+
+echo "[2] Unloading ENA module..."
+rmmod ena
+RMMOD_EXIT=$?
+echo "rmmod exit code: $RMMOD_EXIT"
+sleep 2
+echo ""
+
+echo "[3] Loading ENA module with phc_enable=1..."
+modprobe ena phc_enable=1
+MODPROBE_EXIT=$?
+echo "modprobe exit code: $MODPROBE_EXIT"
+sleep 3
+echo ""
+
+echo "[4] Verifying PHC enablement..."
+echo "New PTP devices:"
+ls -la /dev/ptp* 2>&1
+echo ""
+echo "New PTP sysfs entries:"
+grep -H '' /sys/class/ptp/*/clock_name 2>&1
+echo ""
+echo "ENA module parameters:"
+grep -H '' /sys/module/ena/parameters/* 2>&1
+echo ""
+
+echo "[5] Checking dmesg for ENA/PTP messages..."
+dmesg | grep -i 'ena\|ptp' | tail -20
+echo ""
+
+echo "=== ENA PHC Reload Script Completed at $(date) ==="
+"""
+
+
+# Reload script for compile_ena_driver_with_phc, loading the newly installed
+# ENA module with phc_enable=1; uploaded and run detached like the one above
+_ENA_DRIVER_RELOAD_SCRIPT: Final[bytes] = r"""#!/bin/bash
+exec > /tmp/ena_driver_reload.log 2>&1
+echo "=== ENA Driver Reload Script Started at $(date) ==="
+echo ""
+
+echo "[1] Capturing pre-reload state..."
+echo "Current ENA driver version:"
+modinfo -F version ena || echo "Could not get version"
+echo ""
+echo "Current PTP devices:"
+ls -la /dev/ptp* 2>&1
+echo ""
+echo "Current ENA module parameters:"
+grep -H '' /sys/module/ena/parameters/* 2>&1
+echo ""
+
+echo "[2] Unloading ENA module..."
+rmmod ena
+RMMOD_EXIT=$?
+echo "rmmod exit code: $RMMOD_EXIT"
+sleep 2
+echo ""
+
+echo "[3] Loading NEW ENA module with phc_enable=1..."
+modprobe ena phc_enable=1
+MODPROBE_EXIT=$?
+echo "modprobe exit code: $MODPROBE_EXIT"
+sleep 3
+echo ""
+
+echo "[4] Verifying PHC enablement..."
+echo "New ENA driver version and PHC parameter:"
+modinfo ena 2>&1 | awk '
+    /^version:/ { print }
+    tolower($0) ~ /^parm:.*phc/ { print; phc = 1 }
+    END { if (!phc) print "✗ phc_enable parameter NOT FOUND in loaded module" }'
+echo ""
+echo "New PTP devices:"
+ls -la /dev/ptp* 2>&1
+echo ""
+echo "New PTP sysfs entries:"
+grep -H '' /sys/class/ptp/*/clock_name 2>&1
+echo ""
+echo "ENA module parameters:"
+grep -H '' /sys/module/ena/parameters/* 2>&1
+echo ""
+echo "Check phc_enable parameter:"
+if [ -f /sys/module/ena/parameters/phc_enable ]; then
+    echo "✓ phc_enable parameter EXISTS"
+    echo "phc_enable = $(< /sys/module/ena/parameters/phc_enable)"
+else
+    echo "✗ phc_enable parameter NOT FOUND"
+fi
+echo ""
+
+echo "[5] Checking dmesg for ENA/PTP messages..."
+dmesg | grep -i 'ena\|ptp' | tail -30
+echo ""
+
+echo "=== ENA Driver Reload Script Completed at $(date) ==="
+""".encode()
+
+
+def _timestamping_lines(ethtool_output: str) -> str:
+    """Keep the PTP clock and transmit timestamp lines of `ethtool -T` output.
+    
+    Args:
+        ethtool_output: Raw `ethtool -T <interface>` output
+        
+    Returns:
+        Matching lines, newline-terminated, in their original order
+    """
+    return "".join(
+        line for line in ethtool_output.splitlines(keepends=True)
+        if line.startswith('PTP Hardware Clock') or 'Transmit Timestamp' in line
+    )
+
+
+class _StepFailed(RuntimeError):
+    """A configuration step's command failed; the message says which and why."""
+
+
+def _staged_script(stages: List[Tuple[str, str]]) -> str:
+    """Chain dependent commands into one bash invocation that stops at the first failure.
+    
+    Each command is preceded by a "STAGE=<name>" line on stdout, so
+    _failed_stage can tell which one a failed run stopped in.
+    
+    Args:
+        stages: List of (stage name, command) tuples, run in order
+        
+    Returns:
+        Command string running every stage over a single exec
+    """
+    body = "".join(
+        f"echo 'STAGE={name}'\n{{ {command}\n}} || exit $?\n" for name, command in stages
+    )
+    return f"bash -s <<'EOSTAGES'\n{body}EOSTAGES"
+
+
+def _failed_stage(stage_output: str) -> str:
+    """Return the name of the last stage a _staged_script run reached.
+    
+    Args:
+        stage_output: stdout of the failed _staged_script run
+        
+    Returns:
+        Stage name, or 'start' if no stage was reached
+    """
+    stages = _STAGE_RE.findall(stage_output)
+    return stages[-1] if stages else 'start'
+
+
+def _ena_module_install_stages(kernel_version: str, module_dir: str) -> List[Tuple[str, str]]:
+    """Return the _staged_script stages installing a freshly built ena.ko.
+    
+    The ENA Makefile has no 'install' target, so the module is copied in by
+    hand. depmod always rewrites the whole modules.dep, so it only runs for
+    this kernel release and only if the installed ena.ko actually changed.
+    
+    Args:
+        kernel_version: Running kernel release (uname -r)
+        module_dir: Directory to install ena.ko into
+        
+    Returns:
+        List of (stage name, command) tuples
+    """
+    return [
+        ("create module directory", f"sudo mkdir -p {module_dir}"),
+        (
+            "copy driver module",
+            f"cmp -s {_BUILT_ENA_MODULE} {module_dir}/ena.ko || "
+            f"{{ sudo cp {_BUILT_ENA_MODULE} {module_dir}/ && MODULE_CHANGED=1; }}"
+        ),
+        (
+            "update module dependencies",
+            f'[ -z "$MODULE_CHANGED" ] || sudo depmod -a {kernel_version}'
+        ),
+    ]
+
+
+def _build_deps_install_cmd(packages: str) -> str:
+    """Return a command installing build-only packages unless already present.
+    
+    The rpm -q check skips yum (and its metadata load) when, say, the ENA
+    build already installed gcc, make and git. Weak dependencies and docs are
+    left out since they are never used on a build host.
+    
+    Args:
+        packages: Space-separated package names
+        
+    Returns:
+        Shell command string
+    """
+    return (
+        f"rpm -q {packages} > /dev/null 2>&1 || "
+        f"sudo yum install -y --setopt=install_weak_deps=False --setopt=tsflags=nodocs {packages}"
+    )
+
+
+def _build_output_logger(prefix: str) -> Callable[[str], None]:
+    """Return an execute_streaming line callback that logs build output.
+    
+    Args:
+        prefix: Step tag to put in front of each line (e.g. '[STEP 3.1]')
+        
+    Returns:
+        Callback logging each line at INFO
+    """
+    return lambda line: logger.info("%s %s", prefix, line)
+
+
+def _ethernet_pci_address(lspci_output: str) -> Optional[str]:
+    """Return the PCI address of the first Ethernet controller in `lspci -D` output.
+    
+    Args:
+        lspci_output: Output of `lspci -D`
+        
+    Returns:
+        PCI address (e.g. '0000:00:05.0'), or None if no Ethernet controller is listed
+    """
+    for line in lspci_output.splitlines():
+        if 'ethernet' in line.lower():
+            return line.split(None, 1)[0]
+    return None
+
+
+def _parse_clock_names(grep_output: str) -> Dict[str, str]:
+    """Split `grep -H '' /sys/class/ptp/*/clock_name` output into a mapping.
+    
+    Args:
+        grep_output: Output of _CLOCK_NAMES_CMD
+        
+    Returns:
+        Dict of clock_name sysfs path to clock name (e.g. 'ena-ptp-0')
+    """
+    clocks = {}
+    for line in grep_output.splitlines():
+        path, sep, name = line.partition(':')
+        if sep:
+            clocks[path] = name.strip()
+    return clocks
+
 
 class PTPConfigurator:
     """Handles PTP configuration and verification on EC2 instances.
@@ -22,14 +326,136 @@ class PTPConfigurator:
     - Hardware timestamping enablement
     - PTP daemon configuration (ptp4l, phc2sys, chrony)
     - PTP functionality verification
+    
+    Every method runs its commands over the connection it is given; the
+    SSHManager pool keeps that connection open between calls. Only the ENA
+    driver reload steps drop it and require a fresh connect.
     """
     
     # Minimum required ENA driver version for PTP support
     MIN_ENA_VERSION = (2, 10, 0)
     
+    # Build outputs keyed by (kernel release, architecture), shared by every
+    # instance in the run: identical AMIs produce identical binaries, so only
+    # the first host of each kind compiles them
+    _ena_module_cache: Dict[Tuple[str, str], bytes] = {}
+    _linuxptp_cache: Dict[Tuple[str, str], Dict[str, bytes]] = {}
+    
+    # One lock per (build kind, kernel release, architecture). Instances are
+    # configured concurrently, so the first host of each kind builds while
+    # holding the lock and the others wait for its result
+    _build_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+    _build_locks_guard = threading.Lock()
+    
     def __init__(self):
         """Initialize PTP Configurator."""
-        pass
+        # Per-connection detection results (architecture, interface, PCI
+        # address); entries go away with the SSHClient, so a reconnect after
+        # a driver reload starts fresh
+        self._detected = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def _build_lock(cls, kind: str, cache_key: Tuple[str, str]) -> threading.Lock:
+        """Return the lock serializing builds of kind for one kernel and architecture."""
+        with cls._build_locks_guard:
+            return cls._build_locks.setdefault((kind, *cache_key), threading.Lock())
+    
+    @staticmethod
+    def _reuse_or_build(
+        lock: threading.Lock,
+        cache: Dict[Tuple[str, str], Any],
+        cache_key: Tuple[str, str],
+        what: str,
+        build: Callable[[], bool],
+        push: Callable[[Any], bool]
+    ) -> bool:
+        """Push a cached build output, or build it once while others wait.
+        
+        The first host for cache_key runs build while holding lock; build is
+        expected to store its output in cache. Hosts arriving meanwhile wait
+        for the lock and then push the cached output. If the leader's build
+        failed (nothing cached), the next host builds itself, and a host whose
+        push fails falls back to building too.
+        
+        Args:
+            lock: Lock for this kind of build output and cache_key
+            cache: Run-wide cache holding the build output
+            cache_key: (kernel release, architecture) of the host
+            what: Build output name for log messages
+            build: Builds on this host and caches the output; True on success
+            push: Installs a cached output on this host; True on success
+            
+        Returns:
+            True if the build output is in place on this host, False otherwise
+        """
+        if not lock.acquire(blocking=False):
+            logger.info(
+                f"[CACHE] Waiting for the {what} build running on another instance "
+                f"for {cache_key[0]} ({cache_key[1]})"
+            )
+            lock.acquire()
+        try:
+            cached = cache.get(cache_key)
+            if cached is None:
+                return build()
+        finally:
+            lock.release()
+        
+        if push(cached):
+            return True
+        logger.warning(f"[CACHE] Falling back to building {what} on this instance")
+        return build()
+    
+    def _get_detected(self, connection: SSHClient, key: str) -> Optional[Any]:
+        """Return a cached detection result for a connection.
+        
+        Args:
+            connection: Active SSH connection to the instance
+            key: Detection result name (e.g. 'architecture')
+            
+        Returns:
+            Cached value, or None if not detected yet on this connection
+        """
+        return self._detected.get(connection, {}).get(key)
+    
+    def _set_detected(self, connection: SSHClient, key: str, value: Any) -> None:
+        """Cache a detection result for a connection.
+        
+        Args:
+            connection: Active SSH connection to the instance
+            key: Detection result name (e.g. 'architecture')
+            value: Detected value
+        """
+        self._detected.setdefault(connection, {})[key] = value
+    
+    def _exec_or_fail(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient,
+        command: str,
+        step_name: str,
+        timeout: int = 30
+    ) -> CommandResult:
+        """Run a configuration step's command, raising if it fails.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            command: Command to execute
+            step_name: What the command does, for the error message
+                (e.g. 'start ptp4l service')
+            timeout: Command execution timeout in seconds (default: 30)
+            
+        Returns:
+            CommandResult of the successful command
+            
+        Raises:
+            _StepFailed: If the command exits non-zero
+        """
+        result = ssh_manager.execute_command(connection, command, timeout=timeout)
+        if not result.success:
+            raise _StepFailed(f"Failed to {step_name}: {result.stderr}")
+        return result
     
     def detect_architecture(
         self,
@@ -38,7 +464,8 @@ class PTPConfigurator:
     ) -> str:
         """Detect CPU architecture of the instance.
         
-        Executes 'uname -m' to determine the CPU architecture.
+        Executes 'uname -m' to determine the CPU architecture, or reads
+        platform.machine() directly when the connection is to this host.
         This is used to select appropriate AMIs and handle architecture-specific
         configurations.
         
@@ -52,23 +479,31 @@ class PTPConfigurator:
             - 'aarch64' for ARM64/Graviton processors
             - 'unknown' if detection fails
         """
+        cached = self._get_detected(connection, 'architecture')
+        if cached is not None:
+            return cached
+        
         logger.info("Detecting instance CPU architecture...")
         
         try:
-            result = ssh_manager.execute_command(
-                connection,
-                "uname -m",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.warning(
-                    f"Failed to detect architecture: {result.stderr}. "
-                    "Defaulting to 'unknown'"
+            if ssh_manager.is_local(connection):
+                # Same machine: skip the uname round-trip
+                architecture = platform.machine()
+            else:
+                result = ssh_manager.execute_command(
+                    connection,
+                    "uname -m",
+                    timeout=30
                 )
-                return "unknown"
-            
-            architecture = result.stdout.strip()
+                
+                if not result.success:
+                    logger.warning(
+                        "Failed to detect architecture: %s. Defaulting to 'unknown'",
+                        result.stderr
+                    )
+                    return "unknown"
+                
+                architecture = result.stdout.strip()
             
             if not architecture:
                 logger.warning("Architecture detection returned empty string")
@@ -78,12 +513,14 @@ class PTPConfigurator:
             
             # Normalize architecture names
             if architecture in ['x86_64', 'amd64']:
-                return 'x86_64'
+                architecture = 'x86_64'
             elif architecture in ['aarch64', 'arm64']:
-                return 'aarch64'
+                architecture = 'aarch64'
             else:
                 logger.warning(f"Unknown architecture: {architecture}")
-                return architecture
+            
+            self._set_detected(connection, 'architecture', architecture)
+            return architecture
                 
         except Exception as e:
             logger.error(f"Architecture detection failed with exception: {e}")
@@ -107,33 +544,136 @@ class PTPConfigurator:
         Returns:
             Interface name (e.g., 'enp27s0', 'eth0')
         """
-        # Try to find ENA interface using predictable naming pattern
+        cached = self._get_detected(connection, 'interface')
+        if cached is not None:
+            return cached
+        
         result = ssh_manager.execute_command(
             connection,
-            "ip -o link show | grep -E 'enp[0-9]+s[0-9]+' | head -1 | awk '{print $2}' | tr -d ':'",
+            "ip -o link show",
             timeout=30
         )
+        return self._interface_from_link_output(connection, result)
+    
+    def _interface_from_link_output(
+        self,
+        connection: SSHClient,
+        result: CommandResult
+    ) -> str:
+        """Pick the primary interface out of `ip -o link show` output.
         
-        if result.success and result.stdout.strip():
-            interface = result.stdout.strip()
+        Args:
+            connection: SSH connection the output came from (for caching)
+            result: Result of running `ip -o link show`
+            
+        Returns:
+            Interface name (e.g., 'enp27s0', 'eth0')
+        """
+        link_output = result.stdout if result.success else ""
+        
+        # Try to find ENA interface using predictable naming pattern
+        match = _IFACE_RE.search(link_output)
+        if match:
+            interface = match.group(1)
             logger.info(f"Detected primary network interface: {interface}")
+            self._set_detected(connection, 'interface', interface)
             return interface
         
-        # Fallback: try to find any UP interface (excluding loopback)
+        # Fallback: first UP interface (excluding loopback) in the same output,
+        # whose lines look like "2: eth0: <BROADCAST,MULTICAST,UP,LOWER_UP> ..."
+        for line in link_output.splitlines():
+            fields = line.split(None, 3)
+            if len(fields) < 3 or fields[1] == 'lo:':
+                continue
+            if 'UP' in fields[2].strip('<>').split(','):
+                interface = fields[1].rstrip(':').split('@', 1)[0]
+                logger.info(f"Detected network interface (fallback): {interface}")
+                self._set_detected(connection, 'interface', interface)
+                return interface
+        
+        # Last resort fallback to eth0 for very old systems
+        logger.warning("Could not detect network interface, falling back to eth0")
+        return "eth0"
+    
+    def _get_kernel_version(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient
+    ) -> Optional[str]:
+        """Return the running kernel release, running `uname -r` once per connection.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            
+        Returns:
+            Kernel release string, or None if it could not be read
+        """
+        cached = self._get_detected(connection, 'kernel_version')
+        if cached is not None:
+            return cached
+        
         result = ssh_manager.execute_command(
             connection,
-            "ip -o link show up | grep -v 'lo:' | head -1 | awk '{print $2}' | tr -d ':'",
+            "uname -r",
             timeout=30
         )
+        kernel_version = result.stdout.strip() if result.success else ""
+        if not kernel_version:
+            logger.warning("Failed to get kernel version: %s", result.stderr)
+            return None
         
-        if result.success and result.stdout.strip():
-            interface = result.stdout.strip()
-            logger.info(f"Detected network interface (fallback): {interface}")
-            return interface
+        self._set_detected(connection, 'kernel_version', kernel_version)
+        return kernel_version
+    
+    def _get_ena_pci_address(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient
+    ) -> Optional[str]:
+        """Return the ENA device's PCI address, running `lspci -D` once per connection.
         
-        # Last resort fallback to eth0 for very old systems
-        logger.warning("Could not detect network interface, falling back to eth0")
-        return "eth0"
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            
+        Returns:
+            PCI address (e.g. '0000:00:05.0'), or None if not found
+        """
+        cached = self._get_detected(connection, 'pci_address')
+        if cached is not None:
+            return cached
+        
+        result = ssh_manager.execute_command(
+            connection,
+            "lspci -D",
+            timeout=30
+        )
+        return self._pci_address_from_lspci(connection, result)
+    
+    def _pci_address_from_lspci(
+        self,
+        connection: SSHClient,
+        result: CommandResult
+    ) -> Optional[str]:
+        """Pick the ENA device's PCI address out of `lspci -D` output.
+        
+        Args:
+            connection: SSH connection the output came from (for caching)
+            result: Result of running `lspci -D`
+            
+        Returns:
+            PCI address of the ENA controller, else of the first Ethernet
+            controller, or None if there is none
+        """
+        if not result.success:
+            return None
+        
+        match = _ENA_PCI_RE.search(result.stdout)
+        pci_address = match.group(1) if match else _ethernet_pci_address(result.stdout)
+        if pci_address is not None:
+            self._set_detected(connection, 'pci_address', pci_address)
+        return pci_address
     
     def check_ena_driver_version(
         self,
@@ -142,7 +682,7 @@ class PTPConfigurator:
     ) -> Tuple[bool, str]:
         """Check if ENA driver version meets minimum requirements for PTP.
         
-        Executes 'modinfo ena' to get the current driver version and compares
+        Executes 'modinfo -F version ena' to get the current driver version and compares
         it with the minimum required version (2.10.0).
         
         Args:
@@ -159,10 +699,10 @@ class PTPConfigurator:
         """
         logger.info("Checking ENA driver version...")
         
-        # Get driver version using modinfo
+        # Get driver version using modinfo; -F prints just the field value
         result = ssh_manager.execute_command(
             connection,
-            "modinfo ena | grep '^version:' | awk '{print $2}'"
+            "modinfo -F version ena"
         )
         
         if not result.success:
@@ -202,9 +742,20 @@ class PTPConfigurator:
         Returns:
             True if version_string >= min_version, False otherwise
         """
-        # Extract numeric version components using regex
+        # Fast path for the usual "2.10.0" / "2.10.0g" shape: split on the
+        # first two dots and keep the leading digits of the patch level
+        try:
+            parts = version_string.split('.', 2)
+            major = int(parts[0])
+            minor = int(parts[1])
+            patch = int(''.join(itertools.takewhile(str.isdigit, parts[2])))
+            return (major, minor, patch) >= min_version
+        except (ValueError, IndexError):
+            pass
+        
+        # Slow path: extract numeric version components using regex
         # Handles formats like "2.10.0", "2.10.0g", "2.10.0-beta", etc.
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)', version_string)
+        match = _ENA_VERSION_RE.match(version_string)
         
         if not match:
             logger.warning(f"Could not parse version string: {version_string}")
@@ -243,7 +794,7 @@ class PTPConfigurator:
             )
             
             if not result.success:
-                logger.error(f"Failed to reload ENA driver: {result.stderr}")
+                logger.error("Failed to reload ENA driver: %s", result.stderr)
                 return False
             
             logger.info("ENA driver reloaded successfully")
@@ -254,12 +805,13 @@ class PTPConfigurator:
             # Check if ENA PTP device was created via sysfs
             result = ssh_manager.execute_command(
                 connection,
-                "for file in /sys/class/ptp/*/clock_name; do cat \"$file\" 2>/dev/null; done 2>/dev/null",
+                _CLOCK_NAMES_CMD,
                 timeout=30
             )
             
-            if "ena-ptp" in result.stdout:
-                logger.info(f"ENA PTP device created after driver reload: {result.stdout.strip()}")
+            clock_names = _parse_clock_names(result.stdout).values()
+            if _ENA_PTP_RE.search(result.stdout):
+                logger.info(f"ENA PTP device created after driver reload: {', '.join(clock_names)}")
                 return True
             else:
                 logger.warning(
@@ -272,11 +824,89 @@ class PTPConfigurator:
             logger.error(f"ENA driver reload failed: {e}")
             return False
     
+    def _await_driver_reload(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient,
+        host: str,
+        username: str,
+        log_path: str,
+        max_wait: float = _RELOAD_RECONNECT_MAX_WAIT,
+        backoff_factor: float = 2.0
+    ) -> bool:
+        """Poll until SSH is back after a detached ENA driver reload.
+        
+        Drops the old connection (it dies with the driver), then tries to
+        reconnect with 0.5s, 1s, 2s, ... backoff for up to max_wait seconds. A
+        connection only counts once the reload script has written its
+        completion line to log_path; an earlier connection could still be
+        cut by the reload. The log is then checked for the phc_enable
+        parameter. The new connection is left in ssh_manager's pool, so the
+        caller's ssh_manager.connect(host, username) reuses it.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: SSH connection the reload was started from
+            host: Instance IP address for reconnection
+            username: SSH username for reconnection
+            log_path: Log file the reload script writes
+            max_wait: Maximum seconds to keep polling
+            backoff_factor: Multiplier applied to the delay after each attempt
+            
+        Returns:
+            True if reconnected after the reload finished, False on timeout
+        """
+        try:
+            ssh_manager.disconnect(connection)
+        except Exception as e:
+            logger.debug(f"Error closing connection before driver reload (expected): {e}")
+        
+        deadline = time.monotonic() + max_wait
+        delay = 0.5
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay *= backoff_factor
+            
+            new_connection = None
+            try:
+                new_connection = ssh_manager.connect(
+                    host,
+                    username=username,
+                    timeout=5,
+                    max_retries=1,
+                    quiet=True
+                )
+                result = ssh_manager.execute_command(
+                    new_connection,
+                    f"cat {log_path} 2>/dev/null",
+                    timeout=10
+                )
+            except Exception as e:
+                logger.debug(f"SSH not back yet after driver reload: {e}")
+                if new_connection is not None:
+                    ssh_manager.disconnect(new_connection)
+                continue
+            
+            if result.success and 'Script Completed' in result.stdout:
+                if 'phc_enable parameter NOT FOUND' in result.stdout:
+                    logger.warning(
+                        f"Driver reload finished but {log_path} reports the "
+                        "phc_enable parameter is missing"
+                    )
+                return True
+            
+            # Reload still in progress; this connection may yet be dropped
+            ssh_manager.disconnect(new_connection)
+    
     def enable_ena_phc(
         self,
         ssh_manager: SSHManager,
         connection: SSHClient,
-        instance_ip: str
+        instance_ip: str,
+        username: str = "ec2-user"
     ) -> tuple[bool, bool]:
         """Enable PTP Hardware Clock (PHC) support on the ENA driver.
         
@@ -291,12 +921,14 @@ class PTPConfigurator:
         - Driver reload required after enabling
         
         IMPORTANT: Module parameter approach (rmmod/modprobe) will drop SSH connection!
-        Caller must handle reconnection when needs_reconnect=True.
+        Caller must handle reconnection when needs_reconnect=True; once the reload
+        has finished, ssh_manager's pool usually already holds the new connection.
         
         Args:
             ssh_manager: SSHManager instance for command execution
             connection: Active SSH connection to the instance
             instance_ip: Instance IP address for reconnection
+            username: SSH username for reconnection (default: ec2-user)
             
         Returns:
             Tuple of (success: bool, needs_reconnect: bool)
@@ -308,84 +940,98 @@ class PTPConfigurator:
         logger.info("=" * 80)
         
         try:
-            # PRE-CHECK: Capture baseline state before any changes
-            logger.info("\n[PRE-CHECK] Capturing baseline state before PHC enablement...")
-            
-            # Check current PTP devices
-            result = ssh_manager.execute_command(
-                connection,
-                "ls -la /dev/ptp* 2>&1; echo '---'; for f in /sys/class/ptp/*/clock_name; do [ -f \"$f\" ] && echo \"$f: $(cat $f)\"; done 2>&1",
-                timeout=30
-            )
-            logger.info(f"[PRE-CHECK] Current PTP devices:\n{result.stdout}")
-            
-            # Check current ENA module parameters
-            result = ssh_manager.execute_command(
-                connection,
-                "cat /sys/module/ena/parameters/* 2>&1 | head -20",
-                timeout=30
-            )
-            logger.info(f"[PRE-CHECK] Current ENA module parameters:\n{result.stdout}")
-            
-            # Check hardware timestamping before
-            result = ssh_manager.execute_command(
-                connection,
-                "ip -o link show | grep -E 'enp[0-9]+s[0-9]+' | head -1 | awk '{print $2}' | tr -d ':'",
-                timeout=30
-            )
-            interface = result.stdout.strip() if result.success else "eth0"
+            # Probes whose output is only logged are skipped when INFO is off
+            diagnostics = logger.isEnabledFor(logging.INFO)
+            ptp_devices_cmd = f"ls -la /dev/ptp* 2>&1; echo '---'; {_CLOCK_NAMES_CMD}"
+            ena_params_cmd = "cat /sys/module/ena/parameters/* 2>&1 | head -20"
+            interface_cmd = "ip -o link show"
+            modprobe_cmd = "sudo modprobe ptp && sudo modprobe pps_core"
+            lsmod_cmd = "lsmod | grep -E 'ptp|pps_core'"
+            lspci_cmd = "lspci -D"
+            interface = self._get_detected(connection, 'interface')
+            pci_address = self._get_detected(connection, 'pci_address')
+            
+            # The pre-check probes, step 1 and the step 2 PCI lookup don't
+            # depend on each other, so send them all as one batch. The
+            # timestamping probe needs the interface name, so it only joins
+            # when that is already known for this connection.
+            commands = []
+            if diagnostics:
+                commands += [(ptp_devices_cmd, 30), (ena_params_cmd, 30)]
+                if interface is None:
+                    commands.append((interface_cmd, 30))
+                else:
+                    timestamping_cmd = f"sudo ethtool -T {interface} 2>&1"
+                    commands.append((timestamping_cmd, 30))
+            commands.append((modprobe_cmd, 30))
+            if diagnostics:
+                commands.append((lsmod_cmd, 30))
+            if pci_address is None:
+                commands.append((lspci_cmd, 30))
+            results = ssh_manager.execute_batch(connection, commands)
             
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo ethtool -T {interface} 2>&1 | grep -E 'PTP Hardware Clock|Transmit Timestamp'",
-                timeout=30
-            )
-            logger.info(f"[PRE-CHECK] Hardware timestamping on {interface}:\n{result.stdout}")
+            # PRE-CHECK: Capture baseline state before any changes
+            if diagnostics:
+                logger.info("\n[PRE-CHECK] Capturing baseline state before PHC enablement...")
+                logger.info("[PRE-CHECK] Current PTP devices:\n%s", results[ptp_devices_cmd].stdout)
+                logger.info("[PRE-CHECK] Current ENA module parameters:\n%s", results[ena_params_cmd].stdout)
+                
+                # Check hardware timestamping before
+                if interface is None:
+                    result = results[interface_cmd]
+                    match = _IFACE_RE.search(result.stdout) if result.success else None
+                    if match:
+                        interface = match.group(1)
+                        self._set_detected(connection, 'interface', interface)
+                    else:
+                        interface = "eth0"
+                    result = ssh_manager.execute_command(
+                        connection,
+                        f"sudo ethtool -T {interface} 2>&1",
+                        timeout=30
+                    )
+                else:
+                    result = results[timestamping_cmd]
+                logger.info(
+                    "[PRE-CHECK] Hardware timestamping on %s:\n%s",
+                    interface, _timestamping_lines(result.stdout)
+                )
             
             # Step 1: Ensure PTP module is loaded
             logger.info("\n[STEP 1] Ensuring PTP module is loaded...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo modprobe ptp && sudo modprobe pps_core",
-                timeout=30
-            )
-            
+            result = results[modprobe_cmd]
             if not result.success:
-                logger.warning(f"[STEP 1] Could not load PTP modules: {result.stderr}")
+                logger.warning("[STEP 1] Could not load PTP modules: %s", result.stderr)
                 logger.info("[STEP 1] Modules might be built-in, continuing...")
             else:
                 logger.info("[STEP 1] ✓ PTP modules loaded successfully")
             
             # Verify modules
-            result = ssh_manager.execute_command(
-                connection,
-                "lsmod | grep -E 'ptp|pps_core'",
-                timeout=30
-            )
-            logger.info(f"[STEP 1] Loaded modules:\n{result.stdout}")
-            
-            # Step 2: Get PCI address of ENA device
-            logger.info("\n[STEP 2] Getting ENA device PCI address...")
-            result = ssh_manager.execute_command(
-                connection,
-                "lspci -D | grep 'Ethernet controller.*ENA' | awk '{print $1}'",
-                timeout=30
-            )
-            
-            if not result.success or not result.stdout.strip():
-                logger.error("[STEP 2] ✗ Could not find ENA device PCI address")
-                return (False, False)
+            if diagnostics:
+                logger.info("[STEP 1] Loaded modules:\n%s", results[lsmod_cmd].stdout)
             
-            pci_address = result.stdout.strip()
+            # Step 2: Get PCI address of ENA device
+            logger.info("\n[STEP 2] Getting ENA device PCI address...")
+            if pci_address is None:
+                result = results[lspci_cmd]
+                
+                match = _ENA_PCI_RE.search(result.stdout) if result.success else None
+                if not match:
+                    logger.error("[STEP 2] ✗ Could not find ENA device PCI address")
+                    return (False, False)
+                
+                pci_address = match.group(1)
+                self._set_detected(connection, 'pci_address', pci_address)
             logger.info(f"[STEP 2] ✓ Found ENA device at PCI address: {pci_address}")
             
-            # Get detailed PCI device info
-            result = ssh_manager.execute_command(
-                connection,
-                f"lspci -vvv -s {pci_address} 2>&1 | head -30",
-                timeout=30
-            )
-            logger.info(f"[STEP 2] ENA device details:\n{result.stdout}")
+            # Get detailed PCI device info (verbose, so only at DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                result = ssh_manager.execute_command(
+                    connection,
+                    f"lspci -vvv -s {pci_address} 2>&1 | head -30",
+                    timeout=30
+                )
+                logger.debug("[STEP 2] ENA device details:\n%s", result.stdout)
             
             # Step 3: Try devlink approach first (Linux 6.16+)
             logger.info("\n[STEP 3] Attempting to enable PHC via devlink...")
@@ -397,15 +1043,16 @@ class PTPConfigurator:
             
             if result.success:
                 logger.info("[STEP 3] ✓ PHC parameter set via devlink")
-                logger.info(f"[STEP 3] Devlink output: {result.stdout}")
+                logger.info("[STEP 3] Devlink output: %s", result.stdout)
                 
                 # Verify parameter was set
-                result = ssh_manager.execute_command(
-                    connection,
-                    f"sudo devlink dev param show pci/{pci_address} name enable_phc 2>&1",
-                    timeout=30
-                )
-                logger.info(f"[STEP 3] PHC parameter verification:\n{result.stdout}")
+                if diagnostics:
+                    result = ssh_manager.execute_command(
+                        connection,
+                        f"sudo devlink dev param show pci/{pci_address} name enable_phc 2>&1",
+                        timeout=30
+                    )
+                    logger.info("[STEP 3] PHC parameter verification:\n%s", result.stdout)
                 
                 # Reload driver via devlink
                 logger.info("[STEP 3] Reloading driver via devlink...")
@@ -422,29 +1069,23 @@ class PTPConfigurator:
                     time.sleep(3)
                     
                     logger.info("\n[POST-CHECK] Verifying PHC enablement after devlink reload...")
-                    result = ssh_manager.execute_command(
-                        connection,
-                        "ls -la /dev/ptp* 2>&1; echo '---'; for f in /sys/class/ptp/*/clock_name; do [ -f \"$f\" ] && echo \"$f: $(cat $f)\"; done 2>&1",
-                        timeout=30
-                    )
-                    logger.info(f"[POST-CHECK] PTP devices after reload:\n{result.stdout}")
-                    
-                    result = ssh_manager.execute_command(
-                        connection,
-                        f"sudo ethtool -T {interface} 2>&1 | grep -E 'PTP Hardware Clock|Transmit Timestamp'",
-                        timeout=30
-                    )
-                    logger.info(f"[POST-CHECK] Hardware timestamping after reload:\n{result.stdout}")
+                    timestamping_cmd = f"sudo ethtool -T {interface} 2>&1"
+                    commands = [(_CLOCK_NAMES_CMD, 30)]
+                    if diagnostics:
+                        commands[:0] = [(ptp_devices_cmd, 30), (timestamping_cmd, 30)]
+                    results = ssh_manager.execute_batch(connection, commands)
+                    if diagnostics:
+                        logger.info("[POST-CHECK] PTP devices after reload:\n%s", results[ptp_devices_cmd].stdout)
+                        logger.info(
+                            "[POST-CHECK] Hardware timestamping after reload:\n%s",
+                            _timestamping_lines(results[timestamping_cmd].stdout)
+                        )
                     
                     # Check if ena-ptp device was created
-                    result = ssh_manager.execute_command(
-                        connection,
-                        "grep -r 'ena-ptp' /sys/class/ptp/*/clock_name 2>/dev/null",
-                        timeout=30
-                    )
+                    match = _ENA_PTP_RE.search(results[_CLOCK_NAMES_CMD].stdout)
                     
-                    if result.success and result.stdout.strip():
-                        logger.info(f"[POST-CHECK] ✓ ENA PTP device created: {result.stdout}")
+                    if match:
+                        logger.info(f"[POST-CHECK] ✓ ENA PTP device created: {match.group(1)}")
                         logger.info("=" * 80)
                         logger.info("PHC ENABLEMENT SUCCESSFUL VIA DEVLINK")
                         logger.info("=" * 80)
@@ -453,10 +1094,10 @@ class PTPConfigurator:
                         logger.warning("[POST-CHECK] ✗ ENA PTP device NOT created after devlink reload")
                         logger.info("[POST-CHECK] Falling back to module parameter approach...")
                 else:
-                    logger.warning(f"[STEP 3] ✗ Devlink reload failed: {reload_result.stderr}")
+                    logger.warning("[STEP 3] ✗ Devlink reload failed: %s", reload_result.stderr)
                     logger.info("[STEP 3] Falling back to module parameter approach...")
             else:
-                logger.info(f"[STEP 3] Devlink not available: {result.stderr}")
+                logger.info("[STEP 3] Devlink not available: %s", result.stderr)
                 logger.info("[STEP 3] Trying module parameter approach...")
             
             # Step 4: Fallback to module parameter approach
@@ -466,67 +1107,16 @@ class PTPConfigurator:
                 "Reconnection will be attempted automatically."
             )
             
-            # Create a comprehensive reload script with detailed logging
-            reload_script = r"""#!/bin/bash
-exec > /tmp/ena_phc_reload.log 2>&1
-echo "=== ENA PHC Reload Script Started at $(date) ==="
-echo ""
-
-echo "[1] Capturing pre-reload state..."
-echo "Current PTP devices:"
-ls -la /dev/ptp* 2>&1
-echo ""
-echo "Current PTP sysfs entries:"
-for f in /sys/class/ptp/*/clock_name; do [ -f "$f" ] && echo "$f: $(cat $f)"; done 2>&1
-echo ""
-echo "Current ENA module info:"
-modinfo ena | head -10
-echo ""
-
-echo "[2] Unloading ENA module..."
-rmmod ena
-RMMOD_EXIT=$?
-echo "rmmod exit code: $RMMOD_EXIT"
-sleep 2
-echo ""
-
-echo "[3] Loading ENA module with phc_enable=1..."
-modprobe ena phc_enable=1
-MODPROBE_EXIT=$?
-echo "modprobe exit code: $MODPROBE_EXIT"
-sleep 3
-echo ""
-
-echo "[4] Verifying PHC enablement..."
-echo "New PTP devices:"
-ls -la /dev/ptp* 2>&1
-echo ""
-echo "New PTP sysfs entries:"
-for f in /sys/class/ptp/*/clock_name; do [ -f "$f" ] && echo "$f: $(cat $f)"; done 2>&1
-echo ""
-echo "ENA module parameters:"
-cat /sys/module/ena/parameters/* 2>&1 | head -20
-echo ""
-echo "Check phc_enable value:"
-[ -f /sys/module/ena/parameters/phc_enable ] && echo "phc_enable = $(cat /sys/module/ena/parameters/phc_enable)" || echo "Parameter not found"
-echo ""
-
-echo "[5] Checking dmesg for ENA/PTP messages..."
-dmesg | grep -i 'ena\|ptp' | tail -20
-echo ""
-
-echo "=== ENA PHC Reload Script Completed at $(date) ==="
-"""
-            
-            # Write the script
-            result = ssh_manager.execute_command(
-                connection,
-                f"cat > /tmp/ena_phc_reload.sh <<'EOFSCRIPT'\n{reload_script}EOFSCRIPT\nchmod +x /tmp/ena_phc_reload.sh",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 4] ✗ Failed to create reload script: {result.stderr}")
+            # Upload the reload script over SFTP
+            try:
+                ssh_manager.upload_file(
+                    connection,
+                    _ENA_PHC_RELOAD_SCRIPT,
+                    "/tmp/ena_phc_reload.sh",
+                    mode=0o755
+                )
+            except Exception as e:
+                logger.error(f"[STEP 4] ✗ Failed to create reload script: {e}")
                 return (False, False)
             
             logger.info("[STEP 4] ✓ Reload script created at /tmp/ena_phc_reload.sh")
@@ -535,19 +1125,24 @@ echo "=== ENA PHC Reload Script Completed at $(date) ==="
             logger.info("[STEP 4] Executing reload script...")
             result = ssh_manager.execute_command(
                 connection,
-                "nohup sudo bash /tmp/ena_phc_reload.sh > /dev/null 2>&1 &",
+                "sudo rm -f /tmp/ena_phc_reload.log; nohup sudo bash /tmp/ena_phc_reload.sh > /dev/null 2>&1 &",
                 timeout=5
             )
             
             # Connection will drop during driver reload
             logger.info("[STEP 4] Driver reload initiated, SSH connection will drop...")
-            logger.info("[STEP 4] Waiting 15 seconds for driver reload to complete...")
-            
-            # Wait for driver reload to complete
-            time.sleep(15)
+            logger.info(
+                f"[STEP 4] Polling for SSH to come back "
+                f"(up to {_RELOAD_RECONNECT_MAX_WAIT:.0f} seconds)..."
+            )
             
-            # Signal that reconnection is needed
-            logger.info("[STEP 4] Driver reload should be complete, reconnection required")
+            if self._await_driver_reload(
+                ssh_manager, connection, instance_ip, username,
+                "/tmp/ena_phc_reload.log"
+            ):
+                logger.info("[STEP 4] ✓ Driver reload complete, new SSH connection is pooled")
+            else:
+                logger.info("[STEP 4] Driver reload still in progress, reconnection required")
             logger.info("=" * 80)
             logger.info("PHC ENABLEMENT INITIATED VIA MODULE PARAMETER - RECONNECTION NEEDED")
             logger.info("=" * 80)
@@ -564,7 +1159,9 @@ echo "=== ENA PHC Reload Script Completed at $(date) ==="
         self,
         ssh_manager: SSHManager,
         connection: SSHClient,
-        instance_ip: str
+        instance_ip: str,
+        use_prebuilt: bool = True,
+        username: str = "ec2-user"
     ) -> tuple[bool, bool]:
         """Compile and install ENA driver with PHC support enabled.
         
@@ -577,15 +1174,20 @@ echo "=== ENA PHC Reload Script Completed at $(date) ==="
         2. Installs build dependencies (kernel-devel, gcc, make, git)
         3. Clones the amzn-drivers repository
         4. Builds the ENA driver WITH PHC support (ENA_PHC_INCLUDE=1)
-        5. Installs the compiled driver
-        6. Creates a script to reload the driver with enable_phc=1
-        7. Executes the reload script (which will drop SSH connection)
+        5. Creates a script to reload the driver with enable_phc=1
+        6. Installs the compiled driver and executes the reload script (which
+           will drop SSH connection) in a single exec
+        
+        With use_prebuilt, steps 2-5 are skipped when the module already
+        installed for the running kernel release was built with PHC support
+        (e.g. on a repeat run against the same instance).
         
         Note: yum automatically handles architecture-specific packages (kernel-devel, gcc)
         based on the detected system architecture, so no special handling is needed.
         
         IMPORTANT: Driver reload will drop SSH connection!
-        Caller must handle reconnection when needs_reconnect=True.
+        Caller must handle reconnection when needs_reconnect=True; once the reload
+        has finished, ssh_manager's pool usually already holds the new connection.
         
         References:
         - https://github.com/amzn/amzn-drivers/blob/master/kernel/linux/ena/README.rst
@@ -595,6 +1197,9 @@ echo "=== ENA PHC Reload Script Completed at $(date) ==="
             ssh_manager: SSHManager instance for command execution
             connection: Active SSH connection to the instance
             instance_ip: Instance IP address for reconnection
+            use_prebuilt: Reuse an installed PHC-enabled ena.ko instead of
+                rebuilding it (default: True)
+            username: SSH username for reconnection (default: ec2-user)
             
         Returns:
             Tuple of (success: bool, needs_reconnect: bool)
@@ -605,290 +1210,97 @@ echo "=== ENA PHC Reload Script Completed at $(date) ==="
         logger.info("COMPILING ENA DRIVER WITH PHC SUPPORT")
         logger.info("=" * 80)
         
-        try:
-            # Detect architecture at the start
-            architecture = self.detect_architecture(ssh_manager, connection)
-            logger.info(f"\n[ARCHITECTURE] Compiling ENA driver for architecture: {architecture}")
-            logger.info(f"[ARCHITECTURE] Note: yum will automatically install {architecture}-specific packages")
-            
-            # Step 0: Check kernel PTP configuration prerequisites
-            logger.info("\n[STEP 0] Checking kernel PTP configuration prerequisites...")
-            result = ssh_manager.execute_command(
-                connection,
-                "grep -E 'CONFIG_PTP_1588_CLOCK|CONFIG_PPS' /boot/config-$(uname -r) 2>/dev/null",
-                timeout=30
-            )
-            
-            if result.success and result.stdout:
-                logger.info("[STEP 0] Kernel PTP configuration:")
-                for line in result.stdout.strip().split('\n'):
-                    logger.info(f"  {line}")
-                
-                # Check if PTP support is enabled
-                if 'CONFIG_PTP_1588_CLOCK=y' in result.stdout or 'CONFIG_PTP_1588_CLOCK=m' in result.stdout:
-                    logger.info("[STEP 0] ✓ Kernel has PTP_1588_CLOCK support")
-                else:
-                    logger.warning(
-                        "[STEP 0] ⚠️  Kernel may not have PTP_1588_CLOCK enabled. "
-                        "PHC compilation might fail or be silently disabled."
-                    )
-                
-                if 'CONFIG_PPS=y' in result.stdout or 'CONFIG_PPS=m' in result.stdout:
-                    logger.info("[STEP 0] ✓ Kernel has PPS support")
-                else:
-                    logger.warning("[STEP 0] ⚠️  Kernel may not have PPS support")
-            else:
-                logger.warning(
-                    "[STEP 0] ⚠️  Could not read kernel config. "
-                    "Proceeding anyway, but PHC support may not work."
-                )
-            
-            # Step 1: Install build dependencies
-            logger.info("\n[STEP 1] Installing build dependencies...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo yum install -y kernel-devel-$(uname -r) gcc make git",
-                timeout=300  # 5 minutes for package installation
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 1] ✗ Failed to install build dependencies: {result.stderr}")
-                return (False, False)
-            
-            logger.info("[STEP 1] ✓ Build dependencies installed")
-            
-            # Step 2: Clone amzn-drivers repository
-            logger.info("\n[STEP 2] Cloning amzn-drivers repository...")
-            result = ssh_manager.execute_command(
-                connection,
-                "cd /tmp && rm -rf amzn-drivers && "
-                "git clone https://github.com/amzn/amzn-drivers.git",
-                timeout=180  # 3 minutes for git clone
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 2] ✗ Failed to clone repository: {result.stderr}")
-                return (False, False)
-            
-            logger.info("[STEP 2] ✓ Repository cloned")
-            
-            # Step 3: Build the ENA driver WITH PHC support
-            logger.info("\n[STEP 3] Building ENA driver with PHC support...")
-            logger.info(f"[STEP 3] Target architecture: {architecture}")
-            logger.info("[STEP 3] This may take 2-3 minutes...")
-            logger.info("[STEP 3] Trying multiple build approaches to ensure PHC is enabled...")
-            logger.info("[STEP 3] Note: Build tools will automatically compile for the detected architecture")
-            
-            # Try approach 1: ENA_PHC_INCLUDE=1 (original method)
-            logger.info("[STEP 3.1] Attempting build with ENA_PHC_INCLUDE=1...")
-            result = ssh_manager.execute_command(
-                connection,
-                "cd /tmp/amzn-drivers/kernel/linux/ena && make clean && make ENA_PHC_INCLUDE=1",
-                timeout=300
-            )
-            
-            if not result.success:
-                logger.warning(f"[STEP 3.1] Build approach 1 failed: {result.stderr}")
-                
-                # Try approach 2: EXTRA_CFLAGS with -D flag
-                logger.info("[STEP 3.2] Attempting build with EXTRA_CFLAGS...")
-                result = ssh_manager.execute_command(
-                    connection,
-                    'cd /tmp/amzn-drivers/kernel/linux/ena && make clean && make EXTRA_CFLAGS="-DENA_PHC_INCLUDE=1"',
-                    timeout=300
-                )
-                
-                if not result.success:
-                    logger.error(f"[STEP 3.2] ✗ Build approach 2 also failed: {result.stderr}")
-                    return (False, False)
-                else:
-                    logger.info("[STEP 3.2] ✓ Build succeeded with EXTRA_CFLAGS approach")
-            else:
-                logger.info("[STEP 3.1] ✓ Build succeeded with ENA_PHC_INCLUDE approach")
-            
-            # Verify the compiled module has phc_enable parameter
-            logger.info("[STEP 3.3] Verifying compiled module has phc_enable parameter...")
-            result = ssh_manager.execute_command(
-                connection,
-                "modinfo /tmp/amzn-drivers/kernel/linux/ena/ena.ko 2>/dev/null | grep -i 'parm.*phc'",
-                timeout=30
-            )
-            
-            if result.success and 'phc' in result.stdout.lower():
-                logger.info(f"[STEP 3.3] ✓ Compiled module has PHC parameter: {result.stdout.strip()}")
-            else:
-                logger.warning(
-                    "[STEP 3.3] ⚠️  WARNING: Compiled module may not have PHC parameter! "
-                    "This could indicate:\n"
-                    "  1. Kernel lacks CONFIG_PTP_1588_CLOCK support\n"
-                    "  2. Driver source doesn't support PHC in this version\n"
-                    "  3. Build flags weren't properly applied\n"
-                    "Proceeding with installation, but PHC may not work."
-                )
-                
-                # Get full modinfo for diagnostics
-                result = ssh_manager.execute_command(
-                    connection,
-                    "modinfo /tmp/amzn-drivers/kernel/linux/ena/ena.ko 2>/dev/null",
-                    timeout=30
-                )
-                logger.info(f"[STEP 3.3] Compiled module info:\n{result.stdout[:500]}")
-            
-            logger.info("[STEP 3] ✓ ENA driver compilation complete")
-            
-            # Step 4: Install the compiled driver manually
-            logger.info("\n[STEP 4] Installing compiled ENA driver...")
-            
-            # The ENA Makefile doesn't have an 'install' target, so we manually copy the .ko file
-            # First, find the kernel module directory
-            result = ssh_manager.execute_command(
-                connection,
-                "uname -r",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 4] ✗ Failed to get kernel version: {result.stderr}")
-                return (False, False)
-            
-            kernel_version = result.stdout.strip()
-            module_dir = f"/lib/modules/{kernel_version}/kernel/drivers/amazon/net/ena"
-            
-            logger.info(f"[STEP 4] Kernel version: {kernel_version}")
-            logger.info(f"[STEP 4] Installing to: {module_dir}")
-            
-            # Create the module directory if it doesn't exist
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo mkdir -p {module_dir}",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 4] ✗ Failed to create module directory: {result.stderr}")
-                return (False, False)
-            
-            # Copy the compiled driver to the module directory
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo cp /tmp/amzn-drivers/kernel/linux/ena/ena.ko {module_dir}/",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 4] ✗ Failed to copy driver module: {result.stderr}")
-                return (False, False)
-            
-            # Update module dependencies
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo depmod -a",
-                timeout=60
-            )
-            
-            if not result.success:
-                logger.error(f"[STEP 4] ✗ Failed to update module dependencies: {result.stderr}")
-                return (False, False)
-            
-            logger.info("[STEP 4] ✓ ENA driver installed and module dependencies updated")
-            
-            # Step 5: Create driver reload script with PHC enabled
-            logger.info("\n[STEP 5] Creating driver reload script with PHC enabled...")
-            logger.warning(
-                "[STEP 5] ⚠️  Driver reload will drop SSH connection! "
-                "Reconnection will be attempted automatically."
-            )
-            
-            reload_script = r"""#!/bin/bash
-exec > /tmp/ena_driver_reload.log 2>&1
-echo "=== ENA Driver Reload Script Started at $(date) ==="
-echo ""
-
-echo "[1] Capturing pre-reload state..."
-echo "Current ENA driver version:"
-modinfo ena | grep '^version:' || echo "Could not get version"
-echo ""
-echo "Current PTP devices:"
-ls -la /dev/ptp* 2>&1
-echo ""
-echo "Current ENA module parameters:"
-ls -la /sys/module/ena/parameters/ 2>&1
-echo ""
-
-echo "[2] Unloading ENA module..."
-rmmod ena
-RMMOD_EXIT=$?
-echo "rmmod exit code: $RMMOD_EXIT"
-sleep 2
-echo ""
-
-echo "[3] Loading NEW ENA module with phc_enable=1..."
-modprobe ena phc_enable=1
-MODPROBE_EXIT=$?
-echo "modprobe exit code: $MODPROBE_EXIT"
-sleep 3
-echo ""
-
-echo "[4] Verifying PHC enablement..."
-echo "New ENA driver version:"
-modinfo ena | grep '^version:' || echo "Could not get version"
-echo ""
-echo "Checking if phc_enable parameter exists in loaded module:"
-modinfo ena | grep -i 'parm.*phc' || echo "✗ phc_enable parameter NOT FOUND in loaded module"
-echo ""
-echo "New PTP devices:"
-ls -la /dev/ptp* 2>&1
-echo ""
-echo "New PTP sysfs entries:"
-for f in /sys/class/ptp/*/clock_name; do [ -f "$f" ] && echo "$f: $(cat $f)"; done 2>&1
-echo ""
-echo "ENA module parameters:"
-ls -la /sys/module/ena/parameters/ 2>&1
-echo ""
-echo "Check if phc_enable parameter exists:"
-[ -f /sys/module/ena/parameters/phc_enable ] && echo "✓ phc_enable parameter EXISTS" || echo "✗ phc_enable parameter NOT FOUND"
-echo ""
-echo "Check phc_enable value:"
-[ -f /sys/module/ena/parameters/phc_enable ] && echo "phc_enable = $(cat /sys/module/ena/parameters/phc_enable)" || echo "Parameter not found"
-echo ""
-
-echo "[5] Checking dmesg for ENA/PTP messages..."
-dmesg | grep -i 'ena\|ptp' | tail -30
-echo ""
-
-echo "=== ENA Driver Reload Script Completed at $(date) ==="
-"""
+        try:
+            # Detect architecture at the start
+            architecture = self.detect_architecture(ssh_manager, connection)
+            logger.info(f"\n[ARCHITECTURE] Compiling ENA driver for architecture: {architecture}")
+            logger.info(f"[ARCHITECTURE] Note: yum will automatically install {architecture}-specific packages")
             
-            # Write the reload script
-            result = ssh_manager.execute_command(
-                connection,
-                f"cat > /tmp/ena_driver_reload.sh <<'EOFSCRIPT'\n{reload_script}EOFSCRIPT\nchmod +x /tmp/ena_driver_reload.sh",
-                timeout=30
+            # Installed module location, keyed by kernel release (and so by
+            # architecture, which the release string encodes)
+            kernel_version = self._get_kernel_version(ssh_manager, connection)
+            if kernel_version is None:
+                logger.error("[PREBUILT] ✗ Failed to get kernel version")
+                return (False, False)
+            
+            module_dir = f"/lib/modules/{kernel_version}/kernel/drivers/amazon/net/ena"
+            
+            install_stages = []
+            if use_prebuilt and self._has_phc_parameter(
+                ssh_manager, connection, f"{module_dir}/ena.ko"
+            ):
+                logger.info(
+                    f"[PREBUILT] ✓ {module_dir}/ena.ko already has PHC support "
+                    f"for {kernel_version}, skipping build (steps 0-4)"
+                )
+            elif not self._obtain_ena_driver(
+                ssh_manager, connection, architecture, kernel_version
+            ):
+                return (False, False)
+            else:
+                # Step 4: Install the compiled driver; runs in the same exec
+                # that starts the step 6 reload
+                logger.info("\n[STEP 4] Installing compiled ENA driver...")
+                logger.info(f"[STEP 4] Kernel version: {kernel_version}")
+                logger.info(f"[STEP 4] Installing to: {module_dir}")
+                install_stages = _ena_module_install_stages(kernel_version, module_dir)
+            
+            # Step 5: Create driver reload script with PHC enabled
+            logger.info("\n[STEP 5] Creating driver reload script with PHC enabled...")
+            logger.warning(
+                "[STEP 5] ⚠️  Driver reload will drop SSH connection! "
+                "Reconnection will be attempted automatically."
             )
             
-            if not result.success:
-                logger.error(f"[STEP 5] ✗ Failed to create reload script: {result.stderr}")
+            # Upload the reload script over SFTP
+            try:
+                ssh_manager.upload_file(
+                    connection,
+                    _ENA_DRIVER_RELOAD_SCRIPT,
+                    "/tmp/ena_driver_reload.sh",
+                    mode=0o755
+                )
+            except Exception as e:
+                logger.error(f"[STEP 5] ✗ Failed to create reload script: {e}")
                 return (False, False)
             
             logger.info("[STEP 5] ✓ Reload script created at /tmp/ena_driver_reload.sh")
             
-            # Step 6: Execute the reload script in background
+            # Step 6: Execute the reload script in background, after the
+            # step 4 install stages (if any) in the same exec
             logger.info("\n[STEP 6] Executing driver reload script...")
             result = ssh_manager.execute_command(
                 connection,
-                "nohup sudo bash /tmp/ena_driver_reload.sh > /dev/null 2>&1 &",
-                timeout=5
+                _staged_script(install_stages + [(
+                    "start driver reload",
+                    "sudo rm -f /tmp/ena_driver_reload.log; "
+                    "nohup sudo bash /tmp/ena_driver_reload.sh > /dev/null 2>&1 < /dev/null &"
+                )]),
+                timeout=125
             )
             
+            if not result.success:
+                logger.error(
+                    "[STEP 6] ✗ Failed to %s: %s", _failed_stage(result.stdout), result.stderr
+                )
+                return (False, False)
+            if install_stages:
+                logger.info("[STEP 4] ✓ ENA driver installed and module dependencies updated")
+            
             # Connection will drop during driver reload
             logger.info("[STEP 6] Driver reload initiated, SSH connection will drop...")
-            logger.info("[STEP 6] Waiting 15 seconds for driver reload to complete...")
-            
-            # Wait for driver reload to complete
-            time.sleep(15)
+            logger.info(
+                f"[STEP 6] Polling for SSH to come back "
+                f"(up to {_RELOAD_RECONNECT_MAX_WAIT:.0f} seconds)..."
+            )
             
-            # Signal that reconnection is needed
-            logger.info("[STEP 6] Driver reload should be complete, reconnection required")
+            if self._await_driver_reload(
+                ssh_manager, connection, instance_ip, username,
+                "/tmp/ena_driver_reload.log"
+            ):
+                logger.info("[STEP 6] ✓ Driver reload complete, new SSH connection is pooled")
+            else:
+                logger.info("[STEP 6] Driver reload still in progress, reconnection required")
             logger.info("=" * 80)
             logger.info("ENA DRIVER COMPILATION COMPLETE - RECONNECTION NEEDED")
             logger.info(f"[ARCHITECTURE] Compiled for: {architecture}")
@@ -903,93 +1315,290 @@ echo "=== ENA Driver Reload Script Completed at $(date) ==="
             logger.error("=" * 80)
             return (False, False)
     
-    def upgrade_ena_driver(
+    def _has_phc_parameter(
         self,
         ssh_manager: SSHManager,
-        connection: SSHClient
+        connection: SSHClient,
+        module_path: str
     ) -> bool:
-        """Upgrade ENA driver to version 2.10.0 or later.
+        """Check whether an ENA module file was built with PHC support.
         
-        DEPRECATED: Use compile_ena_driver_with_phc() instead for PTP support.
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            module_path: Path of the .ko file on the instance
+            
+        Returns:
+            True if the module exposes a phc_enable parameter, False otherwise
+        """
+        result = ssh_manager.execute_command(
+            connection,
+            f"modinfo -F parm {module_path} 2>/dev/null",
+            timeout=30
+        )
+        return result.success and 'phc_enable' in result.stdout
+    
+    def _obtain_ena_driver(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient,
+        architecture: str,
+        kernel_version: str
+    ) -> bool:
+        """Put a PHC-enabled ena.ko at _BUILT_ENA_MODULE, building it if needed.
         
-        This method builds the driver without PHC support, which is not
-        sufficient for PTP functionality. The compile_ena_driver_with_phc()
-        method should be used instead.
+        A module built earlier in this run for the same kernel release and
+        architecture is pushed over SFTP instead of rebuilding (steps 0-3).
+        A fresh build is downloaded into the cache for later hosts; hosts of
+        the same kind arriving during that build wait for it.
         
         Args:
             ssh_manager: SSHManager instance for command execution
             connection: Active SSH connection to the instance
+            architecture: Detected CPU architecture
+            kernel_version: Running kernel release (uname -r)
             
         Returns:
-            True if upgrade successful, False otherwise
+            True if the module is in place, False otherwise
         """
-        logger.warning(
-            "upgrade_ena_driver() is deprecated for PTP use cases. "
-            "Use compile_ena_driver_with_phc() instead to enable PHC support."
+        if architecture == "unknown":
+            return self._build_ena_driver(ssh_manager, connection, architecture, kernel_version)
+        cache_key = (kernel_version, architecture)
+        
+        def build() -> bool:
+            if not self._build_ena_driver(ssh_manager, connection, architecture, kernel_version):
+                return False
+            try:
+                self._ena_module_cache[cache_key] = ssh_manager.download_file(
+                    connection, _BUILT_ENA_MODULE
+                )
+            except Exception as e:
+                logger.warning(f"[CACHE] Could not cache the built ena.ko: {e}")
+            return True
+        
+        def push(module: bytes) -> bool:
+            try:
+                result = ssh_manager.execute_command(
+                    connection,
+                    f"mkdir -p {_ENA_BUILD_DIR}",
+                    timeout=30
+                )
+                if result.success:
+                    ssh_manager.upload_file(connection, module, _BUILT_ENA_MODULE)
+                    logger.info(
+                        f"[CACHE] ✓ Reused ena.ko built earlier for {kernel_version} "
+                        f"({architecture}), skipping build (steps 0-3)"
+                    )
+                    return True
+                logger.warning("[CACHE] Could not push cached ena.ko: %s", result.stderr)
+            except Exception as e:
+                logger.warning(f"[CACHE] Could not push cached ena.ko: {e}")
+            return False
+        
+        return self._reuse_or_build(
+            self._build_lock("ena", cache_key), self._ena_module_cache, cache_key,
+            "ena.ko", build, push
         )
+    
+    def _build_ena_driver(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient,
+        architecture: str,
+        kernel_version: str
+    ) -> bool:
+        """Build the ENA driver with PHC support (steps 0-3).
         
-        logger.info("Starting ENA driver upgrade process...")
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            architecture: Detected CPU architecture
+            kernel_version: Running kernel release (uname -r)
+            
+        Returns:
+            True if the driver was built, False otherwise
+        """
+        # Step 0: Check kernel PTP configuration prerequisites
+        logger.info("\n[STEP 0] Checking kernel PTP configuration prerequisites...")
+        result = ssh_manager.execute_command(
+            connection,
+            f"grep -E 'CONFIG_PTP_1588_CLOCK|CONFIG_PPS' /boot/config-{kernel_version} 2>/dev/null",
+            timeout=30
+        )
         
-        try:
-            # Step 1: Install build dependencies
-            logger.info("Installing build dependencies...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo yum install -y kernel-devel-$(uname -r) gcc make git",
-                timeout=300  # 5 minutes for package installation
-            )
+        if result.success and result.stdout:
+            logger.info("[STEP 0] Kernel PTP configuration:")
+            for line in result.stdout.strip().split('\n'):
+                logger.info(f"  {line}")
             
-            if not result.success:
-                logger.error(f"Failed to install build dependencies: {result.stderr}")
-                return False
+            # Check if PTP support is enabled
+            if 'CONFIG_PTP_1588_CLOCK=y' in result.stdout or 'CONFIG_PTP_1588_CLOCK=m' in result.stdout:
+                logger.info("[STEP 0] ✓ Kernel has PTP_1588_CLOCK support")
+            else:
+                logger.warning(
+                    "[STEP 0] ⚠️  Kernel may not have PTP_1588_CLOCK enabled. "
+                    "PHC compilation might fail or be silently disabled."
+                )
             
-            # Step 2: Clone amzn-drivers repository
-            logger.info("Cloning amzn-drivers repository...")
-            result = ssh_manager.execute_command(
-                connection,
-                "cd /tmp && rm -rf amzn-drivers && "
-                "git clone https://github.com/amzn/amzn-drivers.git",
-                timeout=180  # 3 minutes for git clone
+            if 'CONFIG_PPS=y' in result.stdout or 'CONFIG_PPS=m' in result.stdout:
+                logger.info("[STEP 0] ✓ Kernel has PPS support")
+            else:
+                logger.warning("[STEP 0] ⚠️  Kernel may not have PPS support")
+        else:
+            logger.warning(
+                "[STEP 0] ⚠️  Could not read kernel config. "
+                "Proceeding anyway, but PHC support may not work."
             )
+        
+        # Step 1: Install build dependencies
+        logger.info("\n[STEP 1] Installing build dependencies...")
+        result = ssh_manager.execute_command(
+            connection,
+            _build_deps_install_cmd(f"kernel-devel-{kernel_version} gcc make git"),
+            timeout=300  # 5 minutes for package installation
+        )
+        
+        if not result.success:
+            logger.error("[STEP 1] ✗ Failed to install build dependencies: %s", result.stderr)
+            return False
+        
+        logger.info("[STEP 1] ✓ Build dependencies installed")
+        
+        # Step 2: Fetch amzn-drivers source
+        logger.info(f"\n[STEP 2] Fetching amzn-drivers source ({ENA_DRIVER_TAG})...")
+        result = ssh_manager.execute_command(
+            connection,
+            _AMZN_DRIVERS_FETCH_CMD,
+            timeout=180  # 3 minutes for download or git clone
+        )
+        
+        if not result.success:
+            logger.error("[STEP 2] ✗ Failed to fetch amzn-drivers source: %s", result.stderr)
+            return False
+        
+        logger.info("[STEP 2] ✓ amzn-drivers source fetched")
+        
+        # Step 3: Build the ENA driver WITH PHC support
+        logger.info("\n[STEP 3] Building ENA driver with PHC support...")
+        logger.info(f"[STEP 3] Target architecture: {architecture}")
+        logger.info("[STEP 3] This may take 2-3 minutes...")
+        logger.info("[STEP 3] Trying multiple build approaches to ensure PHC is enabled...")
+        logger.info("[STEP 3] Note: Build tools will automatically compile for the detected architecture")
+        
+        # Try approach 1: ENA_PHC_INCLUDE=1 (original method)
+        logger.info("[STEP 3.1] Attempting build with ENA_PHC_INCLUDE=1...")
+        result = ssh_manager.execute_streaming(
+            connection,
+            "cd /tmp/amzn-drivers/kernel/linux/ena && make clean && make -j$(nproc) ENA_PHC_INCLUDE=1",
+            _build_output_logger("[STEP 3.1]"),
+            timeout=300
+        )
+        
+        if not result.success:
+            logger.warning("[STEP 3.1] Build approach 1 failed: %s", result.stderr)
             
-            if not result.success:
-                logger.error(f"Failed to clone amzn-drivers repository: {result.stderr}")
-                return False
-            
-            # Step 3: Build the ENA driver (WITHOUT PHC support)
-            logger.info("Building ENA driver...")
-            result = ssh_manager.execute_command(
+            # Try approach 2: EXTRA_CFLAGS with -D flag
+            logger.info("[STEP 3.2] Attempting build with EXTRA_CFLAGS...")
+            result = ssh_manager.execute_streaming(
                 connection,
-                "cd /tmp/amzn-drivers/kernel/linux/ena && make",
-                timeout=300  # 5 minutes for build
+                'cd /tmp/amzn-drivers/kernel/linux/ena && make clean && make -j$(nproc) EXTRA_CFLAGS="-DENA_PHC_INCLUDE=1"',
+                _build_output_logger("[STEP 3.2]"),
+                timeout=300
             )
             
             if not result.success:
-                logger.error(f"Failed to build ENA driver: {result.stderr}")
+                logger.error("[STEP 3.2] ✗ Build approach 2 also failed: %s", result.stderr)
                 return False
+            else:
+                logger.info("[STEP 3.2] ✓ Build succeeded with EXTRA_CFLAGS approach")
+        else:
+            logger.info("[STEP 3.1] ✓ Build succeeded with ENA_PHC_INCLUDE approach")
+        
+        # Verify the compiled module has phc_enable parameter
+        logger.info("[STEP 3.3] Verifying compiled module has phc_enable parameter...")
+        result = ssh_manager.execute_command(
+            connection,
+            f"modinfo -F parm {_BUILT_ENA_MODULE} 2>/dev/null",
+            timeout=30
+        )
+        
+        phc_parms = []
+        if result.success:
+            phc_parms = [line for line in result.stdout.splitlines() if 'phc' in line.lower()]
+        
+        if phc_parms:
+            logger.info(f"[STEP 3.3] ✓ Compiled module has PHC parameter: {'; '.join(phc_parms)}")
+        else:
+            logger.warning(
+                "[STEP 3.3] ⚠️  WARNING: Compiled module may not have PHC parameter! "
+                "This could indicate:\n"
+                "  1. Kernel lacks CONFIG_PTP_1588_CLOCK support\n"
+                "  2. Driver source doesn't support PHC in this version\n"
+                "  3. Build flags weren't properly applied\n"
+                "Proceeding with installation, but PHC may not work."
+            )
             
-            # Step 4: Install the ENA driver
-            logger.info("Installing ENA driver...")
+            # Get full modinfo for diagnostics
             result = ssh_manager.execute_command(
                 connection,
-                "cd /tmp/amzn-drivers/kernel/linux/ena && sudo make install",
-                timeout=120
+                f"modinfo {_BUILT_ENA_MODULE} 2>/dev/null",
+                timeout=30
             )
+            logger.info("[STEP 3.3] Compiled module info:\n%.500s", result.stdout)
+        
+        logger.info("[STEP 3] ✓ ENA driver compilation complete")
+        
+        return True
+    
+    def upgrade_ena_driver(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient
+    ) -> bool:
+        """Upgrade ENA driver to version 2.10.0 or later.
+        
+        DEPRECATED: Use compile_ena_driver_with_phc() instead for PTP support.
+        
+        This method builds the driver without PHC support, which is not
+        sufficient for PTP functionality. The compile_ena_driver_with_phc()
+        method should be used instead.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
             
-            if not result.success:
-                logger.error(f"Failed to install ENA driver: {result.stderr}")
-                return False
-            
-            # Step 5: Reload the driver module
-            logger.info("Reloading ENA driver module...")
-            result = ssh_manager.execute_command(
+        Returns:
+            True if upgrade successful, False otherwise
+        """
+        logger.warning(
+            "upgrade_ena_driver() is deprecated for PTP use cases. "
+            "Use compile_ena_driver_with_phc() instead to enable PHC support."
+        )
+        
+        logger.info("Starting ENA driver upgrade process...")
+        
+        try:
+            # Steps 1-5: Install build dependencies, fetch amzn-drivers, build
+            # the ENA driver (WITHOUT PHC support), install and reload it
+            logger.info(
+                "Installing build dependencies, then building, installing and "
+                "reloading the ENA driver..."
+            )
+            result = ssh_manager.execute_streaming(
                 connection,
-                "sudo rmmod ena && sudo modprobe ena",
-                timeout=30
+                _staged_script([
+                    ("install build dependencies", _build_deps_install_cmd("kernel-devel-$(uname -r) gcc make git")),
+                    ("fetch amzn-drivers source", _AMZN_DRIVERS_FETCH_CMD),
+                    ("build ENA driver", "cd /tmp/amzn-drivers/kernel/linux/ena && make -j$(nproc)"),
+                    ("install ENA driver", "cd /tmp/amzn-drivers/kernel/linux/ena && sudo make install"),
+                    ("reload ENA driver", "sudo rmmod ena && sudo modprobe ena"),
+                ]),
+                _build_output_logger("[UPGRADE]"),
+                timeout=930  # Sum of the per-step budgets (yum 300, fetch 180, make 300, install 120, reload 30)
             )
             
             if not result.success:
-                logger.error(f"Failed to reload ENA driver: {result.stderr}")
+                logger.error("Failed to %s: %s", _failed_stage(result.stdout), result.stderr)
                 return False
             
             # Step 6: Verify the new version
@@ -1032,53 +1641,41 @@ echo "=== ENA Driver Reload Script Completed at $(date) ==="
         logger.info("Installing PTP packages (chrony, ethtool, and PTP tools)...")
         
         try:
-            # First, check what PTP packages are available
-            logger.info("Checking available PTP packages...")
-            result = ssh_manager.execute_command(
+            # Check whether ptp4l and phc2sys are already installed (from the
+            # linuxptp package or an earlier source build) and install the
+            # base packages (chrony and ethtool are always available) in one batch
+            logger.info("Checking for PTP tools and installing chrony and ethtool...")
+            tools_check_cmd = "which ptp4l && which phc2sys"
+            base_install_cmd = "sudo yum install -y chrony ethtool"
+            results = ssh_manager.execute_batch(
                 connection,
-                "yum search ptp 2>&1 | grep -E '^(linuxptp|ptp)\\..*:' || echo 'No PTP packages found'",
-                timeout=60
+                [(tools_check_cmd, 30), (base_install_cmd, 300)]
             )
-            logger.info(f"Available PTP packages: {result.stdout}")
+            tools_present = results[tools_check_cmd].success
             
-            # Install base packages (chrony and ethtool are always available)
-            logger.info("Installing chrony and ethtool...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo yum install -y chrony ethtool",
-                timeout=300
-            )
+            result = results[base_install_cmd]
             
             if not result.success:
-                logger.error(f"Failed to install base packages: {result.stderr}")
+                logger.error("Failed to install base packages: %s", result.stderr)
                 return False
             
             logger.info("✓ Base packages (chrony, ethtool) installed")
             
-            # Try to install linuxptp (contains ptp4l and phc2sys)
-            logger.info("Attempting to install linuxptp package...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo yum install -y linuxptp 2>&1",
-                timeout=300
-            )
-            
-            if result.success:
-                logger.info("✓ linuxptp package installed successfully")
+            if tools_present:
+                logger.info("✓ ptp4l and phc2sys are already available on the system")
             else:
-                logger.warning(f"linuxptp package not available: {result.stderr}")
-                logger.info("Checking if ptp4l and phc2sys are already available...")
-                
-                # Check if ptp4l and phc2sys are already installed
+                # Try to install linuxptp (contains ptp4l and phc2sys)
+                logger.info("Attempting to install linuxptp package...")
                 result = ssh_manager.execute_command(
                     connection,
-                    "which ptp4l && which phc2sys",
-                    timeout=30
+                    "sudo yum install -y linuxptp 2>&1",
+                    timeout=300
                 )
                 
                 if result.success:
-                    logger.info("✓ ptp4l and phc2sys are already available on the system")
+                    logger.info("✓ linuxptp package installed successfully")
                 else:
+                    logger.warning("linuxptp package not available: %s", result.stderr)
                     logger.warning(
                         "PTP tools (ptp4l, phc2sys) are not available in package repos. "
                         "Building linuxptp from source..."
@@ -1089,125 +1686,228 @@ echo "=== ENA Driver Reload Script Completed at $(date) ==="
                         logger.error("Failed to build linuxptp from source")
                         return False
             
-            logger.info("PTP package installation complete")
-            return True
+            logger.info("PTP package installation complete")
+            return True
+            
+        except Exception as e:
+            logger.error(f"PTP package installation failed with exception: {e}")
+            return False
+    
+    def _build_linuxptp_from_source(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient
+    ) -> bool:
+        """Build linuxptp tools (ptp4l, phc2sys) from source.
+        
+        This is needed when linuxptp package is not available in repos,
+        which can happen on newer kernels or certain AMI versions.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            
+        Returns:
+            True if build and installation successful, False otherwise
+        """
+        logger.info("Building linuxptp from source...")
+        
+        try:
+            # Steps 1-4: Build and install linuxptp, or push the binaries
+            # built earlier in this run for the same kernel and architecture
+            kernel_version = self._get_kernel_version(ssh_manager, connection)
+            architecture = self.detect_architecture(ssh_manager, connection)
+            known_host = kernel_version is not None and architecture != "unknown"
+            cache_key = (kernel_version, architecture) if known_host else None
+            
+            def build() -> bool:
+                if not self._compile_linuxptp(ssh_manager, connection):
+                    return False
+                if cache_key is not None:
+                    try:
+                        self._linuxptp_cache[cache_key] = {
+                            name: ssh_manager.download_file(connection, f"/usr/local/sbin/{name}")
+                            for name in ("ptp4l", "phc2sys")
+                        }
+                    except Exception as e:
+                        logger.warning(f"Could not cache the built linuxptp binaries: {e}")
+                return True
+            
+            def push(binaries: Dict[str, bytes]) -> bool:
+                if not self._push_linuxptp_binaries(ssh_manager, connection, binaries):
+                    return False
+                logger.info(
+                    f"✓ Reused linuxptp built earlier for {kernel_version} "
+                    f"({architecture}), skipping build"
+                )
+                return True
+            
+            if cache_key is None:
+                built = build()
+            else:
+                built = self._reuse_or_build(
+                    self._build_lock("linuxptp", cache_key), self._linuxptp_cache, cache_key,
+                    "linuxptp", build, push
+                )
+            if not built:
+                return False
+            
+            # Step 5: Verify installation
+            logger.info("Verifying linuxptp installation...")
+            result = ssh_manager.execute_command(
+                connection,
+                "which ptp4l && which phc2sys && ptp4l -v",
+                timeout=30
+            )
+            
+            if not result.success:
+                logger.error("linuxptp tools not found after installation: %s", result.stderr)
+                return False
+            
+            logger.info("✓ linuxptp tools verified: %s", result.stdout.strip())
+            
+            # Step 6: Create systemd service files
+            logger.info("Creating systemd service files for ptp4l and phc2sys...")
+            if not self._create_ptp_systemd_services(ssh_manager, connection):
+                logger.error("Failed to create systemd service files")
+                return False
             
+            logger.info("✓ Systemd service files created")
+            return True
+                
         except Exception as e:
-            logger.error(f"PTP package installation failed with exception: {e}")
+            logger.error(f"Failed to build linuxptp from source: {e}")
             return False
     
-    def _build_linuxptp_from_source(
+    def _compile_linuxptp(
         self,
         ssh_manager: SSHManager,
         connection: SSHClient
     ) -> bool:
-        """Build linuxptp tools (ptp4l, phc2sys) from source.
-        
-        This is needed when linuxptp package is not available in repos,
-        which can happen on newer kernels or certain AMI versions.
+        """Clone, build and install linuxptp to /usr/local/sbin (steps 1-4).
         
         Args:
             ssh_manager: SSHManager instance for command execution
             connection: Active SSH connection to the instance
             
         Returns:
-            True if build and installation successful, False otherwise
+            True if linuxptp was built and installed, False otherwise
         """
-        logger.info("Building linuxptp from source...")
+        # Step 1: Install build dependencies
+        logger.info("Installing build dependencies for linuxptp...")
+        result = ssh_manager.execute_command(
+            connection,
+            _build_deps_install_cmd("gcc make git kernel-headers kernel-devel"),
+            timeout=300
+        )
         
-        try:
-            # Step 1: Install build dependencies
-            logger.info("Installing build dependencies for linuxptp...")
-            result = ssh_manager.execute_command(
-                connection,
-                "sudo yum install -y gcc make git kernel-headers kernel-devel",
-                timeout=300
-            )
-            
-            if not result.success:
-                logger.error(f"Failed to install build dependencies: {result.stderr}")
-                return False
-            
-            logger.info("✓ Build dependencies installed")
-            
-            # Step 2: Clone linuxptp repository
-            logger.info("Cloning linuxptp repository...")
+        if not result.success:
+            logger.error("Failed to install build dependencies: %s", result.stderr)
+            return False
+        
+        logger.info("✓ Build dependencies installed")
+        
+        # Step 2: Fetch the LINUXPTP_TAG release tarball, falling back to
+        # shallow clones of the same tag
+        logger.info(f"Fetching linuxptp source ({LINUXPTP_TAG})...")
+        result = ssh_manager.execute_command(
+            connection,
+            "cd /tmp && rm -rf linuxptp && mkdir linuxptp && "
+            f"curl -fsSL https://github.com/richardcochran/linuxptp/archive/refs/tags/{LINUXPTP_TAG}.tar.gz "
+            "| tar xz --strip-components=1 -C linuxptp",
+            timeout=180
+        )
+        
+        if not result.success:
+            logger.warning(f"Failed to download linuxptp {LINUXPTP_TAG} tarball, cloning from sourceforge...")
             result = ssh_manager.execute_command(
                 connection,
                 "cd /tmp && rm -rf linuxptp && "
-                "git clone https://git.code.sf.net/p/linuxptp/code linuxptp",
+                f"git clone --depth 1 --single-branch --branch {LINUXPTP_TAG} https://git.code.sf.net/p/linuxptp/code linuxptp",
                 timeout=180
             )
-            
-            if not result.success:
-                logger.warning(f"Failed to clone from sourceforge, trying GitHub mirror...")
-                result = ssh_manager.execute_command(
-                    connection,
-                    "cd /tmp && rm -rf linuxptp && "
-                    "git clone https://github.com/richardcochran/linuxptp.git",
-                    timeout=180
-                )
-                
-                if not result.success:
-                    logger.error(f"Failed to clone linuxptp repository: {result.stderr}")
-                    return False
-            
-            logger.info("✓ Repository cloned")
-            
-            # Step 3: Build linuxptp
-            logger.info("Building linuxptp (this may take 2-3 minutes)...")
-            result = ssh_manager.execute_command(
-                connection,
-                "cd /tmp/linuxptp && make clean && make",
-                timeout=300
-            )
-            
-            if not result.success:
-                logger.error(f"Failed to build linuxptp: {result.stderr}")
-                return False
-            
-            logger.info("✓ linuxptp built successfully")
-            
-            # Step 4: Install binaries
-            logger.info("Installing linuxptp binaries...")
+        
+        if not result.success:
+            logger.warning(f"Failed to clone from sourceforge, trying GitHub mirror...")
             result = ssh_manager.execute_command(
                 connection,
-                "cd /tmp/linuxptp && sudo make install",
-                timeout=60
+                "cd /tmp && rm -rf linuxptp && "
+                f"git clone --depth 1 --single-branch --branch {LINUXPTP_TAG} https://github.com/richardcochran/linuxptp.git",
+                timeout=180
             )
             
             if not result.success:
-                logger.error(f"Failed to install linuxptp: {result.stderr}")
+                logger.error("Failed to clone linuxptp repository: %s", result.stderr)
                 return False
+        
+        logger.info("✓ linuxptp source fetched")
+        
+        # Step 3: Build linuxptp
+        logger.info("Building linuxptp (this may take 2-3 minutes)...")
+        result = ssh_manager.execute_streaming(
+            connection,
+            "cd /tmp/linuxptp && make clean && make -j$(nproc)",
+            _build_output_logger("[LINUXPTP]"),
+            timeout=300
+        )
+        
+        if not result.success:
+            logger.error("Failed to build linuxptp: %s", result.stderr)
+            return False
+        
+        logger.info("✓ linuxptp built successfully")
+        
+        # Step 4: Install binaries
+        logger.info("Installing linuxptp binaries...")
+        result = ssh_manager.execute_streaming(
+            connection,
+            "cd /tmp/linuxptp && sudo make install",
+            _build_output_logger("[LINUXPTP]"),
+            timeout=60
+        )
+        
+        if not result.success:
+            logger.error("Failed to install linuxptp: %s", result.stderr)
+            return False
+        
+        logger.info("✓ linuxptp installed to /usr/local/sbin")
+        
+        return True
+    
+    def _push_linuxptp_binaries(
+        self,
+        ssh_manager: SSHManager,
+        connection: SSHClient,
+        binaries: Dict[str, bytes]
+    ) -> bool:
+        """Install cached linuxptp binaries to /usr/local/sbin over SFTP.
+        
+        Args:
+            ssh_manager: SSHManager instance for command execution
+            connection: Active SSH connection to the instance
+            binaries: Binary name to contents (ptp4l, phc2sys)
             
-            logger.info("✓ linuxptp installed to /usr/local/sbin")
+        Returns:
+            True if the binaries were installed, False otherwise
+        """
+        try:
+            for name, data in binaries.items():
+                ssh_manager.upload_file(connection, data, f"/tmp/{name}", mode=0o755)
             
-            # Step 5: Verify installation
-            logger.info("Verifying linuxptp installation...")
+            staged = " ".join(f"/tmp/{name}" for name in binaries)
             result = ssh_manager.execute_command(
                 connection,
-                "which ptp4l && which phc2sys && ptp4l -v",
+                f"sudo install -m 755 {staged} /usr/local/sbin/ && rm -f {staged}",
                 timeout=30
             )
-            
-            if not result.success:
-                logger.error(f"linuxptp tools not found after installation: {result.stderr}")
-                return False
-            
-            logger.info(f"✓ linuxptp tools verified: {result.stdout.strip()}")
-            
-            # Step 6: Create systemd service files
-            logger.info("Creating systemd service files for ptp4l and phc2sys...")
-            if not self._create_ptp_systemd_services(ssh_manager, connection):
-                logger.error("Failed to create systemd service files")
-                return False
-            
-            logger.info("✓ Systemd service files created")
-            return True
-                
         except Exception as e:
-            logger.error(f"Failed to build linuxptp from source: {e}")
+            logger.warning(f"Could not push cached linuxptp binaries: {e}")
+            return False
+        
+        if not result.success:
+            logger.warning("Could not install cached linuxptp binaries: %s", result.stderr)
             return False
+        return True
     
     def _create_ptp_systemd_services(
         self,
@@ -1243,18 +1943,6 @@ RestartSec=5
 WantedBy=multi-user.target
 """
             
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo tee /etc/systemd/system/ptp4l.service > /dev/null <<'EOF'\n{ptp4l_service}EOF",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"Failed to create ptp4l.service: {result.stderr}")
-                return False
-            
-            logger.info("✓ Created /etc/systemd/system/ptp4l.service")
-            
             # Create phc2sys systemd service file
             phc2sys_service = """[Unit]
 Description=Synchronize system clock to PTP Hardware Clock (PHC)
@@ -1272,30 +1960,36 @@ RestartSec=5
 WantedBy=multi-user.target
 """
             
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo tee /etc/systemd/system/phc2sys.service > /dev/null <<'EOF'\n{phc2sys_service}EOF",
-                timeout=30
-            )
-            
-            if not result.success:
-                logger.error(f"Failed to create phc2sys.service: {result.stderr}")
-                return False
-            
-            logger.info("✓ Created /etc/systemd/system/phc2sys.service")
+            # Upload both unit files over SFTP (as the SSH user, so to /tmp)
+            for name, unit in (("ptp4l", ptp4l_service), ("phc2sys", phc2sys_service)):
+                try:
+                    ssh_manager.upload_file(
+                        connection,
+                        unit.encode(),
+                        f"/tmp/{name}.service"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to create {name}.service: {e}")
+                    return False
             
-            # Reload systemd to pick up new service files
-            logger.info("Reloading systemd daemon...")
+            # Copy them into place and reload systemd to pick them up. install
+            # (unlike mv) creates new files, so they get root ownership and the
+            # SELinux context of /etc/systemd/system instead of /tmp's label
+            logger.info("Installing service files and reloading systemd daemon...")
             result = ssh_manager.execute_command(
                 connection,
+                "sudo install -m 0644 -o root -g root /tmp/ptp4l.service /tmp/phc2sys.service /etc/systemd/system/ && "
+                "rm -f /tmp/ptp4l.service /tmp/phc2sys.service && "
                 "sudo systemctl daemon-reload",
                 timeout=30
             )
             
             if not result.success:
-                logger.error(f"Failed to reload systemd: {result.stderr}")
+                logger.error("Failed to install service files: %s", result.stderr)
                 return False
             
+            logger.info("✓ Created /etc/systemd/system/ptp4l.service")
+            logger.info("✓ Created /etc/systemd/system/phc2sys.service")
             logger.info("✓ Systemd daemon reloaded")
             return True
             
@@ -1306,7 +2000,8 @@ WantedBy=multi-user.target
     def check_hardware_timestamping_state(
         self,
         ssh_manager: SSHManager,
-        connection: SSHClient
+        connection: SSHClient,
+        pci_addr: Optional[str] = None
     ) -> tuple[bool, str]:
         """Check the current hardware packet timestamping state via sysfs.
         
@@ -1316,6 +2011,8 @@ WantedBy=multi-user.target
         Args:
             ssh_manager: SSHManager instance for command execution
             connection: Active SSH connection to the instance
+            pci_addr: PCI address of the ENA device, if already known;
+                looked up (once per connection) otherwise
             
         Returns:
             Tuple of (is_enabled, diagnostic_info)
@@ -1323,18 +2020,13 @@ WantedBy=multi-user.target
         logger.info("Checking hardware packet timestamping state...")
         
         try:
-            # Find PCI address of ENA device
-            result = ssh_manager.execute_command(
-                connection,
-                "lspci -D | grep -i ethernet | awk '{print $1}'",
-                timeout=30
-            )
+            if pci_addr is None:
+                # Find PCI address of ENA device
+                pci_addr = self._get_ena_pci_address(ssh_manager, connection)
             
-            if not result.success or not result.stdout.strip():
+            if not pci_addr:
                 logger.warning("Could not find PCI address of ENA device")
                 return False, "PCI address not found"
-            
-            pci_addr = result.stdout.strip()
             logger.info(f"Found ENA device at PCI address: {pci_addr}")
             
             # Check if sysfs attribute exists
@@ -1347,8 +2039,9 @@ WantedBy=multi-user.target
             
             if not result.success:
                 logger.warning(
-                    f"Could not read hw_packet_timestamping_state from sysfs. "
-                    f"This may be normal on some kernel versions. Output: {result.stdout}"
+                    "Could not read hw_packet_timestamping_state from sysfs. "
+                    "This may be normal on some kernel versions. Output: %s",
+                    result.stdout
                 )
                 return False, f"sysfs attribute not available: {result.stdout}"
             
@@ -1363,7 +2056,7 @@ WantedBy=multi-user.target
             return is_enabled, f"State: {state} (0=disabled, 1=enabled)"
             
         except Exception as e:
-            logger.warning(f"Error checking hardware timestamping state: {e}")
+            logger.warning("Error checking hardware timestamping state: %s", e)
             return False, f"Error: {str(e)}"
     
     def enable_hardware_timestamping(
@@ -1392,42 +2085,54 @@ WantedBy=multi-user.target
         Returns:
             True if hardware timestamping enabled successfully, False otherwise
         """
-        logger.info(f"Enabling hardware timestamping on {interface}...")
+        logger.info("Enabling hardware timestamping on %s...", interface)
         
         try:
+            # Steps 1-3 only read state, so their probes (plus the ENA
+            # PCI address for step 3, and whether this ethtool has
+            # --set-phc-hwts for step 4) go out as one batch
+            timestamping_cmd = f"sudo ethtool -T {interface}"
+            lspci_cmd = "lspci -D"
+            ethtool_help_cmd = "ethtool --help 2>&1"
+            pci_addr = self._get_detected(connection, 'pci_address')
+            has_set_phc_hwts = self._get_detected(connection, 'ethtool_set_phc_hwts')
+            commands = [(timestamping_cmd, 30), (_CLOCK_NAMES_CMD, 30)]
+            if pci_addr is None:
+                commands.append((lspci_cmd, 30))
+            if has_set_phc_hwts is None:
+                commands.append((ethtool_help_cmd, 30))
+            results = ssh_manager.execute_batch(connection, commands)
+            if pci_addr is None:
+                pci_addr = self._pci_address_from_lspci(connection, results[lspci_cmd])
+            if has_set_phc_hwts is None:
+                has_set_phc_hwts = '--set-phc-hwts' in results[ethtool_help_cmd].stdout
+                self._set_detected(connection, 'ethtool_set_phc_hwts', has_set_phc_hwts)
+            
             # Step 1: Check if the interface supports hardware timestamping
-            logger.info(f"[STEP 1] Checking if {interface} supports hardware timestamping...")
-            result = ssh_manager.execute_command(
-                connection,
-                f"sudo ethtool -T {interface}",
-                timeout=30
-            )
+            logger.info("[STEP 1] Checking if %s supports hardware timestamping...", interface)
+            result = results[timestamping_cmd]
             
             if not result.success:
                 logger.error(
-                    f"Failed to query timestamping capabilities: {result.stderr}"
+                    "Failed to query timestamping capabilities: %s", result.stderr
                 )
                 return False
             
             # Check if hardware timestamping is supported
             if "hardware-transmit" not in result.stdout and "PTP Hardware Clock" not in result.stdout:
                 logger.error(
-                    f"Interface {interface} does not support hardware timestamping. "
-                    f"Output: {result.stdout}"
+                    "Interface %s does not support hardware timestamping. Output: %s",
+                    interface, result.stdout
                 )
                 return False
             
-            logger.info(f"✓ Interface {interface} supports hardware timestamping")
+            logger.info("✓ Interface %s supports hardware timestamping", interface)
             
             # Step 2: Check if ENA PTP hardware clock device exists via sysfs
             logger.info("[STEP 2] Checking for ENA PTP hardware clock device...")
-            result = ssh_manager.execute_command(
-                connection,
-                "for file in /sys/class/ptp/*/clock_name; do echo -n \"$file: \"; cat \"$file\" 2>/dev/null; done 2>/dev/null",
-                timeout=30
-            )
+            result = results[_CLOCK_NAMES_CMD]
             
-            if "ena-ptp" not in result.stdout:
+            if not _ENA_PTP_RE.search(result.stdout):
                 logger.error(
                     "No ENA PTP hardware clock device found. The ENA driver may not have "
                     "created the PTP device. This could indicate:\n"
@@ -1437,55 +2142,48 @@ WantedBy=multi-user.target
                 )
                 return False
             
-            logger.info(f"✓ ENA PTP hardware clock device found: {result.stdout.strip()}")
+            logger.info("✓ ENA PTP hardware clock device found: %s", result.stdout.strip())
             
             # Step 3: Check current hardware packet timestamping state (before enabling)
             logger.info("[STEP 3] Checking current hardware timestamping state...")
             is_enabled_before, state_info_before = self.check_hardware_timestamping_state(
                 ssh_manager,
-                connection
+                connection,
+                pci_addr
             )
             
-            logger.info(f"Hardware timestamping state BEFORE enablement: {state_info_before}")
+            logger.info("Hardware timestamping state BEFORE enablement: %s", state_info_before)
             
             if is_enabled_before:
                 logger.info("✓ Hardware timestamping is already enabled")
                 return True
             
-            # Step 4: ACTUALLY ENABLE hardware timestamping using ethtool
+            # Step 4: ACTUALLY ENABLE hardware timestamping using ethtool,
+            # with whichever option this ethtool version has
             logger.info("[STEP 4] Enabling hardware timestamping using ethtool...")
-            logger.info(f"Executing: sudo ethtool --set-phc-hwts {interface} on")
+            if has_set_phc_hwts:
+                enable_cmd = f"sudo ethtool --set-phc-hwts {interface} on"
+            else:
+                logger.info("ethtool has no --set-phc-hwts option, using ethtool -s instead")
+                enable_cmd = f"sudo ethtool -s {interface} phc_hwts on"
+            logger.info(f"Executing: {enable_cmd}")
             
             result = ssh_manager.execute_command(
                 connection,
-                f"sudo ethtool --set-phc-hwts {interface} on",
+                enable_cmd,
                 timeout=30
             )
             
             if not result.success:
                 logger.error(
-                    f"Failed to enable hardware timestamping: {result.stderr}\n"
-                    f"This could indicate:\n"
-                    f"1. ethtool version doesn't support --set-phc-hwts option\n"
-                    f"2. The ENA driver doesn't support this operation\n"
-                    f"3. Insufficient permissions\n"
-                    f"Attempting alternative method..."
-                )
-                
-                # Try alternative: use ethtool -s to set timestamping
-                logger.info("Trying alternative method: ethtool -s...")
-                result = ssh_manager.execute_command(
-                    connection,
-                    f"sudo ethtool -s {interface} phc_hwts on",
-                    timeout=30
+                    "Failed to enable hardware timestamping: %s\n"
+                    "This could indicate:\n"
+                    "1. The ENA driver doesn't support this operation\n"
+                    "2. Insufficient permissions\n"
+                    "Hardware timestamping enablement failed. ptp4l may not work correctly.",
+                    result.stderr
                 )
-                
-                if not result.success:
-                    logger.error(
-                        f"Alternative method also failed: {result.stderr}\n"
-                        f"Hardware timestamping enablement failed. ptp4l may not work correctly."
-                    )
-                    return False
+                return False
             
             logger.info("✓ Hardware timestamping enablement command executed")
             
@@ -1495,10 +2193,11 @@ WantedBy=multi-user.target
             
             is_enabled_after, state_info_after = self.check_hardware_timestamping_state(
                 ssh_manager,
-                connection
+                connection,
+                pci_addr
             )
             
-            logger.info(f"Hardware timestamping state AFTER enablement: {state_info_after}")
+            logger.info("Hardware timestamping state AFTER enablement: %s", state_info_after)
             
             if not is_enabled_after:
                 logger.warning(
@@ -1521,12 +2220,12 @@ WantedBy=multi-user.target
             )
             
             if result.success:
-                logger.info(f"ethtool -T {interface} output:\n{result.stdout}")
+                logger.info("ethtool -T %s output:\n%s", interface, result.stdout)
             
             return True
                 
         except Exception as e:
-            logger.error(f"Hardware timestamping enablement failed with exception: {e}")
+            logger.error("Hardware timestamping enablement failed with exception: %s", e)
             return False
     
     def configure_ptp4l(
@@ -1564,16 +2263,14 @@ delay_mechanism E2E
 """
             
             # Write configuration file
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 f"sudo tee /etc/ptp4l.conf > /dev/null <<'EOF'\n{ptp4l_config}EOF",
+                "create ptp4l.conf",
                 timeout=30
             )
             
-            if not result.success:
-                logger.error(f"Failed to create ptp4l.conf: {result.stderr}")
-                return False
-            
             logger.info("Created /etc/ptp4l.conf")
             
             # Start and enable ptp4l service
@@ -1582,16 +2279,14 @@ delay_mechanism E2E
                 "Note: ptp4l will enable hardware packet timestamping via HWTSTAMP ioctl. "
                 "This causes a momentary network disruption."
             )
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 "sudo systemctl start ptp4l && sudo systemctl enable ptp4l",
+                "start ptp4l service",
                 timeout=60
             )
             
-            if not result.success:
-                logger.error(f"Failed to start ptp4l service: {result.stderr}")
-                return False
-            
             logger.info("ptp4l service started and enabled")
             
             # Wait a moment for ptp4l to enable hardware timestamping
@@ -1613,6 +2308,9 @@ delay_mechanism E2E
             
             return True
             
+        except _StepFailed as e:
+            logger.error(str(e))
+            return False
         except Exception as e:
             logger.error(f"ptp4l configuration failed: {e}")
             return False
@@ -1641,44 +2339,41 @@ delay_mechanism E2E
             phc2sys_config = 'OPTIONS="-a -r -r"'
             
             # Ensure /etc/sysconfig directory exists
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 "sudo mkdir -p /etc/sysconfig",
+                "create /etc/sysconfig directory",
                 timeout=30
             )
             
-            if not result.success:
-                logger.error(f"Failed to create /etc/sysconfig directory: {result.stderr}")
-                return False
-            
             # Write configuration file
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 f"sudo tee /etc/sysconfig/phc2sys > /dev/null <<'EOF'\n{phc2sys_config}\nEOF",
+                "create phc2sys config",
                 timeout=30
             )
             
-            if not result.success:
-                logger.error(f"Failed to create phc2sys config: {result.stderr}")
-                return False
-            
             logger.info("Created /etc/sysconfig/phc2sys")
             
             # Start and enable phc2sys service
             logger.info("Starting phc2sys service...")
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 "sudo systemctl start phc2sys && sudo systemctl enable phc2sys",
+                "start phc2sys service",
                 timeout=60
             )
             
-            if not result.success:
-                logger.error(f"Failed to start phc2sys service: {result.stderr}")
-                return False
-            
             logger.info("phc2sys service started and enabled")
             return True
             
+        except _StepFailed as e:
+            logger.error(str(e))
+            return False
         except Exception as e:
             logger.error(f"phc2sys configuration failed: {e}")
             return False
@@ -1722,29 +2417,25 @@ delay_mechanism E2E
             
             # Add udev rule
             udev_rule = 'SUBSYSTEM=="ptp", ATTR{clock_name}=="ena-ptp-*", SYMLINK += "ptp_ena"'
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 f'echo \'{udev_rule}\' | sudo tee -a /etc/udev/rules.d/53-ec2-network-interfaces.rules',
+                "add udev rule",
                 timeout=30
             )
             
-            if not result.success:
-                logger.error(f"Failed to add udev rule: {result.stderr}")
-                return False
-            
             logger.info("✓ Added udev rule for /dev/ptp_ena")
             
             # Reload udev rules
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 "sudo udevadm control --reload-rules && sudo udevadm trigger",
+                "reload udev rules",
                 timeout=30
             )
             
-            if not result.success:
-                logger.error(f"Failed to reload udev rules: {result.stderr}")
-                return False
-            
             logger.info("✓ Reloaded udev rules")
             
             # Wait a moment for symlink creation
@@ -1758,12 +2449,15 @@ delay_mechanism E2E
             )
             
             if result.success and "/dev/ptp_ena" in result.stdout:
-                logger.info(f"✓ /dev/ptp_ena symlink created successfully: {result.stdout.strip()}")
+                logger.info("✓ /dev/ptp_ena symlink created successfully: %s", result.stdout.strip())
                 return True
             else:
                 logger.warning("Symlink creation may have failed, but continuing...")
                 return False
                 
+        except _StepFailed as e:
+            logger.error(str(e))
+            return False
         except Exception as e:
             logger.error(f"Failed to create /dev/ptp_ena symlink: {e}")
             return False
@@ -1816,30 +2510,26 @@ delay_mechanism E2E
             else:
                 # Add PHC refclock line
                 phc_line = f"refclock PHC {ptp_device} poll 0 delay 0.000010 prefer"
-                result = ssh_manager.execute_command(
+                self._exec_or_fail(
+                    ssh_manager,
                     connection,
                     f"echo '{phc_line}' | sudo tee -a /etc/chrony.conf",
+                    "add PHC refclock to chrony.conf",
                     timeout=30
                 )
                 
-                if not result.success:
-                    logger.error(f"Failed to add PHC refclock to chrony.conf: {result.stderr}")
-                    return False
-                
                 logger.info(f"✓ Added PHC refclock line to chrony.conf: {phc_line}")
             
             # Restart chronyd service
             logger.info("Restarting chronyd service...")
-            result = ssh_manager.execute_command(
+            self._exec_or_fail(
+                ssh_manager,
                 connection,
                 "sudo systemctl restart chronyd",
+                "restart chronyd service",
                 timeout=60
             )
             
-            if not result.success:
-                logger.error(f"Failed to restart chronyd service: {result.stderr}")
-                return False
-            
             logger.info("✓ chronyd service restarted")
             
             # Wait for chrony to stabilize
@@ -1847,6 +2537,9 @@ delay_mechanism E2E
             
             return True
             
+        except _StepFailed as e:
+            logger.error(str(e))
+            return False
         except Exception as e:
             logger.error(f"chrony configuration failed: {e}")
             return False
@@ -1900,12 +2593,13 @@ delay_mechanism E2E
         logger.info("Checking for ENA PTP hardware clock devices...")
         result = ssh_manager.execute_command(
             connection,
-            "for file in /sys/class/ptp/*/clock_name; do echo -n \"$file: \"; cat \"$file\" 2>/dev/null; done 2>/dev/null",
+            _CLOCK_NAMES_CMD,
             timeout=30
         )
         diagnostic_output['ptp_devices'] = result.stdout
         
-        hardware_clock_present = result.success and 'ena-ptp' in result.stdout
+        ena_clock = _ENA_PTP_RE.search(result.stdout) if result.success else None
+        hardware_clock_present = ena_clock is not None
         clock_device = None
         
         if hardware_clock_present:
@@ -1920,13 +2614,10 @@ delay_mechanism E2E
                 clock_device = "/dev/ptp_ena"
                 logger.info(f"Using /dev/ptp_ena symlink for consistent device naming")
             else:
-                # Fall back to extracting PTP index from sysfs path
-                match = re.search(r'/sys/class/ptp/(ptp\d+)/clock_name', result.stdout)
-                if match:
-                    ptp_index = match.group(1)
-                    clock_device = f"/dev/{ptp_index}"
-                    logger.info(f"Found ENA PTP hardware clock device: {clock_device}")
-                    logger.info(f"Note: /dev/ptp_ena symlink not found. Consider using latest AL2023 AMI with udev rule.")
+                # Fall back to the ENA clock's PTP index from its sysfs path
+                clock_device = f"/dev/{ena_clock.group(1)}"
+                logger.info(f"Found ENA PTP hardware clock device: {clock_device}")
+                logger.info(f"Note: /dev/ptp_ena symlink not found. Consider using latest AL2023 AMI with udev rule.")
         else:
             logger.warning("No ENA PTP hardware clock devices found")
         
@@ -1936,7 +2627,7 @@ delay_mechanism E2E
         diagnostic_output['detected_interface'] = interface
         
         # Check hardware timestamping status
-        logger.info(f"Checking hardware timestamping status on {interface}...")
+        logger.info("Checking hardware timestamping status on %s...", interface)
         result = ssh_manager.execute_command(
             connection,
             f"sudo ethtool -T {interface} 2>&1",
@@ -2081,47 +2772,50 @@ delay_mechanism E2E
         diagnostics = {}
         success = True
         
+        # Run all probes as one combined script; the ethtool probe needs the
+        # interface name, so it joins the batch only when that is known
+        ptp_devices_cmd = "ls -la /dev/ptp* 2>&1"
+        ptp_sysfs_cmd = _CLOCK_NAMES_CMD
+        phc_enable_cmd = "cat /sys/module/ena/parameters/phc_enable 2>&1"
+        interface_cmd = "ip -o link show"
+        interface = self._get_detected(connection, 'interface')
+        commands = [(ptp_devices_cmd, 30), (ptp_sysfs_cmd, 30), (phc_enable_cmd, 30)]
+        if interface is not None:
+            timestamping_cmd = f"sudo ethtool -T {interface} 2>&1"
+            commands.append((timestamping_cmd, 30))
+        else:
+            commands.append((interface_cmd, 30))
+        results = ssh_manager.execute_batch(connection, commands)
+        
         # Check 1: Verify /dev/ptp* devices exist
         logger.info("\n[CHECK 1] Verifying /dev/ptp* devices...")
-        result = ssh_manager.execute_command(
-            connection,
-            "ls -la /dev/ptp* 2>&1",
-            timeout=30
-        )
+        result = results[ptp_devices_cmd]
         
         diagnostics['ptp_devices'] = result.stdout
         ptp_device_exists = result.success and '/dev/ptp' in result.stdout
         
         if ptp_device_exists:
-            logger.info(f"[CHECK 1] ✓ PTP device exists:\n{result.stdout}")
+            logger.info("[CHECK 1] ✓ PTP device exists:\n%s", result.stdout)
         else:
-            logger.error(f"[CHECK 1] ✗ No PTP devices found:\n{result.stdout}")
+            logger.error("[CHECK 1] ✗ No PTP devices found:\n%s", result.stdout)
             success = False
         
         # Check 2: Verify ENA PTP clock in sysfs
         logger.info("\n[CHECK 2] Verifying ENA PTP clock in sysfs...")
-        result = ssh_manager.execute_command(
-            connection,
-            "for f in /sys/class/ptp/*/clock_name; do [ -f \"$f\" ] && echo \"$f: $(cat $f)\"; done 2>&1",
-            timeout=30
-        )
+        result = results[ptp_sysfs_cmd]
         
         diagnostics['ptp_sysfs'] = result.stdout
-        ena_ptp_exists = 'ena-ptp' in result.stdout
+        ena_ptp_exists = _ENA_PTP_RE.search(result.stdout) is not None
         
         if ena_ptp_exists:
-            logger.info(f"[CHECK 2] ✓ ENA PTP clock registered:\n{result.stdout}")
+            logger.info("[CHECK 2] ✓ ENA PTP clock registered:\n%s", result.stdout)
         else:
-            logger.error(f"[CHECK 2] ✗ ENA PTP clock not found in sysfs:\n{result.stdout}")
+            logger.error("[CHECK 2] ✗ ENA PTP clock not found in sysfs:\n%s", result.stdout)
             success = False
         
         # Check 3: Verify phc_enable parameter
         logger.info("\n[CHECK 3] Verifying phc_enable parameter...")
-        result = ssh_manager.execute_command(
-            connection,
-            "cat /sys/module/ena/parameters/phc_enable 2>&1",
-            timeout=30
-        )
+        result = results[phc_enable_cmd]
         
         diagnostics['phc_enable_value'] = result.stdout.strip()
         phc_enabled = result.success and result.stdout.strip() == '1'
@@ -2129,25 +2823,29 @@ delay_mechanism E2E
         if phc_enabled:
             logger.info(f"[CHECK 3] ✓ phc_enable parameter is set to 1")
         else:
-            logger.warning(f"[CHECK 3] ⚠️  phc_enable parameter value: {result.stdout.strip()}")
+            logger.warning("[CHECK 3] ⚠️  phc_enable parameter value: %s", result.stdout.strip())
             # Don't fail on this - parameter might not exist on some driver versions
         
         # Check 4: Verify hardware timestamping capabilities
         logger.info("\n[CHECK 4] Verifying hardware timestamping capabilities...")
-        interface = self.get_primary_network_interface(ssh_manager, connection)
-        result = ssh_manager.execute_command(
-            connection,
-            f"sudo ethtool -T {interface} 2>&1 | grep -E 'PTP Hardware Clock|Transmit Timestamp'",
-            timeout=30
-        )
+        if interface is not None:
+            result = results[timestamping_cmd]
+        else:
+            interface = self._interface_from_link_output(connection, results[interface_cmd])
+            result = ssh_manager.execute_command(
+                connection,
+                f"sudo ethtool -T {interface} 2>&1",
+                timeout=30
+            )
         
-        diagnostics['hardware_timestamping'] = result.stdout
-        has_hw_ts = 'PTP Hardware Clock' in result.stdout or 'hardware-transmit' in result.stdout
+        timestamping = _timestamping_lines(result.stdout)
+        diagnostics['hardware_timestamping'] = timestamping
+        has_hw_ts = 'PTP Hardware Clock' in timestamping or 'hardware-transmit' in timestamping
         
         if has_hw_ts:
-            logger.info(f"[CHECK 4] ✓ Hardware timestamping capabilities present:\n{result.stdout}")
+            logger.info("[CHECK 4] ✓ Hardware timestamping capabilities present:\n%s", timestamping)
         else:
-            logger.warning(f"[CHECK 4] ⚠️  Hardware timestamping status:\n{result.stdout}")
+            logger.warning("[CHECK 4] ⚠️  Hardware timestamping status:\n%s", timestamping)
         
         # Summary
         logger.info("\n" + "=" * 80)
@@ -2196,7 +2894,7 @@ delay_mechanism E2E
             logger.info("=" * 80)
             logger.info("DRIVER RELOAD DIAGNOSTICS FROM /tmp/ena_driver_reload.log")
             logger.info("=" * 80)
-            logger.info(result.stdout)
+            logger.info("%s", result.stdout)
             logger.info("=" * 80)
             
             # Also check for the PHC reload log (from enable_ena_phc method)
@@ -2210,7 +2908,7 @@ delay_mechanism E2E
                 logger.info("=" * 80)
                 logger.info("PHC RELOAD DIAGNOSTICS FROM /tmp/ena_phc_reload.log")
                 logger.info("=" * 80)
-                logger.info(result2.stdout)
+                logger.info("%s", result2.stdout)
                 logger.info("=" * 80)
                 return result.stdout + "\n\n" + result2.stdout
             
@@ -2229,7 +2927,7 @@ delay_mechanism E2E
                 logger.info("=" * 80)
                 logger.info("PHC RELOAD DIAGNOSTICS FROM /tmp/ena_phc_reload.log")
                 logger.info("=" * 80)
-                logger.info(result.stdout)
+                logger.info("%s", result.stdout)
                 logger.info("=" * 80)
                 return result.stdout
             
@@ -2272,17 +2970,11 @@ delay_mechanism E2E
         
         # Check 1: Kernel version
         logger.info("Checking kernel version...")
-        result = ssh_manager.execute_command(
-            connection,
-            "uname -r",
-            timeout=30
-        )
-        
-        kernel_version = result.stdout.strip() if result.success else "Unknown"
+        kernel_version = self._get_kernel_version(ssh_manager, connection)
         troubleshooting_results['checks'].append({
             'name': 'Kernel Version',
-            'status': 'pass' if result.success else 'fail',
-            'value': kernel_version,
+            'status': 'pass' if kernel_version else 'fail',
+            'value': kernel_version or "Unknown",
             'details': 'Kernel version detected'
         })
         
@@ -2335,7 +3027,7 @@ delay_mechanism E2E
                             'details': f"Module {module} is available (modprobe succeeded)"
                         })
                 else:
-                    logger.warning(f"Failed to load module {module}: {load_result.stderr}")
+                    logger.warning("Failed to load module %s: %s", module, load_result.stderr)
                     troubleshooting_results['checks'].append({
                         'name': f'Kernel Module: {module}',
                         'status': 'fail',
@@ -2418,19 +3110,13 @@ delay_mechanism E2E
         logger.info("Checking ENA PTP sysfs entries...")
         result = ssh_manager.execute_command(
             connection,
-            "for file in /sys/class/ptp/*/clock_name; do echo -n \"$file: \"; cat \"$file\" 2>/dev/null; done 2>/dev/null",
+            _CLOCK_NAMES_CMD,
             timeout=30
         )
         
-        ena_ptp_found = 'ena-ptp' in result.stdout
-        ptp_index = None
-        
-        if ena_ptp_found:
-            # Extract PTP index from sysfs path
-            import re
-            match = re.search(r'/sys/class/ptp/(ptp\d+)/clock_name', result.stdout)
-            if match:
-                ptp_index = match.group(1)
+        ena_clock = _ENA_PTP_RE.search(result.stdout)
+        ena_ptp_found = ena_clock is not None
+        ptp_index = ena_clock.group(1) if ena_clock else None
         
         troubleshooting_results['checks'].append({
             'name': 'ENA PTP Sysfs Entry',
@@ -2728,7 +3414,7 @@ delay_mechanism E2E
                                     'details': f'Hardware timestamping was disabled but has been enabled automatically'
                                 })
                             else:
-                                logger.warning(f"Failed to enable hardware timestamping, state is still: {new_state}")
+                                logger.warning("Failed to enable hardware timestamping, state is still: %s", new_state)
                                 troubleshooting_results['checks'].append({
                                     'name': 'ENA Hardware Packet Timestamping State',
                                     'status': 'fail',
@@ -2747,7 +3433,7 @@ delay_mechanism E2E
                                 'details': 'Enable command succeeded but verification failed'
                             })
                     else:
-                        logger.warning(f"Failed to enable hardware timestamping: {enable_result.stderr}")
+                        logger.warning("Failed to enable hardware timestamping: %s", enable_result.stderr)
                         troubleshooting_results['checks'].append({
                             'name': 'ENA Hardware Packet Timestamping State',
                             'status': 'fail',
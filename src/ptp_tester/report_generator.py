@@ -188,16 +188,44 @@ class ReportGenerator:
         lines.append("=" * 70)
         return "\n".join(lines)
     
+    def generate_all(self, results: List[TestResult]) -> str:
+        """
+        Generate every instance report followed by the summary report.
+        
+        Args:
+            results: List of TestResult objects from all tests
+            
+        Returns:
+            Instance reports and the summary, separated by blank lines
+        """
+        reports = [self.generate_instance_report(result) for result in results]
+        reports.append(self.generate_summary_report(results))
+        return "\n\n".join(reports)
+    
     def export_json(self, results: List[TestResult], filepath: str) -> None:
         """
         Export test results to JSON file.
         
+        Uses orjson when it is installed (pip install orjson), falling back
+        to the standard library json module otherwise.
+        
         Args:
             results: List of TestResult objects
             filepath: Path to output JSON file
         """
         data = self._results_to_dict(results)
         
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
+        if orjson is not None:
+            # Serialize in C and write the bytes directly
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+            return
+        
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=2, default=str)
     
@@ -1,12 +1,21 @@
 """SSH Manager for connecting to and executing commands on EC2 instances."""
 
+import functools
+import io
 import os
+import select
+import socket
 import stat
 import time
+import uuid
 import logging
-from typing import Optional
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import paramiko
-from paramiko import SSHClient, AutoAddPolicy, RSAKey, Ed25519Key, ECDSAKey
+from paramiko import SSHClient, SFTPClient, AutoAddPolicy, RSAKey, Ed25519Key, ECDSAKey, Channel
 from paramiko.ssh_exception import (
     SSHException,
     AuthenticationException,
@@ -19,6 +28,143 @@ from ptp_tester.models import CommandResult
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _local_addresses() -> frozenset:
+    """Return the IPv4 addresses this host's name resolves to (looked up once)."""
+    try:
+        return frozenset(socket.gethostbyname_ex(socket.gethostname())[2])
+    except OSError:
+        return frozenset()
+
+
+# sshd's default MaxSessions: channels one connection may have open at once
+DEFAULT_MAX_SESSIONS = 10
+
+# Seconds between SSH keepalives, so a connection dropped underneath us (e.g.
+# by an ENA driver reload) is noticed and evicted from the pool quickly
+_KEEPALIVE_INTERVAL = 30
+
+
+class SSHSessionPool:
+    """Pool of live SSH connections keyed by (host, username).
+    
+    Each pooled connection carries a semaphore capping its concurrently open
+    session channels at the server's MaxSessions, so parallel commands queue
+    locally instead of being refused by sshd. Paramiko channels are single
+    use, so channels are opened per command on the pooled transport; the
+    connection itself (TCP + key exchange + auth) is what gets reused.
+    Least recently used connections are closed once max_connections is
+    exceeded.
+    """
+    
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_connections: int = 32
+    ):
+        """Initialize an empty pool.
+        
+        Args:
+            max_sessions: Concurrent channels allowed per connection (default: 10)
+            max_connections: Connections kept before LRU eviction (default: 32)
+        """
+        self.max_sessions = max_sessions
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        # (host, username) -> (client, channel semaphore), oldest first
+        self._connections = OrderedDict()
+    
+    def get(self, host: str, username: str) -> Optional[SSHClient]:
+        """Return the pooled connection for (host, username) if it is still alive.
+        
+        Args:
+            host: Hostname or IP address
+            username: SSH username
+            
+        Returns:
+            Live SSHClient, or None if none is pooled
+        """
+        key = (host, username)
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is None:
+                return None
+            client = entry[0]
+            transport = client.get_transport()
+            if transport is None or not transport.is_active():
+                # Dead transport (e.g. the ENA driver was reloaded); drop it
+                del self._connections[key]
+                return None
+            self._connections.move_to_end(key)
+            return client
+    
+    def add(self, host: str, username: str, client: SSHClient) -> None:
+        """Add a connection to the pool, evicting the least recently used.
+        
+        Args:
+            host: Hostname or IP address
+            username: SSH username
+            client: Connected SSHClient instance
+        """
+        evicted = []
+        with self._lock:
+            key = (host, username)
+            self._connections[key] = (
+                client, threading.BoundedSemaphore(self.max_sessions)
+            )
+            self._connections.move_to_end(key)
+            while len(self._connections) > self.max_connections:
+                evicted.append(self._connections.popitem(last=False)[1][0])
+        
+        for old_client in evicted:
+            logger.debug("Evicting least recently used SSH connection from pool")
+            old_client.close()
+    
+    def remove(self, client: SSHClient) -> None:
+        """Forget a connection without closing it.
+        
+        Args:
+            client: SSHClient instance to remove
+        """
+        with self._lock:
+            for key, (pooled_client, _) in list(self._connections.items()):
+                if pooled_client is client:
+                    del self._connections[key]
+    
+    @contextmanager
+    def session(self, client: SSHClient, timeout: Optional[float] = None) -> Iterator[Channel]:
+        """Open a session channel on a connection, within its MaxSessions cap.
+        
+        Args:
+            client: Connected SSHClient instance (pooled or not)
+            timeout: Timeout for opening the channel in seconds
+            
+        Yields:
+            Open session channel; it is closed on exit
+        """
+        semaphore = None
+        with self._lock:
+            for pooled_client, pooled_semaphore in self._connections.values():
+                if pooled_client is client:
+                    semaphore = pooled_semaphore
+                    break
+        
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            transport = client.get_transport()
+            if transport is None or not transport.is_active():
+                raise SSHException("SSH connection is not active")
+            channel = transport.open_session(timeout=timeout)
+            try:
+                yield channel
+            finally:
+                channel.close()
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+
 class SSHManager:
     """Manages SSH connections and command execution on remote instances.
     
@@ -26,6 +172,8 @@ class SSHManager:
     - SSH connection with private key authentication
     - Private key file permission validation
     - Connection retry logic with exponential backoff
+    - Connection reuse through an SSHSessionPool, with keepalives so dead
+      connections are detected
     - Command execution with timeout handling
     - Secure key management (never logs or displays private key contents)
     """
@@ -43,6 +191,9 @@ class SSHManager:
         self.private_key_path = private_key_path
         self._validate_key_file()
         self._private_key = None
+        self._session_pool = SSHSessionPool()
+        # One SFTP session per connection, opened on first upload
+        self._sftp_clients = weakref.WeakKeyDictionary()
         
     def _validate_key_file(self) -> None:
         """Validate private key file exists and has appropriate permissions.
@@ -83,19 +234,22 @@ class SSHManager:
         Raises:
             SSHException: If key cannot be loaded
         """
-        if self._private_key is not None:
-            return self._private_key
+        # Read the attribute once: a concurrent disconnect() may clear it
+        private_key = self._private_key
+        if private_key is not None:
+            return private_key
         
         # Try different key types
         key_types = [RSAKey, Ed25519Key, ECDSAKey]
         
         for key_class in key_types:
             try:
-                self._private_key = key_class.from_private_key_file(
+                private_key = key_class.from_private_key_file(
                     self.private_key_path
                 )
+                self._private_key = private_key
                 logger.debug(f"Successfully loaded {key_class.__name__} private key")
-                return self._private_key
+                return private_key
             except Exception:
                 continue
         
@@ -118,12 +272,15 @@ class SSHManager:
         port: int = 22,
         timeout: int = 30,
         max_retries: int = 3,
-        initial_backoff: float = 5.0
+        initial_backoff: float = 5.0,
+        quiet: bool = False
     ) -> SSHClient:
         """Establish SSH connection to remote host with retry logic.
         
-        Uses exponential backoff for retries. Connection attempts will be made
-        with increasing delays: initial_backoff, initial_backoff*2, initial_backoff*4, etc.
+        Returns the pooled connection for (host, username) when it is still
+        alive. Otherwise uses exponential backoff for retries. Connection attempts
+        will be made with increasing delays: initial_backoff, initial_backoff*2,
+        initial_backoff*4, etc.
         
         Args:
             host: Hostname or IP address to connect to
@@ -132,6 +289,9 @@ class SSHManager:
             timeout: Connection timeout in seconds (default: 30)
             max_retries: Maximum number of connection attempts (default: 3)
             initial_backoff: Initial backoff delay in seconds (default: 5.0)
+            quiet: Log attempts and connection failures at DEBUG instead of
+                INFO/WARNING/ERROR, for callers polling a host that is
+                expected to be unreachable for a while (default: False)
             
         Returns:
             Connected SSHClient instance
@@ -140,6 +300,11 @@ class SSHManager:
             SSHException: If connection fails after all retries
             AuthenticationException: If authentication fails
         """
+        pooled_client = self._session_pool.get(host, username)
+        if pooled_client is not None:
+            logger.debug(f"Reusing pooled SSH connection to {username}@{host}")
+            return pooled_client
+        
         private_key = self._load_private_key()
         
         client = SSHClient()
@@ -147,10 +312,13 @@ class SSHManager:
         
         last_exception = None
         backoff = initial_backoff
+        log_attempt = logger.debug if quiet else logger.info
+        log_retry = logger.debug if quiet else logger.warning
+        log_failure = logger.debug if quiet else logger.error
         
         for attempt in range(max_retries):
             try:
-                logger.info(
+                log_attempt(
                     f"Attempting SSH connection to {username}@{host}:{port} "
                     f"(attempt {attempt + 1}/{max_retries})"
                 )
@@ -166,20 +334,22 @@ class SSHManager:
                 )
                 
                 logger.info(f"Successfully connected to {host}")
+                self._tune_transport(client)
+                self._session_pool.add(host, username, client)
                 return client
                 
             except (SSHException, NoValidConnectionsError, TimeoutError) as e:
                 last_exception = e
                 
                 if attempt < max_retries - 1:
-                    logger.warning(
+                    log_retry(
                         f"Connection attempt {attempt + 1} failed: {e}. "
                         f"Retrying in {backoff} seconds..."
                     )
                     time.sleep(backoff)
                     backoff *= 2  # Exponential backoff
                 else:
-                    logger.error(
+                    log_failure(
                         f"All {max_retries} connection attempts failed"
                     )
             
@@ -217,26 +387,118 @@ class SSHManager:
             TimeoutError: If command execution exceeds timeout
         """
         try:
-            logger.debug(f"Executing command: {command[:100]}...")  # Log first 100 chars
+            logger.debug("Executing command: %.100s...", command)  # Log first 100 chars
+            
+            # Open the channel through the pool so concurrent commands stay
+            # within the connection's MaxSessions limit
+            with self._session_pool.session(client, timeout=timeout) as channel:
+                channel.settimeout(timeout)
+                channel.exec_command(command)
+                stdout = channel.makefile('rb')
+                stderr = channel.makefile_stderr('rb')
+                
+                # Wait for command to complete and read output
+                exit_code = channel.recv_exit_status()
+                stdout_text = stdout.read().decode('utf-8', errors='replace')
+                stderr_text = stderr.read().decode('utf-8', errors='replace')
+            
+            success = (exit_code == 0)
+            
+            if success:
+                logger.debug("Command completed successfully (exit code: %d)", exit_code)
+            else:
+                logger.warning(
+                    "Command failed with exit code %d. stderr: %.200s",  # First 200 chars of error
+                    exit_code,
+                    stderr_text
+                )
             
-            stdin, stdout, stderr = client.exec_command(
-                command,
-                timeout=timeout
+            return CommandResult(
+                exit_code=exit_code,
+                stdout=stdout_text,
+                stderr=stderr_text,
+                success=success
             )
             
-            # Wait for command to complete and read output
-            exit_code = stdout.channel.recv_exit_status()
-            stdout_text = stdout.read().decode('utf-8', errors='replace')
-            stderr_text = stderr.read().decode('utf-8', errors='replace')
+        except Exception as e:
+            logger.error(f"Command execution failed: {e}")
+            raise SSHException(f"Failed to execute command: {e}")
+    
+    def execute_streaming(
+        self,
+        client: SSHClient,
+        command: str,
+        line_callback: Callable[[str], None],
+        timeout: int = 300
+    ) -> CommandResult:
+        """Execute a long-running command, passing on its output line by line.
+        
+        Unlike execute_command, stdout and stderr lines are handed to
+        line_callback as they arrive, so progress (or an early failure) is
+        visible before the command exits. The full output is still returned.
+        
+        Args:
+            client: Connected SSHClient instance
+            command: Command to execute
+            line_callback: Called with each output line (without newline)
+            timeout: Command execution timeout in seconds (default: 300)
+            
+        Returns:
+            CommandResult with exit code, stdout, stderr, and success status
+            
+        Raises:
+            SSHException: If command execution fails or exceeds timeout
+        """
+        try:
+            logger.debug("Executing streamed command: %.100s...", command)
+            
+            deadline = time.monotonic() + timeout
+            chunks = {False: [], True: []}  # keyed by is_stderr
+            partial_lines = {False: b"", True: b""}
+            
+            def receive(data: bytes, is_stderr: bool) -> None:
+                chunks[is_stderr].append(data)
+                lines = (partial_lines[is_stderr] + data).split(b"\n")
+                partial_lines[is_stderr] = lines.pop()
+                for line in lines:
+                    line_callback(line.decode('utf-8', errors='replace').rstrip('\r'))
             
+            with self._session_pool.session(client, timeout=timeout) as channel:
+                channel.exec_command(command)
+                
+                while True:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Command did not finish within {timeout} seconds")
+                    select.select([channel], [], [], 1.0)
+                    
+                    while channel.recv_ready():
+                        receive(channel.recv(32768), False)
+                    while channel.recv_stderr_ready():
+                        receive(channel.recv_stderr(32768), True)
+                    
+                    # Channel data arrives in order, so once the exit status
+                    # is in and nothing is buffered, all output has been read
+                    if (channel.exit_status_ready() and not channel.recv_ready()
+                            and not channel.recv_stderr_ready()):
+                        break
+                
+                exit_code = channel.recv_exit_status()
+            
+            for partial_line in partial_lines.values():
+                if partial_line:
+                    line_callback(partial_line.decode('utf-8', errors='replace'))
+            
+            stdout_text = b"".join(chunks[False]).decode('utf-8', errors='replace')
+            stderr_text = b"".join(chunks[True]).decode('utf-8', errors='replace')
             success = (exit_code == 0)
             
             if success:
-                logger.debug(f"Command completed successfully (exit code: {exit_code})")
+                logger.debug("Command completed successfully (exit code: %d)", exit_code)
             else:
                 logger.warning(
-                    f"Command failed with exit code {exit_code}. "
-                    f"stderr: {stderr_text[:200]}"  # Log first 200 chars of error
+                    "Command failed with exit code %d. stderr: %.200s",  # First 200 chars of error
+                    exit_code,
+                    stderr_text
                 )
             
             return CommandResult(
@@ -250,6 +512,180 @@ class SSHManager:
             logger.error(f"Command execution failed: {e}")
             raise SSHException(f"Failed to execute command: {e}")
     
+    def execute_batch(
+        self,
+        client: SSHClient,
+        commands: List[Tuple[str, int]]
+    ) -> Dict[str, CommandResult]:
+        """Execute several independent commands over a single SSH channel.
+        
+        The commands are joined into one shell script, each followed by a
+        sentinel line (on stdout and stderr) that carries its exit code, so
+        only one channel is opened for the whole batch. Output is split back
+        into one CommandResult per command.
+        
+        Args:
+            client: Connected SSHClient instance
+            commands: List of (command, timeout) tuples; the batch timeout is
+                the sum of the individual timeouts
+        
+        Returns:
+            Dict mapping each command string to its CommandResult, in the
+            order given. Commands that never reported an exit code (e.g. the
+            batch was cut short) get exit code -1.
+        
+        Raises:
+            SSHException: If command execution fails
+        """
+        sentinel = f"__SEP__{uuid.uuid4().hex}__"
+        script = "".join(
+            f"{command}\n"
+            f"__rc=$?; echo \"{sentinel}$__rc\"; echo \"{sentinel}$__rc\" >&2\n"
+            for command, _ in commands
+        )
+        timeout = sum(command_timeout for _, command_timeout in commands)
+        
+        result = self.execute_command(client, script, timeout=timeout)
+        
+        # Chunk 0 is the first command's output; each later chunk starts with
+        # the exit code of the command before it
+        stdout_chunks = result.stdout.split(sentinel)
+        stderr_chunks = result.stderr.split(sentinel)
+        
+        results = {}
+        for index, (command, _) in enumerate(commands):
+            exit_code = -1
+            if index + 1 < len(stdout_chunks):
+                code_text = stdout_chunks[index + 1].partition('\n')[0]
+                if code_text.isdigit():
+                    exit_code = int(code_text)
+            
+            if index < len(stdout_chunks):
+                stdout_text = stdout_chunks[index]
+                stdout_text = stdout_text if index == 0 else stdout_text.partition('\n')[2]
+            else:
+                stdout_text = ""
+            
+            if index < len(stderr_chunks):
+                stderr_text = stderr_chunks[index]
+                stderr_text = stderr_text if index == 0 else stderr_text.partition('\n')[2]
+            else:
+                stderr_text = ""
+            
+            results[command] = CommandResult(
+                exit_code=exit_code,
+                stdout=stdout_text,
+                stderr=stderr_text,
+                success=(exit_code == 0)
+            )
+        
+        return results
+    
+    def _get_sftp(self, client: SSHClient) -> SFTPClient:
+        """Return the cached SFTP session for a connection, opening it if needed.
+        
+        Args:
+            client: Connected SSHClient instance
+            
+        Returns:
+            Open SFTPClient on the connection's transport
+        """
+        sftp = self._sftp_clients.get(client)
+        if sftp is None or sftp.get_channel().closed:
+            sftp = client.open_sftp()
+            self._sftp_clients[client] = sftp
+        return sftp
+    
+    def upload_file(
+        self,
+        client: SSHClient,
+        data: bytes,
+        remote_path: str,
+        mode: int = 0o644
+    ) -> None:
+        """Write bytes to a file on the remote host over SFTP.
+        
+        Args:
+            client: Connected SSHClient instance
+            data: File contents
+            remote_path: Destination path on the remote host
+            mode: Permission bits to set on the file (default: 0o644)
+            
+        Raises:
+            SSHException: If the upload fails
+        """
+        try:
+            logger.debug("Uploading %d bytes to %s", len(data), remote_path)
+            sftp = self._get_sftp(client)
+            sftp.putfo(io.BytesIO(data), remote_path)
+            sftp.chmod(remote_path, mode)
+        except Exception as e:
+            logger.error(f"File upload failed: {e}")
+            raise SSHException(f"Failed to upload {remote_path}: {e}")
+    
+    def download_file(self, client: SSHClient, remote_path: str) -> bytes:
+        """Read a file from the remote host over SFTP.
+        
+        Args:
+            client: Connected SSHClient instance
+            remote_path: Path of the file on the remote host
+            
+        Returns:
+            File contents
+            
+        Raises:
+            SSHException: If the download fails
+        """
+        try:
+            logger.debug("Downloading %s", remote_path)
+            buffer = io.BytesIO()
+            self._get_sftp(client).getfo(remote_path, buffer)
+            return buffer.getvalue()
+        except Exception as e:
+            logger.error(f"File download failed: {e}")
+            raise SSHException(f"Failed to download {remote_path}: {e}")
+    
+    def _tune_transport(self, client: SSHClient) -> None:
+        """Set keepalives and TCP_NODELAY on a new connection's transport.
+        
+        Commands and their replies are mostly a few hundred bytes, so Nagle's
+        algorithm would otherwise hold them back waiting on delayed ACKs.
+        
+        Args:
+            client: Newly connected SSHClient instance
+        """
+        transport = client.get_transport()
+        transport.set_keepalive(_KEEPALIVE_INTERVAL)
+        
+        try:
+            transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (OSError, AttributeError) as e:
+            # Not a plain TCP socket (e.g. a ProxyCommand); leave it as is
+            logger.debug(f"Could not set socket options on SSH transport: {e}")
+    
+    def is_local(self, client: SSHClient) -> bool:
+        """Check whether a connection's remote end is this machine.
+        
+        Args:
+            client: Connected SSHClient instance
+            
+        Returns:
+            True if the peer address is a loopback or local address
+        """
+        transport = client.get_transport()
+        if transport is None:
+            return False
+        
+        try:
+            peer_address = transport.getpeername()[0]
+        except (OSError, IndexError):
+            return False
+        
+        if peer_address == '::1' or peer_address.startswith('127.'):
+            return True
+        return peer_address in _local_addresses()
+    
     def disconnect(self, client: SSHClient) -> None:
         """Close SSH connection and clear private key from memory.
         
@@ -258,6 +694,10 @@ class SSHManager:
         """
         try:
             if client:
+                self._session_pool.remove(client)
+                sftp = self._sftp_clients.pop(client, None)
+                if sftp is not None:
+                    sftp.close()
                 client.close()
                 logger.debug("SSH connection closed")
         finally:
@@ -1,7 +1,9 @@
 """Test Orchestrator for coordinating PTP testing workflow."""
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional, Dict
 
@@ -19,6 +21,22 @@ from ptp_tester.models import (
 logger = logging.getLogger(__name__)
 
 
+def _run_in_named_thread(thread_name: str, func, *args, **kwargs):
+    """Call func with the current thread renamed to thread_name.
+    
+    Concurrent instance tests log through the same loggers; naming the
+    worker after its instance lets %(threadName)s tell the streams apart.
+    The pool thread's own name is restored afterwards.
+    """
+    thread = threading.current_thread()
+    original_name = thread.name
+    thread.name = thread_name
+    try:
+        return func(*args, **kwargs)
+    finally:
+        thread.name = original_name
+
+
 class TestOrchestrator:
     """Orchestrates the complete PTP testing workflow.
     
@@ -55,13 +73,14 @@ class TestOrchestrator:
         ami_id: Optional[str] = None,
         security_group_ids: Optional[List[str]] = None,
         placement_group: Optional[str] = None,
-        ssh_username: str = "ec2-user"
+        ssh_username: str = "ec2-user",
+        instance_details: Optional[InstanceDetails] = None
     ) -> TestResult:
         """Test PTP support on a single instance type.
         
         This method:
-        1. Launches an EC2 instance
-        2. Waits for it to reach running state
+        1. Launches an EC2 instance (unless instance_details is given)
+        2. Waits for it to reach running state (unless it already has)
         3. Establishes SSH connection with retry logic
         4. Configures PTP on the instance
         5. Verifies PTP functionality
@@ -75,6 +94,8 @@ class TestOrchestrator:
             security_group_ids: Optional security group IDs
             placement_group: Optional placement group name
             ssh_username: SSH username (default: ec2-user)
+            instance_details: Instance already launched for this test, e.g.
+                by test_multiple_instances' batched launch (optional)
             
         Returns:
             TestResult with instance details, PTP status, and timing information
@@ -87,35 +108,36 @@ class TestOrchestrator:
         
         logger.info(f"Starting PTP test for instance type: {instance_type}")
         
-        instance_details = None
         ptp_status = None
         configuration_success = False
         connection = None
         
         try:
             # Step 1: Launch instance
-            logger.info(f"Launching {instance_type} instance...")
-            config = InstanceConfig(
-                instance_type=instance_type,
-                subnet_id=subnet_id,
-                key_name=key_name,
-                ami_id=ami_id,
-                security_group_ids=security_group_ids,
-                placement_group=placement_group
-            )
-            
-            instance_details = self.aws_manager.launch_instance(config)
-            logger.info(
-                f"Instance launched: {instance_details.instance_id} "
-                f"({instance_details.instance_type})"
-            )
+            if instance_details is None:
+                logger.info(f"Launching {instance_type} instance...")
+                config = InstanceConfig(
+                    instance_type=instance_type,
+                    subnet_id=subnet_id,
+                    key_name=key_name,
+                    ami_id=ami_id,
+                    security_group_ids=security_group_ids,
+                    placement_group=placement_group
+                )
+                
+                instance_details = self.aws_manager.launch_instance(config)
+                logger.info(
+                    f"Instance launched: {instance_details.instance_id} "
+                    f"({instance_details.instance_type})"
+                )
             
             # Step 2: Wait for instance to reach running state
-            logger.info(f"Waiting for instance {instance_details.instance_id} to be running...")
-            instance_details = self.aws_manager.wait_for_running(
-                instance_details.instance_id,
-                timeout=300
-            )
+            if instance_details.state != 'running':
+                logger.info(f"Waiting for instance {instance_details.instance_id} to be running...")
+                instance_details = self.aws_manager.wait_for_running(
+                    instance_details.instance_id,
+                    timeout=300
+                )
             logger.info(f"Instance {instance_details.instance_id} is now running")
             
             # Determine which IP to use for SSH
@@ -296,19 +318,16 @@ class TestOrchestrator:
             compile_success, needs_reconnect = self.ptp_configurator.compile_ena_driver_with_phc(
                 self.ssh_manager,
                 connection,
-                ssh_host
+                ssh_host,
+                username=ssh_username
             )
             
             # Handle reconnection if driver was reloaded
             if needs_reconnect:
                 logger.info("Reconnecting SSH after driver reload...")
-                try:
-                    # Close old connection
-                    self.ssh_manager.disconnect(connection)
-                except Exception as e:
-                    logger.debug(f"Error closing old connection (expected): {e}")
-                
-                # Reconnect with retries
+                # The reload wait already closed the pre-reload connection and,
+                # if SSH came back in time, pooled the new one, which connect()
+                # returns right away; otherwise it retries with backoff
                 connection = self.ssh_manager.connect(
                     host=ssh_host,
                     username=ssh_username,
@@ -411,17 +430,24 @@ class TestOrchestrator:
         security_group_ids: Optional[List[str]] = None,
         placement_group: Optional[str] = None,
         ssh_username: str = "ec2-user",
-        warn_threshold: int = 3
+        warn_threshold: int = 3,
+        max_parallel: int = 5
     ) -> List[TestResult]:
-        """Test PTP support on multiple instance types sequentially with quantity support.
+        """Test PTP support on multiple instance types concurrently with quantity support.
         
         This method:
         1. Handles both List[str] (backward compatible) and List[InstanceTypeSpec] (with quantities)
         2. Warns if more than warn_threshold instance types are provided
-        3. Tests each instance sequentially, launching multiple instances per type if quantity > 1
+        3. Tests up to max_parallel instances at a time, launching multiple instances per type if quantity > 1
         4. Continues testing even if individual tests fail (error resilience)
         5. Returns results for all tested instances
         
+        Instances are handled in waves of up to max_parallel. Each wave is
+        launched with one run_instances call per instance type and awaited
+        with one describe_instances call per poll cycle, then its tests run
+        on a thread pool; each test is dominated by waiting on EC2 and SSH
+        round trips, so a wave takes roughly as long as its slowest test.
+        
         Args:
             instance_types: List of EC2 instance types (str) or InstanceTypeSpec objects
             subnet_id: Subnet ID for instance launch
@@ -431,9 +457,11 @@ class TestOrchestrator:
             placement_group: Optional placement group name
             ssh_username: SSH username (default: ec2-user)
             warn_threshold: Warn if more than this many instance types (default: 3)
+            max_parallel: Maximum number of instances tested at once (default: 5)
             
         Returns:
-            List of TestResult objects, one per instance
+            List of TestResult objects, one per successfully tested instance,
+            in the order the instances were requested
         """
         from ptp_tester.models import InstanceTypeSpec
         
@@ -463,51 +491,52 @@ class TestOrchestrator:
                 f"Consider testing fewer instance types at once."
             )
         
-        results = []
-        
-        # Test each instance type with its quantity
-        spec_index = 0
-        for spec in specs:
-            spec_index += 1
-            instance_type = spec.instance_type
-            quantity = spec.quantity
-            
+        # Expand each instance type into one job per requested instance
+        jobs = []
+        for spec_index, spec in enumerate(specs, 1):
             logger.info(
-                f"Testing instance type {spec_index}/{len(specs)}: {instance_type} "
-                f"(quantity: {quantity})"
+                f"Testing instance type {spec_index}/{len(specs)}: {spec.instance_type} "
+                f"(quantity: {spec.quantity})"
             )
-            
-            # Launch and test each instance for this type
-            for instance_num in range(1, quantity + 1):
-                logger.info(
-                    f"Testing {instance_type} instance {instance_num} of {quantity}"
+            for instance_num in range(1, spec.quantity + 1):
+                jobs.append((spec.instance_type, instance_num, spec.quantity))
+        
+        results = []
+        if not jobs:
+            return results
+        
+        wave_size = max(1, max_parallel)
+        with ThreadPoolExecutor(max_workers=min(wave_size, len(jobs))) as executor:
+            for wave_start in range(0, len(jobs), wave_size):
+                wave = jobs[wave_start:wave_start + wave_size]
+                launched = self._launch_wave(
+                    wave, subnet_id, key_name, ami_id, security_group_ids, placement_group
                 )
                 
-                try:
-                    result = self.test_instance_type(
+                futures = []
+                for (instance_type, instance_num, quantity), details in zip(wave, launched):
+                    if details is None:
+                        futures.append(None)
+                        continue
+                    logger.info(
+                        f"Testing {instance_type} instance {instance_num} of {quantity}"
+                    )
+                    futures.append(executor.submit(
+                        _run_in_named_thread,
+                        f"{instance_type}#{instance_num}",
+                        self.test_instance_type,
                         instance_type=instance_type,
                         subnet_id=subnet_id,
                         key_name=key_name,
                         ami_id=ami_id,
                         security_group_ids=security_group_ids,
                         placement_group=placement_group,
-                        ssh_username=ssh_username
-                    )
-                    
-                    results.append(result)
-                    
-                    logger.info(
-                        f"Completed test for {instance_type} instance {instance_num}/{quantity} "
-                        f"(PTP supported: {result.ptp_status.supported})"
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Test failed for {instance_type} instance {instance_num}/{quantity}: {e}. "
-                        f"Continuing with remaining instances..."
-                    )
-                    # Continue with next instance (error resilience)
-                    continue
+                        ssh_username=ssh_username,
+                        instance_details=details
+                    ))
+                
+                # Collect in submission order so reports stay grouped by type
+                self._collect_wave(wave, futures, results)
         
         logger.info(
             f"Multi-instance testing complete. "
@@ -516,6 +545,106 @@ class TestOrchestrator:
         
         return results
     
+    def _collect_wave(self, wave: List[tuple], futures: List, results: List[TestResult]) -> None:
+        """Append the results of one wave's tests to results, in wave order.
+        
+        Args:
+            wave: (instance_type, instance_num, quantity) jobs of the wave
+            futures: Future per job, or None where the launch failed
+            results: List the successful TestResults are appended to
+        """
+        for (instance_type, instance_num, quantity), future in zip(wave, futures):
+            if future is None:
+                continue
+            try:
+                result = future.result()
+                results.append(result)
+                
+                logger.info(
+                    f"Completed test for {instance_type} instance {instance_num}/{quantity} "
+                    f"(PTP supported: {result.ptp_status.supported})"
+                )
+                
+            except Exception as e:
+                # Other tests keep running (error resilience)
+                logger.error(
+                    f"Test failed for {instance_type} instance {instance_num}/{quantity}: {e}. "
+                    f"Continuing with remaining instances..."
+                )
+    
+    def _launch_wave(
+        self,
+        wave: List[tuple],
+        subnet_id: str,
+        key_name: str,
+        ami_id: Optional[str],
+        security_group_ids: Optional[List[str]],
+        placement_group: Optional[str]
+    ) -> List[Optional[InstanceDetails]]:
+        """Launch the instances of one wave and wait for them together.
+        
+        Each instance type is launched with one run_instances call, and all
+        launched instances are awaited with one describe_instances call per
+        poll cycle. A type whose launch fails is logged and skipped; if the
+        shared wait fails, the pending details are returned so each test
+        waits for (and reports on) its own instance.
+        
+        Args:
+            wave: (instance_type, instance_num, quantity) jobs to launch
+            subnet_id: Subnet ID for instance launch
+            key_name: EC2 key pair name
+            ami_id: Optional AMI ID (uses latest AL2023 if not provided)
+            security_group_ids: Optional security group IDs
+            placement_group: Optional placement group name
+            
+        Returns:
+            InstanceDetails per job, in wave order (None where the launch failed)
+        """
+        positions: Dict[str, List[int]] = {}
+        for position, (instance_type, _, _) in enumerate(wave):
+            positions.setdefault(instance_type, []).append(position)
+        
+        launched: List[Optional[InstanceDetails]] = [None] * len(wave)
+        for instance_type, type_positions in positions.items():
+            config = InstanceConfig(
+                instance_type=instance_type,
+                subnet_id=subnet_id,
+                key_name=key_name,
+                ami_id=ami_id,
+                security_group_ids=security_group_ids,
+                placement_group=placement_group
+            )
+            logger.info(f"Launching {len(type_positions)} {instance_type} instance(s)...")
+            try:
+                details = self.aws_manager.launch_instances([config] * len(type_positions))
+            except Exception as e:
+                logger.error(
+                    f"Launch failed for {len(type_positions)} {instance_type} instance(s): {e}. "
+                    f"Continuing with remaining instances..."
+                )
+                continue
+            for position, instance_details in zip(type_positions, details):
+                launched[position] = instance_details
+        
+        instance_ids = [details.instance_id for details in launched if details is not None]
+        if not instance_ids:
+            return launched
+        
+        try:
+            running = self.aws_manager.wait_for_all_running(instance_ids, timeout=300)
+        except Exception as e:
+            logger.warning(
+                f"Waiting for {len(instance_ids)} instance(s) together failed: {e}. "
+                f"Each test will wait for its own instance"
+            )
+            return launched
+        
+        running_by_id = {details.instance_id: details for details in running}
+        return [
+            running_by_id[details.instance_id] if details is not None else None
+            for details in launched
+        ]
+    
     def handle_cleanup(
         self,
         results: List[TestResult],
@@ -559,30 +688,28 @@ class TestOrchestrator:
             )
             
             for result in unsupported_results:
-                instance_id = result.instance_details.instance_id
-                instance_type = result.instance_details.instance_type
-                
-                try:
-                    logger.info(
-                        f"Terminating {instance_type} instance {instance_id} "
-                        "(PTP not supported)"
-                    )
-                    
-                    success = self.aws_manager.terminate_instance(
-                        instance_id,
-                        verify=True
-                    )
-                    
-                    if success:
-                        terminated.append(instance_id)
-                        logger.info(f"Successfully terminated {instance_id}")
-                    else:
-                        failed.append(instance_id)
-                        logger.error(f"Failed to terminate {instance_id}")
-                        
-                except Exception as e:
-                    logger.error(f"Error terminating {instance_id}: {e}")
+                logger.info(
+                    f"Terminating {result.instance_details.instance_type} instance "
+                    f"{result.instance_details.instance_id} (PTP not supported)"
+                )
+            
+            instance_ids = [r.instance_details.instance_id for r in unsupported_results]
+            
+            try:
+                # One batched termination and a shared verify instead of
+                # terminating and polling each instance in turn
+                outcome = self.aws_manager.terminate_instances(instance_ids, verify=True)
+            except Exception as e:
+                logger.error(f"Error terminating {', '.join(instance_ids)}: {e}")
+                outcome = {}
+            
+            for instance_id in instance_ids:
+                if outcome.get(instance_id):
+                    terminated.append(instance_id)
+                    logger.info(f"Successfully terminated {instance_id}")
+                else:
                     failed.append(instance_id)
+                    logger.error(f"Failed to terminate {instance_id}")
         
         # Step 2: Handle PTP-functional instances
         if supported_results:
@@ -0,0 +1,47 @@
+"""Tests for the configuration file loader."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from ptp_tester.config_loader import ConfigLoader
+
+
+class ConfigLoaderTest(unittest.TestCase):
+    """ConfigLoader.load_config parsing and caching."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.path = os.path.join(self._dir.name, 'config.json')
+
+    def _write(self, config_dict):
+        with open(self.path, 'w') as f:
+            json.dump(config_dict, f)
+
+    def test_reuses_parse_of_unchanged_file(self):
+        self._write({'region': 'us-east-1'})
+        first = ConfigLoader().load_config(self.path)
+        second = ConfigLoader().load_config(self.path)
+        self.assertIs(first, second)
+        self.assertEqual(first.region, 'us-east-1')
+
+    def test_reparses_changed_file(self):
+        self._write({'region': 'us-east-1'})
+        ConfigLoader().load_config(self.path)
+        self._write({'region': 'eu-west-2', 'key_name': 'my-key-pair'})
+        self.assertEqual(ConfigLoader().load_config(self.path).region, 'eu-west-2')
+
+    def test_invalid_value_raises_value_error(self):
+        self._write({'private_key_path': 42})
+        with self.assertRaises(ValueError):
+            ConfigLoader().load_config(self.path)
+
+    def test_missing_file_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            ConfigLoader().load_config(os.path.join(self._dir.name, 'missing.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the data models."""
+
+import dataclasses
+import unittest
+
+from ptp_tester.models import (
+    _INTERNED_DETAIL_FIELDS,
+    InstanceDetails,
+    InstanceTypeSpec,
+    TestConfig,
+)
+
+
+def _make_details(**overrides) -> InstanceDetails:
+    """Build an InstanceDetails with placeholder values."""
+    fields = dict(
+        instance_id='i-0123456789abcdef0',
+        instance_type='c7i.large',
+        availability_zone='us-east-1a',
+        subnet_id='subnet-12345678',
+        public_ip='203.0.113.10',
+        private_ip='10.0.0.10',
+        state='running',
+        architecture='x86_64',
+    )
+    fields.update(overrides)
+    return InstanceDetails(**fields)
+
+
+class InstanceDetailsTest(unittest.TestCase):
+    """InstanceDetails construction and interning."""
+
+    def test_construct(self):
+        details = _make_details(placement_group='my-cluster-pg')
+        self.assertEqual(details.instance_type, 'c7i.large')
+        self.assertEqual(details.placement_group, 'my-cluster-pg')
+        self.assertIsNone(_make_details().placement_group)
+
+    def test_interned_fields_exist(self):
+        field_names = {field.name for field in dataclasses.fields(InstanceDetails)}
+        self.assertLessEqual(set(_INTERNED_DETAIL_FIELDS), field_names)
+
+    def test_interns_repeated_strings(self):
+        first = _make_details(instance_type=''.join(['c7i.', 'large']))
+        second = _make_details(instance_type=''.join(['c7i', '.large']))
+        self.assertIs(first.instance_type, second.instance_type)
+
+
+class TestConfigFromDictTest(unittest.TestCase):
+    """TestConfig.from_dict parsing and validation."""
+
+    def test_parses_all_fields(self):
+        config = TestConfig.from_dict({
+            'instance_types': ['c7i.large', 'm7i.xlarge:2', {'type': 'r7i.2xlarge', 'quantity': 3}],
+            'subnet_id': 'subnet-12345678',
+            'key_name': 'my-key-pair',
+            'private_key_path': '/keys/my-key.pem',
+            'region': 'us-east-1',
+            'state_queue_url': 'https://sqs.us-east-1.amazonaws.com/123456789012/events',
+        })
+        self.assertEqual(config.instance_types, [
+            InstanceTypeSpec('c7i.large'),
+            InstanceTypeSpec('m7i.xlarge', 2),
+            InstanceTypeSpec('r7i.2xlarge', 3),
+        ])
+        self.assertEqual(config.region, 'us-east-1')
+        self.assertEqual(
+            config.state_queue_url,
+            'https://sqs.us-east-1.amazonaws.com/123456789012/events'
+        )
+        self.assertEqual(config.validate(), [])
+
+    def test_rejects_non_string_values(self):
+        for config_dict in (
+            {'private_key_path': 42},
+            {'region': 5},
+            {'instance_types': [{'type': 42}]},
+        ):
+            with self.subTest(config_dict=config_dict):
+                with self.assertRaises(ValueError):
+                    TestConfig.from_dict(config_dict)
+
+    def test_rejects_bad_instance_types(self):
+        for instance_types in ('c7i.large', ['c7i.large:0'], ['c7i.large:x'], [42]):
+            with self.subTest(instance_types=instance_types):
+                with self.assertRaises(ValueError):
+                    TestConfig.from_dict({'instance_types': instance_types})
+
+    def test_reports_missing_required_fields(self):
+        self.assertEqual(
+            TestConfig.from_dict({}).validate(),
+            [
+                "instance_types is required",
+                "subnet_id is required",
+                "key_name is required",
+                "private_key_path is required",
+            ]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()